@@ -2,77 +2,290 @@
 
 from __future__ import annotations
 import argparse
+import hashlib
 import os
-from dataclasses import dataclass
-from typing import Optional
-
-from dotenv import load_dotenv
+import sys
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Sequence, Tuple, Union
 
 # Importing this module runs the decorators and fills COMMANDS.
 from cli.commands import COMMANDS
-from core.ports import ICanvasClient, IPresenter
-from infra.canvas_http import CanvasHTTPClient
-from cli.presenter_console import ConsolePresenter
+from core.errors import PartialResultError
+from core.ports import ICanvasClient, ICourseIndex, ICourseMirror, IPresenter
+from utils import tracing
+
+if TYPE_CHECKING:
+    from infra.canvas_http import CanvasHTTPClient
+
+# requests, dotenv and the infra adapters are imported where they are first
+# needed: `--help` and offline commands shouldn't pay for them.
+
+
+def _account_key(base_url: str, token: str) -> str:
+    # One cache/mirror/limiter per account so tokens never see each other's data
+    return hashlib.sha256(f"{base_url}|{token}".encode()).hexdigest()[:16]
+
+
+def _build_client(base_url: str,
+                  token: str,
+                  no_cache: bool,
+                  refresh: bool,
+                  **client_kwargs) -> CanvasHTTPClient:
+    """A CanvasHTTPClient with this account's on-disk response cache."""
+    from infra.canvas_http import CanvasHTTPClient
+    from infra.http_cache import DiskResponseCache
+
+    cache = None
+    if not no_cache:
+        default_root = os.path.join(
+            os.getenv("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+            "canvaspulse",
+        )
+        cache_root = os.getenv(key="CANVAS_CACHE_DIR", default=default_root)
+        max_mb = int(os.getenv(key="CANVAS_CACHE_MAX_MB", default="50"))
+        cache = DiskResponseCache(os.path.join(cache_root, _account_key(base_url, token)),
+                                  max_bytes=max_mb * 1024 * 1024,
+                                  refresh=refresh)
+
+    # Pages fetched concurrently once the 'last' page is known
+    client_kwargs.setdefault("page_workers",
+                             int(os.getenv(key="CANVAS_PAGE_WORKERS", default="4")))
+    return CanvasHTTPClient(base_url, token, cache=cache, **client_kwargs)
 
 
-@dataclass
 class Deps:
-    canvas_client: Optional[ICanvasClient] = None
-    presenter: Optional[IPresenter] = None
+    """
+    What a command may use. Anything not passed in is built from env vars on
+    first access, so a command only pays for the dependencies it touches.
+    """
+
+    canvas_client: Optional[ICanvasClient]
+    presenter: Optional[IPresenter]
+    mirror: Optional[ICourseMirror]
+    course_index: Optional[ICourseIndex]
+    # (accounts file, requests in flight per host) -> (name, client) pairs,
+    # for fan-out; an entry that can't be used carries its error instead
+    accounts: Optional[Callable[[str, int], List[Tuple[str, Union[ICanvasClient, Exception]]]]]
+
+    def __init__(self,
+                 no_cache: bool = False,
+                 refresh: bool = False,
+                 output_format: str = "table",
+                 **given: Any):
+        """
+        :param no_cache: Skip the on-disk response cache entirely.
+        :param refresh:  Ignore cached responses but store the new ones.
+        :param output_format: Presenter to use, one of FORMATS.
+        :param given:    Ready-made dependencies (e.g. canvas_client=...);
+                         these win over the built ones.
+        """
+        self.no_cache = no_cache
+        self.refresh = refresh
+        self.output_format = output_format
+        # Instance attributes shadow the cached properties below
+        self.__dict__.update(given)
 
     @staticmethod
-    def build() -> Deps:
-        """Build a default set of dependencies from env vars."""
+    def build(no_cache: bool = False,
+              refresh: bool = False,
+              output_format: str = "table") -> Deps:
+        """
+        Default dependencies from env vars, built on first use.
+        Without CANVAS_TOKEN only the multi-account commands can run.
+        """
+        return Deps(no_cache=no_cache, refresh=refresh, output_format=output_format)
+
+    @cached_property
+    def _credentials(self) -> Tuple[str, Optional[str]]:
+        from dotenv import load_dotenv
         load_dotenv()
         base_url = os.getenv(key="CANVAS_BASE_URL",
                              default="https://reykjavik.instructure.com/")
         token = os.getenv(key="CANVAS_TOKEN",
                           default=None)
+        return base_url, token or None
+
+    @cached_property
+    def presenter(self) -> Optional[IPresenter]:
+        from cli.presenter_export import FORMATS
+        return FORMATS[self.output_format]()
+
+    @cached_property
+    def canvas_client(self) -> Optional[ICanvasClient]:
+        from infra.single_flight import SingleFlightClient
+
+        base_url, token = self._credentials
+        if token is None:
+            return None
+        # Commands run many fetches concurrently; identical ones share a request
+        return SingleFlightClient(_build_client(base_url, token, self.no_cache, self.refresh))
 
-        if not token:
-            raise ValueError("Token missing in .env file")
+    def _data_path(self, suffix: str) -> Optional[str]:
+        """This account's file under CANVAS_DATA_DIR, or None without a token."""
+        base_url, token = self._credentials
+        if token is None:
+            return None
+        data_root = os.getenv(
+            key="CANVAS_DATA_DIR",
+            default=os.path.join(
+                os.getenv("XDG_DATA_HOME", os.path.expanduser("~/.local/share")),
+                "canvaspulse",
+            ),
+        )
+        return os.path.join(data_root, f"{_account_key(base_url, token)}{suffix}")
 
-        canvas_client = CanvasHTTPClient(base_url, token)
-        presenter = ConsolePresenter()
+    @cached_property
+    def mirror(self) -> Optional[ICourseMirror]:
+        from infra.sqlite_mirror import SQLiteMirror
 
-        return Deps(canvas_client=canvas_client, presenter=presenter)
+        path = self._data_path(".sqlite3")
+        # The database itself is opened lazily on first query
+        return SQLiteMirror(path) if path else None
 
+    @cached_property
+    def course_index(self) -> Optional[ICourseIndex]:
+        from infra.course_index import JSONCourseIndex
 
-def build_parser() -> argparse.ArgumentParser:
+        path = self._data_path(".courses.json")
+        # The index is a cache too: --no-cache skips it, --refresh rebuilds it
+        if path is None or self.no_cache:
+            return None
+        max_hours = float(os.getenv(key="CANVAS_INDEX_MAX_AGE_HOURS", default="6"))
+        index = JSONCourseIndex(path, max_age=max_hours * 3600)
+        if self.refresh:
+            index.invalidate()
+        return index
+
+    @cached_property
+    def accounts(self) -> Optional[Callable[[str, int], List[Tuple[str, Union[ICanvasClient, Exception]]]]]:
+        def open_accounts(path: str,
+                          pool_size: int = 32) -> List[Tuple[str, Union[ICanvasClient, Exception]]]:
+            from dotenv import load_dotenv
+            from infra.accounts import load_accounts
+            from infra.canvas_http import pooled_session
+            from infra.rate_limit import shared_limiter
+
+            # token_env entries usually name variables kept in .env
+            load_dotenv()
+
+            # Accounts on one host share a connection pool but not sessions
+            # (cookies); each token keeps its own rate-limit budget. Pages
+            # stay sequential per account so hundreds of accounts don't turn
+            # into thousands of threads.
+            return [
+                (a.name, ValueError(a.error) if a.error is not None else
+                 _build_client(a.base_url, a.token, self.no_cache, self.refresh,
+                               page_workers=1,
+                               session=pooled_session(a.base_url, pool_size),
+                               limiter=shared_limiter(_account_key(a.base_url, a.token))))
+                for a in load_accounts(path)
+            ]
+        return open_accounts
+
+
+def _add_global_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--profile",
+                        action="store_true",
+                        help="Print a timing summary to stderr")
+    parser.add_argument("--trace",
+                        metavar="TRACE.json",
+                        help="Also write a Chrome trace to this path (implies --profile)")
+
+
+class _ProbeParser(argparse.ArgumentParser):
+    """Raises instead of printing usage; the real parser reports errors."""
+
+    def error(self, message: str):
+        raise ValueError(message)
+
+
+def _selected_command(argv: Sequence[str]) -> str:
+    """
+    The subcommand `argv` picks, or "" if none. Found by parsing only the
+    global flags, so an option value that happens to match a command name
+    (e.g. `--trace sync`) isn't mistaken for the command.
+    """
+    probe = _ProbeParser(add_help=False)
+    _add_global_arguments(probe)
+    subparsers = probe.add_subparsers(dest="command")
+    for name in COMMANDS:
+        subparsers.add_parser(name, add_help=False)
+    try:
+        args, _ = probe.parse_known_args(argv)
+    except ValueError:
+        return ""
+    return args.command or ""
+
+
+def build_parser(argv: Optional[Sequence[str]] = None) -> argparse.ArgumentParser:
     """
     Builds an ArgumentParser with subcommands for each registered command.
     Each command adds its own flags via add_arguments().
+
+    Given the argv about to be parsed, only the selected command's flags are
+    set up, so `--help` and friends don't import what other commands need.
     """
     parser = argparse.ArgumentParser(
         prog="canvaspulse",
         description="List upcoming and recently overdue Canvas assignments.",
     )
+    _add_global_arguments(parser)
     subparsers = parser.add_subparsers(dest="command", required=True)
 
+    selected = _selected_command(argv) if argv is not None else None
+
     # Create one subparser per registered command
     for name, cls in COMMANDS.items():
         sp = subparsers.add_parser(name, help=(cls.__doc__ or None))
-        cls.add_arguments(sp)
+        if selected is None or selected == name:
+            cls.add_arguments(sp)
 
     return parser
 
 
 def main() -> int:
-    parser = build_parser()
-    args = parser.parse_args()
+    argv = sys.argv[1:]
+    args = build_parser(argv).parse_args(argv)
+    tracer = tracing.enable() if args.profile or args.trace else None
 
-    deps = Deps.build()
+    deps = Deps.build(no_cache=getattr(args, "no_cache", False),
+                      refresh=getattr(args, "refresh", False),
+                      output_format=getattr(args, "format", "table"))
 
     # Resolve and run the chosen command
     cmd_cls = COMMANDS[args.command]
     cmd = cmd_cls()
 
     try:
-        cmd.run(args, deps)
+        with tracing.span(f"command.{args.command}"):
+            cmd.run(args, deps)
     except NotImplementedError as e:
-        # Friendly message while commands are still stubs
+        # Commands raise NotImplementedError for missing configuration
+        # (no token, no mirror, unsupported flag combinations)
         print(f"Err: {e}")
         return 2
+    except PartialResultError as e:
+        # Canvas kept failing (unreachable host, revoked token...) after retries
+        print(f"Err: {e} (resume at {e.resume_url})", file=sys.stderr)
+        return 1
+    except BrokenPipeError:
+        # The reader went away early (e.g. `| head`): stop quietly. Point
+        # stdout at devnull so the flush at interpreter exit can't fail again.
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        try:
+            os.dup2(devnull, sys.stdout.fileno())
+            os.close(devnull)
+        except (AttributeError, OSError, ValueError):
+            # Not backed by a file descriptor (e.g. a replaced sys.stdout)
+            sys.stdout = os.fdopen(devnull, "w")
+        return 0
+    finally:
+        if tracer is not None:
+            # stderr, so exported output on stdout stays clean
+            tracer.print_summary(sys.stderr)
+            if args.trace:
+                tracer.write_chrome_trace(args.trace)
+                print(f"Trace written to {args.trace}", file=sys.stderr)
 
     return 0
 
@@ -0,0 +1,69 @@
+"""
+Compare the eager Assignment model with LazyAssignment on a large course
+load: construction time, time to render the table view, and memory kept
+alive by the resulting objects.
+
+    python -m benchmarks.bench_assignment_model [--count 50000]
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Callable, List, Tuple
+
+from benchmarks.fixtures import make_assignment_dicts
+from core.models import Assignment, LazyAssignment
+from utils import iso_parser
+
+
+def _timings(factory: Callable, payload) -> Tuple[float, float]:
+    """Returns (build seconds, table-view seconds)."""
+    iso_parser._parse_iso_cached.cache_clear()
+    t0 = time.perf_counter()
+    models = [factory(d, "Course") for d in payload]
+    build = time.perf_counter() - t0
+
+    # What ShowAssignments touches per row
+    t0 = time.perf_counter()
+    for a in models:
+        a.get_present_vars()
+        a.is_submitted()
+    return build, time.perf_counter() - t0
+
+
+def _retained_bytes(factory: Callable, count: int) -> int:
+    """Memory still held by the models once the raw payload is dropped."""
+    iso_parser._parse_iso_cached.cache_clear()
+    gc.collect()
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+    models: List = [factory(d, "Course") for d in make_assignment_dicts(count)]
+    for a in models:
+        a.get_present_vars()
+        a.is_submitted()
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    return retained
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=50_000)
+    args = parser.parse_args()
+
+    payload = make_assignment_dicts(args.count)
+
+    print(f"{args.count} assignments")
+    print(f"  {'model':<16}{'build ms':>10}{'view ms':>10}{'total ms':>10}{'retained MiB':>14}")
+    for name, factory in (("Assignment", Assignment.from_api_dict),
+                          ("LazyAssignment", LazyAssignment.from_api_dict)):
+        build, view = _timings(factory, payload)
+        retained = _retained_bytes(factory, args.count)
+        print(f"  {name:<16}{build * 1000:>10.0f}{view * 1000:>10.0f}"
+              f"{(build + view) * 1000:>10.0f}{retained / 2 ** 20:>14.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
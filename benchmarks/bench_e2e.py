@@ -0,0 +1,98 @@
+"""
+End-to-end benchmark: run `app.py list-courses` and `app.py show-assignments`
+as real subprocesses against the local stand-in Canvas, for a few size
+profiles, and report wall time, Canvas requests, bytes served and the
+child's peak RSS.
+
+    python -m benchmarks.bench_e2e [--profile small] [--latency 0.03] [--repeat 3]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Tuple
+
+from benchmarks.fake_canvas import FakeCanvas
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# name -> (courses, assignments per course)
+PROFILES: Dict[str, Tuple[int, int]] = {
+    "small": (5, 30),
+    "medium": (12, 200),
+    "large": (30, 600),
+}
+
+COMMANDS: Dict[str, List[str]] = {
+    "list-courses": ["list-courses"],
+    "show-assignments": ["show-assignments"],
+    "  --pipelined": ["show-assignments", "--strategy", "pipelined"],
+}
+
+
+def _run(argv: List[str], env: Dict[str, str]) -> Tuple[float, int]:
+    """(wall seconds, peak RSS in KiB) of one app.py run."""
+    t0 = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, os.path.join(ROOT, "app.py")] + argv,
+                            cwd=ROOT, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    # wait4 gives this child's own rusage, not the running max over all children
+    _, status, usage = os.wait4(proc.pid, 0)
+    wall = time.perf_counter() - t0
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    err = proc.stderr.read().decode(errors="replace") if proc.stderr else ""
+    if proc.returncode != 0:
+        raise SystemExit(f"{' '.join(argv)} failed ({proc.returncode}):\n{err}")
+    rss_kib = usage.ru_maxrss if sys.platform != "darwin" else usage.ru_maxrss // 1024
+    return wall, rss_kib
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--profile", choices=sorted(PROFILES), action="append",
+                        help="Size profile(s) to run; repeatable (default: all)")
+    parser.add_argument("--latency", type=float, default=0.03, help="Seconds per Canvas response")
+    parser.add_argument("--jitter", type=float, default=0.01)
+    parser.add_argument("--rate-limit", action="store_true", help="Enforce the fake leaky bucket")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per command; the median is reported")
+    parser.add_argument("--cache", action="store_true",
+                        help="Keep the on-disk response cache between runs (default: --no-cache)")
+    args = parser.parse_args()
+
+    profiles = args.profile or list(PROFILES)
+    print(f"latency {args.latency * 1000:.0f}±{args.jitter * 1000:.0f} ms, "
+          f"median of {args.repeat}, {'cache on' if args.cache else 'no cache'}")
+    print(f"  {'profile':<8}{'command':<18}{'wall s':>8}{'requests':>10}"
+          f"{'KiB':>10}{'throttled':>10}{'peak RSS MiB':>14}")
+
+    for name in profiles:
+        courses, per_course = PROFILES[name]
+        canvas = FakeCanvas(courses, per_course, latency=args.latency,
+                            jitter=args.jitter, rate_limit=args.rate_limit).start()
+        with tempfile.TemporaryDirectory() as tmp:
+            env = dict(os.environ,
+                       CANVAS_BASE_URL=canvas.base_url,
+                       CANVAS_TOKEN="bench-token",
+                       CANVAS_CACHE_DIR=os.path.join(tmp, "cache"),
+                       CANVAS_DATA_DIR=os.path.join(tmp, "data"))
+            for label, argv in COMMANDS.items():
+                argv = argv + ([] if args.cache else ["--no-cache"])
+                walls, rss = [], []
+                canvas.reset()
+                for _ in range(args.repeat):
+                    wall, peak = _run(argv, env)
+                    walls.append(wall)
+                    rss.append(peak)
+                runs = args.repeat
+                print(f"  {name:<8}{label:<18}{statistics.median(walls):>8.2f}"
+                      f"{canvas.requests // runs:>10}{canvas.bytes_sent / runs / 1024:>10.1f}"
+                      f"{canvas.throttled // runs:>10}{max(rss) / 1024:>14.1f}")
+        canvas.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,94 @@
+"""
+Compare the memoized ISO parser against the uncached one while building
+Assignment models from a 50k-assignment fixture.
+
+    python -m benchmarks.bench_iso_parser [--count 50000]
+"""
+import argparse
+import time
+from datetime import datetime
+from typing import Callable, Optional
+
+import core.models
+from benchmarks.fixtures import make_assignment_dicts
+from core.models import Assignment
+from utils import iso_parser
+
+
+def _legacy_parse_iso(dt: Optional[str]) -> Optional[datetime]:
+    """The parser as it was before memoization, for comparison."""
+    if not dt:
+        return None
+    dt = dt.replace("Z", "+00:00")
+    try:
+        return datetime.fromisoformat(dt)
+    except ValueError:
+        return None
+
+
+def _timestamps(payload):
+    """Every timestamp from_api_dict parses, in the order it parses them."""
+    out = []
+    for d in payload:
+        out.extend(x.get("due_at") for x in d.get("all_dates") or [])
+        sub = d.get("submission") or {}
+        out.extend((sub.get("submitted_at"), sub.get("graded_at"), d.get("due_at"),
+                    d.get("created_at"), d.get("updated_at"), d.get("unlock_at"),
+                    d.get("lock_at")))
+    return out
+
+
+def _time_parse(parser: Callable, stamps, rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        iso_parser._parse_iso_cached.cache_clear()
+        t0 = time.perf_counter()
+        for s in stamps:
+            parser(s)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _time_models(parser: Callable, payload, rounds: int) -> float:
+    core.models._parse_iso = parser
+    best = float("inf")
+    for _ in range(rounds):
+        iso_parser._parse_iso_cached.cache_clear()
+        t0 = time.perf_counter()
+        for d in payload:
+            Assignment.from_api_dict(d, "Course")
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=50_000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    payload = make_assignment_dicts(args.count)
+    stamps = _timestamps(payload)
+    parse_legacy = _time_parse(_legacy_parse_iso, stamps, args.rounds)
+    parse_memo = _time_parse(iso_parser._parse_iso, stamps, args.rounds)
+
+    try:
+        legacy = _time_models(_legacy_parse_iso, payload, args.rounds)
+        memo = _time_models(iso_parser._parse_iso, payload, args.rounds)
+    finally:
+        core.models._parse_iso = iso_parser._parse_iso
+
+    info = iso_parser._parse_iso_cached.cache_info()
+    print(f"{args.count} assignments ({len(stamps)} timestamps), best of {args.rounds}")
+    print("  parsing only")
+    print(f"    legacy parser:   {parse_legacy * 1000:8.1f} ms")
+    print(f"    memoized parser: {parse_memo * 1000:8.1f} ms  ({parse_legacy / parse_memo:.2f}x)")
+    print("  Assignment.from_api_dict")
+    print(f"    legacy parser:   {legacy * 1000:8.1f} ms")
+    print(f"    memoized parser: {memo * 1000:8.1f} ms  ({legacy / memo:.2f}x)")
+    print(f"  cache hits/misses: {info.hits}/{info.misses}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
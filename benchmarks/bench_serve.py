@@ -0,0 +1,80 @@
+"""
+Load-test the `serve` JSON API against a local stand-in Canvas: many
+concurrent clients polling /assignments, versus the Canvas requests it
+takes to keep the answers warm.
+
+    python -m benchmarks.bench_serve [--clients 32] [--requests 50]
+"""
+import argparse
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import requests
+
+from benchmarks.fake_canvas import FakeCanvas
+from cli.server import SnapshotStore, make_server
+from core.models import LazyAssignment
+from core.services import CourseService
+from core.watch import AssignmentWatcher
+from infra.canvas_http import CanvasHTTPClient
+
+
+def _poll(url: str, count: int) -> List[float]:
+    """Latencies (seconds) of `count` keep-alive requests from one client."""
+    session = requests.Session()
+    latencies = []
+    for _ in range(count):
+        t0 = time.perf_counter()
+        resp = session.get(url)
+        resp.raise_for_status()
+        latencies.append(time.perf_counter() - t0)
+    return latencies
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=50, help="Requests per client")
+    parser.add_argument("--courses", type=int, default=8)
+    parser.add_argument("--per-course", type=int, default=150)
+    args = parser.parse_args()
+
+    canvas = FakeCanvas(args.courses, args.per_course).start()
+    client = CanvasHTTPClient(canvas.base_url, "bench-token")
+    service = CourseService(client, assignment_model=LazyAssignment)
+    store = SnapshotStore(AssignmentWatcher(service, window_days=7))
+
+    t0 = time.perf_counter()
+    store.refresh()
+    warm = time.perf_counter() - t0
+    warm_requests = canvas.requests
+
+    server = make_server(store, "127.0.0.1", 0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/assignments"
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.clients) as pool:
+        runs = list(pool.map(lambda _: _poll(url, args.requests), range(args.clients)))
+    elapsed = time.perf_counter() - t0
+
+    latencies = sorted(x for run in runs for x in run)
+    total = len(latencies)
+    print(f"warm-up: {warm * 1000:.0f} ms, {warm_requests} Canvas requests")
+    print(f"{total} API requests from {args.clients} clients in {elapsed:.2f}s "
+          f"({total / elapsed:.0f} req/s)")
+    print(f"  p50 {statistics.median(latencies) * 1000:.2f} ms   "
+          f"p99 {latencies[int(total * 0.99) - 1] * 1000:.2f} ms")
+    print(f"  Canvas requests during load: {canvas.requests - warm_requests}")
+
+    server.shutdown()
+    server.server_close()
+    canvas.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
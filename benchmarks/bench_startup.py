@@ -0,0 +1,75 @@
+"""
+Startup benchmark: wall time of `app.py --help` and of a command that
+exits before touching the network, against a bare `python -c pass`.
+Exits non-zero when the median overhead exceeds the budget, so it can
+gate CI.
+
+    python -m benchmarks.bench_startup [--repeat 15] [--budget-ms 150]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CASES: Dict[str, List[str]] = {
+    "python -c pass": ["-c", "pass"],
+    "app.py --help": [os.path.join(ROOT, "app.py"), "--help"],
+    "list-terms --help": [os.path.join(ROOT, "app.py"), "list-terms", "--help"],
+}
+
+# Modules `--help` must not import
+HEAVY = ("requests", "http.server", "dotenv", "numpy", "sqlite3", "cli.server", "core.services")
+
+
+def _median_ms(argv: List[str], repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        subprocess.run([sys.executable] + argv, cwd=ROOT, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times) * 1000
+
+
+def loaded_after_help() -> List[str]:
+    """Which of HEAVY get imported while building the parser for --help."""
+    probe = ("import sys, app; app.build_parser(['--help']); "
+             f"print(' '.join(m for m in {HEAVY!r} if m in sys.modules))")
+    out = subprocess.run([sys.executable, "-c", probe], cwd=ROOT, check=True,
+                         capture_output=True, text=True).stdout
+    return out.split()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=15, help="Runs per case; the median is reported")
+    parser.add_argument("--budget-ms", type=float, default=150.0,
+                        help="Max median ms over `python -c pass` for app.py --help")
+    args = parser.parse_args()
+
+    results = {label: _median_ms(argv, args.repeat) for label, argv in CASES.items()}
+    baseline = results["python -c pass"]
+    print(f"median of {args.repeat}")
+    print(f"  {'case':<22}{'ms':>8}{'over python':>13}")
+    for label, ms in results.items():
+        print(f"  {label:<22}{ms:>8.1f}{ms - baseline:>13.1f}")
+
+    status = 0
+    heavy = loaded_after_help()
+    if heavy:
+        print(f"--help imports {', '.join(heavy)}")
+        status = 1
+    overhead = results["app.py --help"] - baseline
+    if overhead > args.budget_ms:
+        print(f"app.py --help is {overhead:.1f} ms over python, budget {args.budget_ms:g} ms")
+        status = 1
+    return status
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,254 @@
+"""
+A local stand-in for the Canvas REST API, serving synthetic courses and
+assignments with Canvas-style Link pagination, optional latency/jitter and
+a leaky-bucket rate limit reported through X-Rate-Limit-Remaining.
+Benchmarks point a real CanvasHTTPClient at it instead of a live instance.
+
+    python -m benchmarks.fake_canvas [--port 8900] [--latency 0.05]
+"""
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Tuple
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+from benchmarks.fixtures import _iso, make_assignment_dicts
+
+_ASSIGNMENTS = re.compile(r"^/api/v1/courses/(\d+)/assignments$")
+_SUBMISSIONS = re.compile(r"^/api/v1/courses/(\d+)/students/submissions$")
+
+
+def _submitted(a: Dict[str, Any]) -> bool:
+    sub = a.get("submission") or {}
+    return bool(sub.get("submitted_at")) or sub.get("workflow_state") in ("submitted", "graded")
+
+
+def _expects_submission(a: Dict[str, Any]) -> bool:
+    return any(t not in ("none", "not_graded", "on_paper", "wiki_page")
+               for t in a.get("submission_types") or () if t)
+
+
+def _bucketed(items: List[Dict[str, Any]], query: Dict[str, List[str]]) -> List[Dict[str, Any]]:
+    """
+    Canvas's bucket rules: "overdue" is past due, expecting an online
+    submission and with none made; "future" is everything not yet due,
+    undated items included.
+    """
+    bucket = query.get("bucket", [None])[0]
+    if bucket is not None:
+        now = _iso(datetime.now(timezone.utc))
+        if bucket == "overdue":
+            items = [a for a in items if a["due_at"] and a["due_at"] < now
+                     and _expects_submission(a) and not _submitted(a)]
+        elif bucket == "future":
+            # Due this very second still counts as upcoming, as in AssignmentTable.classify
+            items = [a for a in items if not a["due_at"] or a["due_at"] >= now]
+        else:
+            raise KeyError(bucket)
+    if query.get("order_by", [None])[0] == "due_at":
+        items = sorted(items, key=lambda a: (a["due_at"] is None, a["due_at"] or "", a["id"]))
+    return items
+
+
+class FakeCanvas:
+    """
+    `courses` current-term courses with `per_course` assignments each, due
+    dates spread around now.
+
+    Assignment listings honour `bucket=overdue|future` (see _bucketed) and
+    `order_by=due_at`.
+
+    Each response waits `latency` ± `jitter` seconds. Pages hold the
+    requested per_page (10 by default, as in Canvas) capped at `page_size`.
+    With `rate_limit`, every request adds `request_cost` to a bucket of
+    `bucket_size` units draining at `leak_rate` units/s; a full bucket
+    answers 403 "Rate Limit Exceeded", like Canvas does.
+
+    `requests` and `bytes_sent` count everything served; reset() zeroes them.
+    """
+
+    def __init__(self,
+                 courses: int = 8,
+                 per_course: int = 150,
+                 host: str = "127.0.0.1",
+                 port: int = 0,
+                 page_size: int = 100,
+                 latency: float = 0.0,
+                 jitter: float = 0.0,
+                 rate_limit: bool = False,
+                 bucket_size: float = 700.0,
+                 leak_rate: float = 10.0,
+                 request_cost: float = 1.0,
+                 seed: int = 1):
+        now = datetime.now(timezone.utc)
+        term = {"id": 1, "name": "Current term",
+                "start_at": _iso(now - timedelta(days=60)),
+                "end_at": _iso(now + timedelta(days=60))}
+        self.courses: List[Dict[str, Any]] = [
+            {"id": 1000 + i, "name": f"Course {i + 1}", "workflow_state": "available",
+             "enrollment_term_id": 1, "term": term}
+            for i in range(courses)
+        ]
+        self.assignments: Dict[int, List[Dict[str, Any]]] = {c["id"]: [] for c in self.courses}
+        # Half a step off `now`, so no due date sits on a window edge and the
+        # seconds between our clock and the client's can't move rows around
+        for a in make_assignment_dicts(courses * per_course, courses=courses,
+                                       start=now - timedelta(days=30, hours=3)):
+            self.assignments[a["course_id"]].append(a)
+
+        self.page_size = page_size
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit = rate_limit
+        self.bucket_size = bucket_size
+        self.leak_rate = leak_rate
+        self.request_cost = request_cost
+        self._rng = random.Random(seed)
+        self._bucket = 0.0
+        self._bucket_at = time.monotonic()
+
+        self.requests = 0
+        self.throttled = 0
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._server.request_queue_size = 128
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests = self.throttled = self.bytes_sent = 0
+            self._bucket = 0.0
+
+    def _admit(self) -> Tuple[bool, float]:
+        """Charge one request to the bucket: (allowed, remaining units)."""
+        with self._lock:
+            self.requests += 1
+            now = time.monotonic()
+            self._bucket = max(0.0, self._bucket - (now - self._bucket_at) * self.leak_rate)
+            self._bucket_at = now
+            if self.rate_limit and self._bucket + self.request_cost > self.bucket_size:
+                self.throttled += 1
+                return False, max(0.0, self.bucket_size - self._bucket)
+            self._bucket += self.request_cost
+            return True, self.bucket_size - self._bucket
+
+    def _delay(self) -> float:
+        with self._lock:
+            return max(0.0, self.latency + self._rng.uniform(-self.jitter, self.jitter))
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> "FakeCanvas":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _route(self, path: str, query: Dict[str, List[str]]) -> List[Dict[str, Any]]:
+        if path == "/api/v1/courses":
+            return self.courses
+        match = _ASSIGNMENTS.match(path)
+        if match:
+            return _bucketed(self.assignments.get(int(match.group(1)), []), query)
+        if _SUBMISSIONS.match(path):
+            return []
+        raise KeyError(path)
+
+    def _page(self, url: str) -> Tuple[List[Dict[str, Any]], str]:
+        """One page of a listing plus its Link header."""
+        parts = urlsplit(url)
+        query = parse_qs(parts.query)
+        items = self._route(parts.path, query)
+        per_page = max(1, min(self.page_size, int(query.get("per_page", ["10"])[0])))
+        page = int(query.get("page", ["1"])[0])
+        last = max(1, -(-len(items) // per_page))
+
+        # Like Canvas, page links keep every other query parameter
+        kept = [(k, v) for k, vs in query.items() if k not in ("page", "per_page") for v in vs]
+
+        def link(n: int, rel: str) -> str:
+            qs = urlencode(kept + [("per_page", per_page), ("page", n)])
+            return f'<{self.base_url.rstrip("/")}{parts.path}?{qs}>; rel="{rel}"'
+
+        links = [link(1, "first"), link(last, "last")]
+        if page < last:
+            links.append(link(page + 1, "next"))
+        return items[(page - 1) * per_page:page * per_page], ",".join(links)
+
+    def _handler(self):
+        canvas = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self) -> None:
+                allowed, remaining = canvas._admit()
+                time.sleep(canvas._delay())
+                headers = {"X-Request-Cost": f"{canvas.request_cost:g}",
+                           "X-Rate-Limit-Remaining": f"{remaining:.1f}"}
+                if not allowed:
+                    self._send(403, b"403 Forbidden (Rate Limit Exceeded)", headers, "text/plain")
+                    return
+                try:
+                    items, links = canvas._page(self.path)
+                except KeyError:
+                    self._send(404, b'{"errors":[{"message":"not found"}]}', headers)
+                    return
+                headers["Link"] = links
+                self._send(200, json.dumps(items).encode("utf-8"), headers)
+
+            def _send(self, status: int, body: bytes, headers: Dict[str, str],
+                      content_type: str = "application/json") -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+                with canvas._lock:
+                    canvas.bytes_sent += len(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        return Handler
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--courses", type=int, default=8)
+    parser.add_argument("--per-course", type=int, default=150)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds per response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="± seconds around --latency")
+    parser.add_argument("--rate-limit", action="store_true", help="Enforce a leaky-bucket limit")
+    args = parser.parse_args()
+
+    canvas = FakeCanvas(args.courses, args.per_course, port=args.port,
+                        page_size=args.page_size, latency=args.latency,
+                        jitter=args.jitter, rate_limit=args.rate_limit).start()
+    print(f"Fake Canvas on {canvas.base_url} (Ctrl-C to stop)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        canvas.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
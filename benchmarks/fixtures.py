@@ -0,0 +1,68 @@
+"""Synthetic Canvas payloads shared by the benchmark scripts."""
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+
+def _iso(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def make_assignment_dicts(n: int,
+                          courses: int = 10,
+                          distinct_dates: int = 400,
+                          seed: int = 1,
+                          start: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    """
+    Build `n` raw assignment dicts shaped like /courses/:id/assignments
+    with include[]=submission. Timestamps are drawn from a pool of
+    `distinct_dates` values, mimicking how Canvas repeats due dates across
+    sections and terms. Dates run every six hours from `start`.
+    """
+    rng = random.Random(seed)
+    start = start or datetime(2025, 1, 6, 23, 59, tzinfo=timezone.utc)
+    pool = [_iso(start + timedelta(hours=6 * i)) for i in range(distinct_dates)]
+
+    out: List[Dict[str, Any]] = []
+    for i in range(n):
+        course_id = 1000 + i % courses
+        due = rng.choice(pool)
+        out.append({
+            "id": i + 1,
+            "name": f"Assignment {i + 1}",
+            "course_id": course_id,
+            "html_url": f"https://canvas.example/courses/{course_id}/assignments/{i + 1}",
+            "description": "<p>" + "Lorem ipsum dolor sit amet. " * 20 + "</p>",
+            "points_possible": 10.0,
+            "published": True,
+            "due_at": due,
+            "created_at": rng.choice(pool),
+            "updated_at": rng.choice(pool),
+            "unlock_at": rng.choice(pool),
+            "lock_at": rng.choice(pool),
+            # Mostly online hand-ins, with some Canvas doesn't take submissions for
+            "submission_types": ["on_paper"] if i % 10 == 0 else ["none"] if i % 10 == 1 else ["online_upload"],
+            "allowed_extensions": ["pdf"],
+            "grading_type": "points",
+            "all_dates": [{"id": s, "due_at": due, "title": f"Section {s}"} for s in range(2)],
+            # A sample of the keys Canvas sends that the models never read
+            "position": i % 40,
+            "assignment_group_id": 500 + i % 5,
+            "lti_context_id": f"{i:032x}",
+            "secure_params": "eyJ0eXAiOiJKV1QiLCJhbGciOiJIUzI1NiJ9." + "x" * 60,
+            "submissions_download_url": f"https://canvas.example/courses/{course_id}/assignments/{i + 1}/submissions",
+            "workflow_state": "published",
+            "locked_for_user": False,
+            "can_duplicate": True,
+            "anonymous_grading": False,
+            "rubric_settings": {"points_possible": 10, "free_form_criterion_comments": False},
+            "submission": {
+                "workflow_state": rng.choice(["unsubmitted", "submitted", "graded"]),
+                "submitted_at": rng.choice([None, rng.choice(pool)]),
+                "graded_at": None,
+                "score": None,
+                "late": False,
+                "missing": False,
+            },
+        })
+    return out
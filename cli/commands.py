@@ -1,13 +1,22 @@
 
 from __future__ import annotations
+import json
+import os
+import re
+import sys
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Callable, Dict, Type, Any, List
+from datetime import datetime
+from typing import Callable, Dict, Type, Any
 
-from core.services import CourseService
 
 # For type annotations
 from argparse import ArgumentParser
-from core.models import Assignment
+
+# Core services, presenters and the HTTP server are imported inside the
+# helpers and run() methods that use them: app.py only sets up the selected
+# command's flags, so --help and light commands never load the rest.
 
 # --- Registry ---
 
@@ -23,6 +32,69 @@ def register(name: str) -> Callable[[Type["ICommand"]], Type["ICommand"]]:
     return _wrap
 
 
+def add_cache_arguments(p: ArgumentParser) -> None:
+    """Flags shared by every command that talks to Canvas."""
+    p.add_argument("--no-cache",
+                   action="store_true",
+                   help="Do not read or write the on-disk response cache")
+    p.add_argument("--refresh",
+                   action="store_true",
+                   help="Ignore cached responses and fetch fresh data")
+
+
+def add_mirror_arguments(p: ArgumentParser) -> None:
+    """Flag for commands that can read from the local SQLite mirror."""
+    p.add_argument("--from-mirror",
+                   action="store_true",
+                   help="Read from the local mirror (see 'sync') instead of Canvas")
+
+
+def add_format_arguments(p: ArgumentParser) -> None:
+    """Output format, for commands whose results can be piped elsewhere."""
+    from cli.presenter_export import FORMATS
+    p.add_argument("--format",
+                   choices=sorted(FORMATS),
+                   default="table",
+                   help="Console table (progressive: print as courses arrive), "
+                        "or a streaming NDJSON/JSON/CSV export")
+
+
+def add_interval_arguments(p: ArgumentParser) -> None:
+    """Per-resource refresh intervals for the long-running commands."""
+    from core.watch import DEFAULT_INTERVALS
+    for resource, seconds in DEFAULT_INTERVALS.items():
+        p.add_argument(f"--{resource}-interval",
+                       type=float,
+                       default=seconds,
+                       help=f"Seconds between {resource} refreshes (default {seconds:g})")
+
+
+def intervals_from(args) -> Dict[str, float]:
+    from core.watch import DEFAULT_INTERVALS
+    return {r: getattr(args, f"{r}_interval") for r in DEFAULT_INTERVALS}
+
+
+def source_client(args, deps) -> Any:
+    """The client a command should read from: the mirror or live Canvas."""
+    if getattr(args, "from_mirror", False):
+        if deps.mirror is None:
+            raise NotImplementedError("No local mirror configured")
+        return deps.mirror
+    if deps.canvas_client is None:
+        raise NotImplementedError("Likely missing CANVAS_TOKEN in .env)")
+    return deps.canvas_client
+
+
+def source_index(args, deps) -> Any:
+    """
+    The course index to go with source_client(): only live Canvas reads and
+    refreshes it, so the mirror neither shadows nor overwrites it.
+    """
+    if getattr(args, "from_mirror", False):
+        return None
+    return deps.course_index
+
+
 # --- Interface ---
 class ICommand(ABC):
     """Each command defines its own args and how to run."""
@@ -39,7 +111,7 @@ class ICommand(ABC):
         pass
 
 
-# --- Example commands (placeholders that raise for now) ---
+# --- Commands ---
 
 @register("list-courses")
 class ListCourses(ICommand):
@@ -49,14 +121,18 @@ class ListCourses(ICommand):
         p.add_argument("--include-archived",
                        action="store_true",
                        help="Include archived/ended courses")
+        add_format_arguments(p)
+        add_cache_arguments(p)
+        add_mirror_arguments(p)
 
     def run(self, args, deps) -> None:
-        if deps.canvas_client is None:
-            raise NotImplementedError("Likely missing CANVAS_TOKEN in .env)")
+        client = source_client(args, deps)
         if deps.presenter is None:
             raise NotImplementedError("No presenter configured")
 
-        service = CourseService(deps.canvas_client)
+        from core.services import CourseService
+        # Listing courses also refreshes the index --course-id looks ids up in
+        service = CourseService(client, course_index=source_index(args, deps))
         courses = service.list_courses(include_archived=args.include_archived)
         deps.presenter.display_courses(courses)
 
@@ -65,10 +141,19 @@ class ListCourses(ICommand):
 class ListTerms(ICommand):
     @staticmethod
     def add_arguments(p: ArgumentParser) -> None:
-        pass
+        add_format_arguments(p)
+        add_cache_arguments(p)
+        add_mirror_arguments(p)
 
     def run(self, args, deps) -> None:
-        raise NotImplementedError("ListTerms.run: Not Implemented")
+        client = source_client(args, deps)
+        if deps.presenter is None:
+            raise NotImplementedError("No presenter configured")
+
+        from core.services import CourseService
+        # Answered from the course index while it is fresh
+        service = CourseService(client, course_index=source_index(args, deps))
+        deps.presenter.display_terms(service.list_terms())
 
 
 @register("show-assignments")
@@ -83,6 +168,107 @@ class ShowAssignments(ICommand):
                        type=int,
                        action="append",
                        help="Restrict to specific course id(s); repeatable")
+        p.add_argument("--max-workers",
+                       type=int,
+                       default=4,
+                       help="Max number of courses fetched concurrently")
+        from core.services import CourseService
+        p.add_argument("--strategy",
+                       choices=CourseService.STRATEGIES,
+                       default="per-course",
+                       help="Fetch per course, all courses via the planner API, or per course "
+                            "starting while the course list is still loading")
+        add_format_arguments(p)
+        add_cache_arguments(p)
+        add_mirror_arguments(p)
+
+    def run(self, args, deps) -> None:
+        if args.from_mirror and args.strategy == "planner":
+            # The mirror stores course assignment listings, not the planner
+            raise NotImplementedError("--strategy planner needs live Canvas, not --from-mirror")
+        client = source_client(args, deps)
+        if deps.presenter is None:
+            raise NotImplementedError("No presenter configured")
+
+        from core.models import LazyAssignment
+        from core.services import CourseService
+
+        index = source_index(args, deps)
+        # The table only reads a few fields, so parse them on demand
+        service = CourseService(client,
+                                max_workers=args.max_workers,
+                                strategy=args.strategy,
+                                assignment_model=LazyAssignment,
+                                # Outlives the index's TTL, so an expired
+                                # index still lets pipelining start early
+                                term_hint=index.current_term_id() if index is not None else None,
+                                course_ids=args.course_id,
+                                course_index=index,
+                                # The mirror has no assignment buckets
+                                server_filter=not args.from_mirror)
+        if deps.presenter.streams_assignments:
+            # Rows go out course by course instead of after the last fetch
+            deps.presenter.display_assignment_stream(service.iter_due_windows(
+                window_days=args.window_days,
+                ordered=not deps.presenter.stream_in_completion_order,
+            ))
+            return
+
+        overdue, upcoming = service.due_windows(window_days=args.window_days)
+        deps.presenter.display_assignments(overdue, upcoming)
+
+
+@register("sync")
+class Sync(ICommand):
+    """Mirror courses and assignments into the local SQLite database."""
+
+    @staticmethod
+    def add_arguments(p: ArgumentParser) -> None:
+        p.add_argument("--submissions-only",
+                       action="store_true",
+                       help="Only refresh submission state of mirrored courses")
+        p.add_argument("--max-workers",
+                       type=int,
+                       default=4,
+                       help="Max number of courses fetched concurrently")
+        add_cache_arguments(p)
+
+    def run(self, args, deps) -> None:
+        if deps.canvas_client is None:
+            raise NotImplementedError("Likely missing CANVAS_TOKEN in .env)")
+        if deps.mirror is None:
+            raise NotImplementedError("No local mirror configured")
+
+        from core.services import CourseService
+        # A full sync lists every course, which also refreshes the course index
+        service = CourseService(deps.canvas_client,
+                                max_workers=args.max_workers,
+                                course_index=deps.course_index)
+        report = service.sync(deps.mirror, submissions_only=args.submissions_only)
+        print(
+            f"Synced {report.courses} course(s), "
+            f"{report.assignments_changed} changed assignment(s), "
+            f"{report.submissions} submission(s); "
+            f"{report.failed_courses} course(s) failed."
+        )
+
+
+@register("watch")
+class Watch(ICommand):
+    """Stay running and re-render assignments whenever they change."""
+
+    @staticmethod
+    def add_arguments(p: ArgumentParser) -> None:
+        p.add_argument("--window-days",
+                       type=int,
+                       default=7,
+                       help="Show overdue items up to N days late")
+        add_interval_arguments(p)
+        p.add_argument("--max-workers",
+                       type=int,
+                       default=4,
+                       help="Max number of courses fetched concurrently")
+        add_cache_arguments(p)
 
     def run(self, args, deps) -> None:
         if deps.canvas_client is None:
@@ -90,10 +276,163 @@ class ShowAssignments(ICommand):
         if deps.presenter is None:
             raise NotImplementedError("No presenter configured")
 
-        service = CourseService(deps.canvas_client)
-        assignments: List[Assignment] = service.get_unsubmitted_assignments(window_days=args.window_days)
+        from core.models import LazyAssignment
+        from core.services import CourseService
+        from core.watch import AssignmentWatcher
 
-        overdue: List[Assignment] = [a for a in assignments if a.is_overdue(args.window_days)]
-        upcoming: List[Assignment] = [a for a in assignments if not a.is_overdue(args.window_days)]
+        # One client (and HTTP session) for the whole run keeps connections warm
+        service = CourseService(deps.canvas_client,
+                                max_workers=args.max_workers,
+                                assignment_model=LazyAssignment)
+        watcher = AssignmentWatcher(
+            service,
+            window_days=args.window_days,
+            intervals=intervals_from(args),
+        )
 
-        deps.presenter.display_assignments(overdue, upcoming)
+        try:
+            while True:
+                try:
+                    changed = watcher.poll()
+                except Exception as e:
+                    # Keep showing the last results and try again later
+                    print(f"Warning: refresh failed, keeping previous results: {e}", file=sys.stderr)
+                    changed = False
+                if changed:
+                    print(f"\nUpdated {datetime.now():%Y-%m-%d %H:%M:%S}")
+                    deps.presenter.display_assignments(watcher.overdue, watcher.upcoming)
+                time.sleep(watcher.sleep_interval())
+        except KeyboardInterrupt:
+            pass
+
+
+@register("serve")
+class Serve(ICommand):
+    """Serve courses, terms and assignments as JSON over HTTP."""
+
+    @staticmethod
+    def add_arguments(p: ArgumentParser) -> None:
+        p.add_argument("--host",
+                       default="127.0.0.1",
+                       help="Interface to listen on")
+        p.add_argument("--port",
+                       type=int,
+                       default=8765,
+                       help="Port to listen on")
+        p.add_argument("--window-days",
+                       type=int,
+                       default=7,
+                       help="Show overdue items up to N days late")
+        add_interval_arguments(p)
+        p.add_argument("--max-workers",
+                       type=int,
+                       default=4,
+                       help="Max number of courses fetched concurrently")
+        add_cache_arguments(p)
+
+    def run(self, args, deps) -> None:
+        if deps.canvas_client is None:
+            raise NotImplementedError("Likely missing CANVAS_TOKEN in .env)")
+
+        from cli.server import SnapshotStore, make_server
+        from core.models import LazyAssignment
+        from core.services import CourseService
+        from core.watch import AssignmentWatcher
+
+        service = CourseService(deps.canvas_client,
+                                max_workers=args.max_workers,
+                                assignment_model=LazyAssignment)
+        watcher = AssignmentWatcher(service,
+                                    window_days=args.window_days,
+                                    intervals=intervals_from(args))
+        store = SnapshotStore(watcher, stats=getattr(deps.canvas_client, "stats", None))
+        store.refresh()  # warm before accepting requests
+
+        stop = threading.Event()
+        refresher = threading.Thread(target=store.run, args=(stop,), daemon=True)
+        refresher.start()
+
+        server = make_server(store, args.host, args.port)
+        host, port = server.server_address[:2]
+        print(f"Serving on http://{host}:{port}/ (courses, terms, assignments)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            stop.set()
+            server.server_close()
+
+
+def _safe_filename(name: str) -> str:
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", name).strip("._") or "account"
+
+
+@register("fan-out")
+class FanOut(ICommand):
+    """Show assignments for every account in an accounts file."""
+
+    @staticmethod
+    def add_arguments(p: ArgumentParser) -> None:
+        p.add_argument("--accounts",
+                       required=True,
+                       help="JSON list of {name, base_url, token | token_env}")
+        p.add_argument("--window-days",
+                       type=int,
+                       default=7,
+                       help="Show overdue items up to N days late")
+        p.add_argument("--max-accounts",
+                       type=int,
+                       default=8,
+                       help="Max number of accounts processed concurrently")
+        p.add_argument("--max-workers",
+                       type=int,
+                       default=2,
+                       help="Max number of courses fetched concurrently per account")
+        p.add_argument("--out-dir",
+                       help="Write one <account>.json per account instead of printing")
+        add_cache_arguments(p)
+
+    def run(self, args, deps) -> None:
+        if deps.accounts is None:
+            raise NotImplementedError("Multi-account mode not configured")
+        if args.out_dir is None and deps.presenter is None:
+            raise NotImplementedError("No presenter configured")
+
+        try:
+            # At most this many requests run at once, all possibly to one host
+            accounts = deps.accounts(args.accounts, max(1, args.max_accounts) * max(1, args.max_workers))
+        except (OSError, ValueError) as e:
+            # Bad single entries are reported per account; this is the whole file
+            raise NotImplementedError(f"Cannot read accounts file: {e}")
+
+        from core.fanout import fan_out
+        reports = fan_out(accounts,
+                          window_days=args.window_days,
+                          max_accounts=args.max_accounts,
+                          course_workers=args.max_workers)
+        if args.out_dir:
+            os.makedirs(args.out_dir, exist_ok=True)
+
+        # Reports arrive as accounts finish; emit each one right away
+        failed = 0
+        for report in reports:
+            failed += report.error is not None
+            if args.out_dir:
+                path = os.path.join(args.out_dir, f"{_safe_filename(report.name)}.json")
+                with open(path, "w", encoding="utf-8") as fh:
+                    json.dump({
+                        "account": report.name,
+                        "error": report.error,
+                        "overdue": [a.to_record() for a in report.overdue],
+                        "upcoming": [a.to_record() for a in report.upcoming],
+                    }, fh, indent=2)
+                print(f"{report.name}: wrote {path}")
+            elif report.error is not None:
+                print(f"\n== {report.name} ==\nError: {report.error}")
+            else:
+                print(f"\n== {report.name} ==")
+                deps.presenter.display_assignments(report.overdue, report.upcoming)
+
+        if failed:
+            print(f"{failed} account(s) failed.")
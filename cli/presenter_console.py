@@ -1,8 +1,10 @@
 # cli/presenter_console.py
 from __future__ import annotations
-from typing import Any, List, Sequence, Iterable, Tuple, Union, Dict
+import time
+from typing import Any, List, Optional, Sequence, Iterable, Tuple, Union, Dict
 from core.ports import IPresenter
-from core.models import Course
+from core.models import Course, Term
+from utils import tracing
 from datetime import datetime
 
 from shutil import get_terminal_size
@@ -61,6 +63,10 @@ class ConsolePresenter(IPresenter):
             print("No data.")
             return
 
+        with tracing.span("render.table", rows=len(rows)):
+            self._print_table(headers, rows, padding, trim_col_index, min_trim)
+
+    def _print_table(self, headers, rows, padding, trim_col_index, min_trim) -> None:
         str_rows: List[List[str]] = [[_fmt_cell(v) for v in r] for r in rows]
         str_headers: List[str] = [_fmt_cell(h) for h in headers]
 
@@ -128,8 +134,24 @@ class ConsolePresenter(IPresenter):
 
         self.display_table(headers, rows)
 
-    def display_terms(self, terms):
-        raise NotImplementedError
+    def display_terms(
+        self,
+        terms: Iterable[Union[Dict[str, Any], Term]],
+    ) -> None:
+        """Same as display_courses(), for Term instances."""
+        headers: Tuple = ("ID", "Name", "Start", "End")
+
+        rows: List[Tuple] = [
+            tuple(t.get_present_vars())
+            for t in terms
+            if isinstance(t, Term)
+        ]
+
+        if not rows:
+            print("No terms found.")
+            return
+
+        self.display_table(headers, rows)
 
     def display_assignments(self, overdue, upcoming):
         # Column order: ("ID", "Title", "Course", "URL", "Due At")
@@ -152,3 +174,68 @@ class ConsolePresenter(IPresenter):
             trim_col_index=title_col,
             min_trim=12,
         )
+
+
+# (header, preferred width, minimum width); a preferred width of None marks
+# the flexible column, which takes whatever the terminal has left.
+_PROGRESSIVE_COLUMNS: Tuple[Tuple[str, Optional[int], int], ...] = (
+    ("Status", 8, 8),
+    ("ID", 8, 8),
+    ("Title", None, 12),
+    ("Course", 18, 10),
+    ("URL", 48, 16),
+    ("Due At", 16, 16),
+)
+# On narrow terminals these give up width first, in this order
+_SHRINK_ORDER = ("URL", "Course")
+
+
+class ProgressiveConsolePresenter(ConsolePresenter):
+    """
+    Console output that prints assignments as each course arrives instead
+    of after the last one. Column widths are fixed up front from the
+    terminal width, so no row has to wait for the widest value.
+    """
+
+    streams_assignments = True
+    stream_in_completion_order = True
+
+    def __init__(self, padding: int = 2):
+        self.padding = padding
+
+    def column_widths(self, term_width: int) -> List[int]:
+        """Fit the columns to `term_width`, never below their minimums."""
+        widths = {h: (w if w is not None else m) for h, w, m in _PROGRESSIVE_COLUMNS}
+        flex = next(h for h, w, _ in _PROGRESSIVE_COLUMNS if w is None)
+        gaps = self.padding * (len(_PROGRESSIVE_COLUMNS) - 1)
+        spare = term_width - gaps - sum(widths.values())
+
+        minimums = {h: m for h, _, m in _PROGRESSIVE_COLUMNS}
+        for h in _SHRINK_ORDER:
+            if spare >= 0:
+                break
+            cut = min(-spare, widths[h] - minimums[h])
+            widths[h] -= cut
+            spare += cut
+        widths[flex] += max(0, spare)
+        return [widths[h] for h, _, _ in _PROGRESSIVE_COLUMNS]
+
+    def display_assignment_stream(self, rows) -> None:
+        started = time.perf_counter()
+        widths = self.column_widths(get_terminal_size(fallback=(120, 20)).columns)
+        sep = " " * self.padding
+
+        def line(cells: Sequence[Any]) -> str:
+            return sep.join(_ellipsize(_fmt_cell(v), w).ljust(w)
+                            for v, w in zip(cells, widths)).rstrip()
+
+        print(line([h for h, _, _ in _PROGRESSIVE_COLUMNS]))
+        print(sep.join("-" * w for w in widths), flush=True)
+
+        counts = {"overdue": 0, "upcoming": 0}
+        for category, a in tracing.timed_stream("render.progressive", rows):
+            counts[category] += 1
+            print(line((category,) + tuple(a.get_present_vars())), flush=True)
+
+        print(f"\n{counts['overdue']} overdue, {counts['upcoming']} upcoming "
+              f"({time.perf_counter() - started:.1f}s)")
@@ -0,0 +1,109 @@
+# cli/presenter_export.py
+from __future__ import annotations
+
+import csv
+import json
+import sys
+from abc import abstractmethod
+from itertools import chain
+from typing import Any, Dict, Iterable, Optional, Sequence, TextIO, Tuple, Type
+
+from core.models import Assignment
+from core.ports import IPresenter
+from utils import tracing
+from cli.presenter_console import ConsolePresenter, ProgressiveConsolePresenter
+
+
+def _record(item: Any) -> Dict[str, Any]:
+    """Models flatten via to_record(); raw API dicts pass through."""
+    return item.to_record() if hasattr(item, "to_record") else dict(item)
+
+
+class _RecordPresenter(IPresenter):
+    """
+    Base for machine-readable presenters: every item becomes one flat record
+    written (and flushed) as soon as it is produced, so memory stays constant
+    and a downstream pipe sees the first rows immediately.
+    """
+
+    streams_assignments = True
+
+    def __init__(self, out: Optional[TextIO] = None):
+        self._out = out
+
+    @property
+    def out(self) -> TextIO:
+        # Resolved late so redirected/captured stdout is honoured
+        return self._out if self._out is not None else sys.stdout
+
+    @abstractmethod
+    def write_records(self, records: Iterable[Dict[str, Any]]) -> None:
+        raise NotImplementedError
+
+    def _write(self, records: Iterable[Dict[str, Any]]) -> None:
+        self.write_records(tracing.timed_stream("render.records", records,
+                                                format=type(self).__name__))
+
+    def display_courses(self, courses: Iterable[Any]) -> None:
+        self._write(_record(c) for c in courses)
+
+    def display_terms(self, terms: Iterable[Any]) -> None:
+        self._write(_record(t) for t in terms)
+
+    def display_assignments(self,
+                            overdue: Sequence[Assignment],
+                            upcoming: Sequence[Assignment]) -> None:
+        self.display_assignment_stream(chain(
+            (("overdue", a) for a in overdue),
+            (("upcoming", a) for a in upcoming),
+        ))
+
+    def display_assignment_stream(self, rows: Iterable[Tuple[str, Assignment]]) -> None:
+        self._write(dict(category=category, **a.to_record()) for category, a in rows)
+
+
+class NDJSONPresenter(_RecordPresenter):
+    """One JSON object per line."""
+
+    def write_records(self, records: Iterable[Dict[str, Any]]) -> None:
+        out = self.out
+        for r in records:
+            out.write(json.dumps(r, ensure_ascii=False) + "\n")
+            out.flush()
+
+
+class JSONPresenter(_RecordPresenter):
+    """A single JSON array, written element by element."""
+
+    def write_records(self, records: Iterable[Dict[str, Any]]) -> None:
+        out = self.out
+        out.write("[")
+        for i, r in enumerate(records):
+            out.write((",\n" if i else "\n") + json.dumps(r, ensure_ascii=False))
+            out.flush()
+        out.write("\n]\n")
+        out.flush()
+
+
+class CSVPresenter(_RecordPresenter):
+    """CSV with a header row taken from the first record's fields."""
+
+    def write_records(self, records: Iterable[Dict[str, Any]]) -> None:
+        out = self.out
+        writer = None
+        for r in records:
+            if writer is None:
+                writer = csv.DictWriter(out, fieldnames=list(r), extrasaction="ignore")
+                writer.writeheader()
+            writer.writerow(r)
+            out.flush()
+
+
+# --format choices
+FORMATS: Dict[str, Type[IPresenter]] = {
+    "table": ConsolePresenter,
+    "progressive": ProgressiveConsolePresenter,
+    "ndjson": NDJSONPresenter,
+    "json": JSONPresenter,
+    "csv": CSVPresenter,
+}
@@ -0,0 +1,171 @@
+"""
+Read-only JSON API over CourseService, for dashboards and bots.
+
+One background thread drives an AssignmentWatcher; request handlers only
+read the last pre-encoded snapshot, so every client shares the same Canvas
+traffic and answers never wait on the network.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional, Type
+
+from core.watch import AssignmentWatcher
+
+
+@dataclass(frozen=True)
+class _Resource:
+    body: bytes
+    etag: str
+    changed_at: datetime
+
+
+def _encode(payload: Any) -> bytes:
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+class SnapshotStore:
+    """
+    Pre-encoded JSON bodies for each endpoint, swapped in whole after every
+    refresh. Readers never lock: replacing the dict is atomic, and a request
+    sees either the old snapshot or the new one.
+    """
+
+    def __init__(self,
+                 watcher: AssignmentWatcher,
+                 clock: Callable[[], float] = time.monotonic,
+                 stats: Optional[Callable[[], Dict[str, Any]]] = None):
+        """
+        :param stats: Extra counters to report on /healthz (e.g. the
+                      client's single-flight hit rate).
+        """
+        self._watcher = watcher
+        self._clock = clock
+        self.stats = stats
+        self._resources: Dict[str, _Resource] = {}
+        self._refresh_lock = threading.Lock()
+        self._next_refresh = 0.0
+
+        self.last_refresh: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+
+    def get(self, path: str) -> Optional[_Resource]:
+        return self._resources.get(path)
+
+    def max_age(self) -> int:
+        """Seconds a client may reuse a response: until our next refresh."""
+        return max(0, int(self._next_refresh - self._clock()))
+
+    def refresh(self) -> None:
+        """Poll whatever is due and publish new bodies; keeps old data on error."""
+        with self._refresh_lock:
+            try:
+                self._watcher.poll()
+            except Exception as e:
+                self.last_error = str(e)
+                print(f"Warning: refresh failed, serving previous data: {e}", file=sys.stderr)
+            else:
+                self.last_error = None
+                self.last_refresh = datetime.now(timezone.utc)
+                self._publish()
+            self._next_refresh = self._clock() + self._watcher.sleep_interval()
+
+    def _publish(self) -> None:
+        w = self._watcher
+        payloads = {
+            "/courses": [c.to_record() for c in w.courses],
+            "/terms": [t.to_record() for t in w.terms],
+            "/assignments": {
+                "overdue": [a.to_record() for a in w.overdue],
+                "upcoming": [a.to_record() for a in w.upcoming],
+            },
+        }
+        resources = {}
+        for path, payload in payloads.items():
+            body = _encode(payload)
+            etag = '"' + hashlib.sha1(body).hexdigest()[:20] + '"'
+            old = self._resources.get(path)
+            if old is not None and old.etag == etag:
+                resources[path] = old  # unchanged: keep Last-Modified stable
+            else:
+                resources[path] = _Resource(body, etag, self.last_refresh)
+        self._resources = resources
+
+    def run(self, stop: threading.Event) -> None:
+        """Background refresh loop; returns once `stop` is set."""
+        while not stop.wait(max(0.0, self._next_refresh - self._clock())):
+            self.refresh()
+
+
+def make_handler(store: SnapshotStore) -> Type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        server_version = "CanvasPulse"
+        protocol_version = "HTTP/1.1"  # keep-alive for repeat pollers
+        # Headers and body go out as separate writes; don't let Nagle hold the body
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:
+            path = self.path.split("?", 1)[0].rstrip("/") or "/"
+            if path == "/healthz":
+                health = {
+                    "ok": store.last_refresh is not None and store.last_error is None,
+                    "last_refresh": store.last_refresh.isoformat() if store.last_refresh else None,
+                    "last_error": store.last_error,
+                }
+                if store.stats is not None:
+                    health["stats"] = store.stats()
+                self._send(200, _encode(health), {"Cache-Control": "no-store"})
+                return
+
+            resource = store.get(path)
+            if resource is None:
+                if store.last_refresh is None and path in ("/courses", "/terms", "/assignments"):
+                    self._send(503, _encode({"error": "warming up"}), {"Retry-After": "1"})
+                else:
+                    self._send(404, _encode({"error": f"no such endpoint: {path}"}), {})
+                return
+
+            headers = {
+                "ETag": resource.etag,
+                "Last-Modified": format_datetime(resource.changed_at, usegmt=True),
+                "Cache-Control": f"max-age={store.max_age()}",
+            }
+            if self.headers.get("If-None-Match") == resource.etag:
+                self._send(304, b"", headers)
+            else:
+                self._send(200, resource.body, headers)
+
+        def _send(self, status: int, body: bytes, headers: Dict[str, str]) -> None:
+            self.send_response(status)
+            if status != 304:
+                self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass  # one line per poll from every dashboard is just noise
+
+    return Handler
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 drops connects when a burst of clients arrives
+    # together, costing each dropped one a ~1s SYN retry.
+    request_queue_size = 128
+
+
+def make_server(store: SnapshotStore, host: str, port: int) -> ThreadingHTTPServer:
+    """A thread-per-connection server reading from `store`; port 0 picks one."""
+    return _Server((host, port), make_handler(store))
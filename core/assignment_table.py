@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import math
+from array import array
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterator, List, Optional, Sequence
+
+# Optional: vectorized classification when NumPy is installed. Imported on
+# first use, since most commands never build a table. None when unavailable.
+_UNLOADED: Any = object()
+np: Any = _UNLOADED
+
+
+def _numpy() -> Any:
+    global np
+    if np is _UNLOADED:
+        try:
+            import numpy
+            np = numpy
+        except ImportError:  # pragma: no cover - depends on the environment
+            np = None
+    return np
+
+
+# Classification codes, one per row
+OUT_OF_WINDOW = 0
+OVERDUE = 1
+UPCOMING = 2
+
+
+class RowView(Sequence[Any]):
+    """Read-only view of selected rows; indexes into the table, no copies."""
+
+    __slots__ = ("_rows", "_idx")
+
+    def __init__(self, rows: Sequence[Any], idx: Sequence[int]):
+        self._rows = rows
+        self._idx = idx
+
+    def __len__(self) -> int:
+        return len(self._idx)
+
+    def __getitem__(self, i):  # type: ignore[override]
+        if isinstance(i, slice):
+            return RowView(self._rows, self._idx[i])
+        return self._rows[int(self._idx[i])]
+
+    def __iter__(self) -> Iterator[Any]:
+        rows = self._rows
+        for i in self._idx:
+            yield rows[int(i)]
+
+
+@dataclass(frozen=True)
+class WindowClassification:
+    """Index arrays into an AssignmentTable, each in original row order."""
+    overdue: Sequence[int]
+    upcoming: Sequence[int]
+    out_of_window: Sequence[int]
+    now: datetime
+
+    @property
+    def in_window(self) -> List[int]:
+        """Overdue and upcoming rows together, in original row order."""
+        return sorted(list(self.overdue) + list(self.upcoming))
+
+
+class AssignmentTable:
+    """
+    Column store over a list of assignments: due dates as epoch seconds
+    (NaN when missing), a submitted flag, and course ids (-1 when missing).
+
+    Columns are extracted once; classify() then labels every row against a
+    single reference time in one pass, using NumPy when available and plain
+    `array` columns otherwise.
+    """
+
+    def __init__(self, assignments: Sequence[Any]):
+        self.rows = assignments
+
+        due = [a.due_at.timestamp() if a.due_at is not None else math.nan for a in assignments]
+        submitted = [1 if a.is_submitted() else 0 for a in assignments]
+        course_ids = [a.course_id if a.course_id is not None else -1 for a in assignments]
+
+        np = _numpy()
+        if np is not None:
+            self.due = np.array(due, dtype=np.float64)
+            self.submitted = np.array(submitted, dtype=np.int8)
+            self.course_ids = np.array(course_ids, dtype=np.int64)
+        else:
+            self.due = array("d", due)
+            self.submitted = array("b", submitted)
+            self.course_ids = array("q", course_ids)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def view(self, idx: Sequence[int]) -> RowView:
+        return RowView(self.rows, idx)
+
+    def classify(self, window_days: int, now: Optional[datetime] = None) -> WindowClassification:
+        """
+        Label unsubmitted rows as overdue (due within the last `window_days`)
+        or upcoming (due now or later); everything else (submitted, undated,
+        or overdue for longer) is out of window.
+        """
+        now = now or datetime.now(timezone.utc)
+        t_now = now.timestamp()
+        t_start = (now - timedelta(days=window_days)).timestamp()
+
+        np = _numpy()
+        if np is not None:
+            # NaN due dates compare False everywhere, so undated rows drop out
+            open_ = self.submitted == 0
+            overdue = open_ & (self.due >= t_start) & (self.due < t_now)
+            upcoming = open_ & (self.due >= t_now)
+            out = ~(overdue | upcoming)
+            return WindowClassification(
+                overdue=np.flatnonzero(overdue),
+                upcoming=np.flatnonzero(upcoming),
+                out_of_window=np.flatnonzero(out),
+                now=now,
+            )
+
+        buckets = (array("l"), array("l"), array("l"))  # indexed by code
+        for i, (due, submitted) in enumerate(zip(self.due, self.submitted)):
+            if submitted or not due >= t_start:  # also catches NaN
+                code = OUT_OF_WINDOW
+            elif due < t_now:
+                code = OVERDUE
+            else:
+                code = UPCOMING
+            buckets[code].append(i)
+
+        return WindowClassification(
+            overdue=buckets[OVERDUE],
+            upcoming=buckets[UPCOMING],
+            out_of_window=buckets[OUT_OF_WINDOW],
+            now=now,
+        )
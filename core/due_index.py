@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+_Key = Tuple[float, int]
+
+
+class DueIndex:
+    """
+    Assignments kept sorted by due date, for O(log n) window queries.
+
+    Rows are keyed on (due epoch seconds, assignment id), so ties come out
+    in a stable order and an assignment can be found again for updates.
+    Undated assignments are tracked separately and never match a range.
+    """
+
+    def __init__(self, assignments: Iterable[Any] = ()):
+        self._keys: List[_Key] = []
+        self._items: List[Any] = []
+        self._key_by_id: Dict[int, _Key] = {}
+        self._undated: Dict[int, Any] = {}
+
+        # Bulk load: one sort instead of n insertions
+        dated: Dict[int, Tuple[_Key, Any]] = {}
+        for a in assignments:
+            if a.due_at is None:
+                self._undated[a.id] = a
+            else:
+                dated[a.id] = ((a.due_at.timestamp(), a.id), a)
+        for key, a in sorted(dated.values(), key=lambda pair: pair[0]):
+            self._keys.append(key)
+            self._items.append(a)
+            self._key_by_id[a.id] = key
+
+    def __len__(self) -> int:
+        return len(self._items) + len(self._undated)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Dated assignments in due order, then undated ones."""
+        yield from self._items
+        yield from self._undated.values()
+
+    @property
+    def undated(self) -> List[Any]:
+        return list(self._undated.values())
+
+    # --- Maintenance ---
+
+    def upsert(self, assignment: Any) -> None:
+        """Insert an assignment, or move it if it is already indexed."""
+        self.remove(assignment.id)
+        if assignment.due_at is None:
+            self._undated[assignment.id] = assignment
+            return
+        key = (assignment.due_at.timestamp(), assignment.id)
+        pos = bisect_left(self._keys, key)
+        self._keys.insert(pos, key)
+        self._items.insert(pos, assignment)
+        self._key_by_id[assignment.id] = key
+
+    def remove(self, assignment_id: int) -> Optional[Any]:
+        """Drop an assignment by id; returns it, or None if absent."""
+        if assignment_id in self._undated:
+            return self._undated.pop(assignment_id)
+        key = self._key_by_id.pop(assignment_id, None)
+        if key is None:
+            return None
+        pos = bisect_left(self._keys, key)
+        del self._keys[pos]
+        return self._items.pop(pos)
+
+    # --- Range queries (half-open: start <= due < end) ---
+
+    def _pos(self, when: Optional[datetime]) -> int:
+        if when is None:
+            return len(self._keys)
+        return bisect_left(self._keys, (when.timestamp(), float("-inf")))
+
+    def between(self, start: Optional[datetime], end: Optional[datetime]) -> List[Any]:
+        """Assignments due in [start, end), in due order; None is open-ended."""
+        lo = 0 if start is None else self._pos(start)
+        return self._items[lo:self._pos(end)]
+
+    def due_after(self, when: datetime) -> List[Any]:
+        return self.between(when, None)
+
+    def due_within(self, hours: float, now: Optional[datetime] = None) -> List[Any]:
+        """Due from now up to `hours` ahead, e.g. due_within(48)."""
+        now = now or datetime.now(timezone.utc)
+        return self.between(now, now + timedelta(hours=hours))
+
+    def overdue_within(self, days: float, now: Optional[datetime] = None) -> List[Any]:
+        """Already due, but no more than `days` ago."""
+        now = now or datetime.now(timezone.utc)
+        return self.between(now - timedelta(days=days), now)
+
+    def due_this_week(self, now: Optional[datetime] = None) -> List[Any]:
+        """Due from now until the end of the current ISO week (Monday 00:00 UTC)."""
+        now = now or datetime.now(timezone.utc)
+        start_of_today = now.astimezone(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        week_end = start_of_today + timedelta(days=7 - start_of_today.weekday())
+        return self.between(now, week_end)
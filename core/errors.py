@@ -0,0 +1,20 @@
+from typing import Any, List, Optional
+
+
+class PartialResultError(Exception):
+    """
+    Pagination stopped early because a page kept failing after retries.
+
+    `items` holds what was fetched before the failure (empty when raised
+    from a streaming iterator, whose caller already received them) and
+    `resume_url` is the absolute URL of the failing page; passing it back
+    as the path of a new paginated call continues where this one stopped.
+    """
+
+    def __init__(self,
+                 message: str,
+                 items: Optional[List[Any]] = None,
+                 resume_url: Optional[str] = None):
+        super().__init__(message)
+        self.items: List[Any] = items if items is not None else []
+        self.resume_url = resume_url
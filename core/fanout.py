@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .models import LazyAssignment
+from .ports import ICanvasClient
+from .services import CourseService
+
+
+@dataclass
+class AccountReport:
+    """One account's outcome of a fan-out run."""
+    name: str
+    overdue: List[Any] = field(default_factory=list)
+    upcoming: List[Any] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+def _run_account(name: str, client: ICanvasClient, window_days: int,
+                 course_workers: int) -> AccountReport:
+    service = CourseService(client,
+                            max_workers=course_workers,
+                            assignment_model=LazyAssignment)
+    try:
+        overdue, upcoming = service.due_windows(window_days)
+    except Exception as e:
+        # One bad token or host must not sink the other accounts
+        return AccountReport(name, error=str(e))
+    return AccountReport(name, overdue, upcoming)
+
+
+def fan_out(accounts: Iterable[Tuple[str, Union[ICanvasClient, Exception]]],
+            window_days: int,
+            max_accounts: int = 8,
+            course_workers: int = 2) -> Iterator[AccountReport]:
+    """
+    Run the overdue/upcoming query for many accounts, yielding each report
+    as soon as its account finishes (completion order, not input order).
+
+    Threads are bounded by max_accounts * course_workers however many
+    accounts there are; the rest wait as queued futures.
+
+    An account given as an Exception instead of a client (e.g. a bad entry
+    in the accounts file) is reported with that error without being run.
+    """
+    with ThreadPoolExecutor(max_workers=max(1, max_accounts)) as pool:
+        futures, unusable = [], []
+        for name, client in accounts:
+            if isinstance(client, Exception):
+                unusable.append(AccountReport(name, error=str(client)))
+                continue
+            futures.append(pool.submit(_run_account, name, client, window_days,
+                                       max(1, course_workers)))
+        # Everything is queued before we yield, so a slow reader doesn't stall the pool
+        yield from unusable
+        for future in as_completed(futures):
+            yield future.result()
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional, Tuple, Dict, Any, List
+from dataclasses import dataclass, replace, FrozenInstanceError
+from typing import Optional, Tuple, Dict, Any, List, Callable, FrozenSet, Iterable, Set
 from datetime import datetime, timedelta, timezone
 
 from utils.iso_parser import _parse_iso
@@ -37,13 +37,286 @@ class Course:
             self.enrollment_term_id
         )
 
+    def to_record(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "workflow_state": self.workflow_state,
+            "enrollment_term_id": self.enrollment_term_id,
+        }
+
     def __str__(self) -> str:
         term = self.enrollment_term_id if self.enrollment_term_id is not None else "-"
         return f"{self.id} · {self.name} [{self.workflow_state}] (term {term})"
 
 
 @dataclass(frozen=True)
-class Assignment:
+class Term:
+    id: int
+    name: str
+    start_at: Optional[datetime] = None
+    end_at: Optional[datetime] = None
+
+    @staticmethod
+    def from_api(d: dict) -> "Term":
+        """From the 'term' object Canvas embeds with include[]=term."""
+        return Term(
+            id=int(d["id"]),
+            name=d.get("name", ""),
+            start_at=_parse_iso(d.get("start_at")),
+            end_at=_parse_iso(d.get("end_at")),
+        )
+
+    def is_active(self, now: datetime) -> bool:
+        return (self.start_at is not None and self.start_at <= now
+                and (self.end_at is None or now <= self.end_at))
+
+    def get_present_vars(self) -> tuple:
+        return (
+            self.id,
+            self.name,
+            self.start_at,
+            self.end_at,
+        )
+
+    def to_record(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "start_at": self.start_at.isoformat() if self.start_at else None,
+            "end_at": self.end_at.isoformat() if self.end_at else None,
+        }
+
+    def __str__(self) -> str:
+        start = self.start_at.strftime("%Y-%m-%d") if self.start_at else "—"
+        end = self.end_at.strftime("%Y-%m-%d") if self.end_at else "—"
+        return f"{self.id} · {self.name} ({start} → {end})"
+
+
+def _opt(conv: Callable[[Any], Any], key: str) -> Callable[[Dict[str, Any]], Any]:
+    return lambda d: conv(d[key]) if d.get(key) is not None else None
+
+
+def _flag(key: str) -> Callable[[Dict[str, Any]], bool]:
+    return lambda d: bool(d.get(key, False))
+
+
+def _date(key: str) -> Callable[[Dict[str, Any]], Optional[datetime]]:
+    return lambda d: _parse_iso(d.get(key))
+
+
+def _sub(key: str, conv: Callable[[Any], Any]) -> Callable[[Dict[str, Any]], Any]:
+    """Read one value of the per-user submission snapshot."""
+    def read(d: Dict[str, Any]) -> Any:
+        value = (d.get("submission") or {}).get(key)
+        return conv(value) if value is not None else None
+    return read
+
+
+def _all_dates(d: Dict[str, Any]) -> List[Any]:
+    return d.get("all_dates") or []
+
+
+# How LazyAssignment reads each attribute (other than course_name) from a raw
+# Canvas dict, one field at a time. Mirrors Assignment.from_api_dict, which
+# stays hand-written because building all fields at once is faster that way.
+_ASSIGNMENT_FIELDS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "id": lambda d: int(d.get("id")),
+    "title": lambda d: d.get("name", "Untitled"),
+    "url": lambda d: d.get("html_url"),
+    "points": _opt(float, "points_possible"),
+    "published": _flag("published"),
+    "due_at": _date("due_at"),
+
+    "course_id": _opt(int, "course_id"),
+    "description": lambda d: d.get("description"),
+
+    "created_at": _date("created_at"),
+    "updated_at": _date("updated_at"),
+    "unlock_at": _date("unlock_at"),
+    "lock_at": _date("lock_at"),
+
+    "has_overrides": _flag("has_overrides"),
+    "only_visible_to_overrides": _flag("only_visible_to_overrides"),
+    "important_dates": _flag("important_dates"),
+
+    "submission_types": lambda d: tuple(str(x) for x in _as_tuple(d.get("submission_types"))),
+    "allowed_extensions": lambda d: tuple(str(x) for x in _as_tuple(d.get("allowed_extensions"))),
+    "grading_type": _opt(str, "grading_type"),
+    "grading_standard_id": _opt(int, "grading_standard_id"),
+    "grade_group_students_individually": _flag("grade_group_students_individually"),
+    "group_category_id": _opt(int, "group_category_id"),
+
+    "peer_reviews": _flag("peer_reviews"),
+    "automatic_peer_reviews": _flag("automatic_peer_reviews"),
+    "moderated_grading": _flag("moderated_grading"),
+    "omit_from_final_grade": _flag("omit_from_final_grade"),
+    "has_submitted_submissions": _flag("has_submitted_submissions"),
+
+    "all_dates_raw": lambda d: tuple(x for x in _all_dates(d) if isinstance(x, dict)),
+    "all_dates_due_ats": lambda d: tuple(
+        _parse_iso(x.get("due_at")) if isinstance(x, dict) else None
+        for x in _all_dates(d)
+    ),
+
+    "submission_workflow_state": _sub("workflow_state", str),
+    "submission_submitted_at": _sub("submitted_at", _parse_iso),
+    "submission_graded_at": _sub("graded_at", _parse_iso),
+    "submission_score": _sub("score", float),
+    "submission_late": _sub("late", bool),
+    "submission_missing": _sub("missing", bool),
+}
+
+# Fields that come from the per-user submission snapshot
+_SUBMISSION_FIELDS = (
+    "submission_workflow_state", "submission_submitted_at",
+    "submission_graded_at", "submission_score", "submission_late",
+    "submission_missing",
+)
+
+
+class _KeyRecorder(dict):
+    """An empty payload that notes every key a reader asks it for."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.seen: Set[str] = set()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        self.seen.add(key)
+        return default
+
+    def __getitem__(self, key: str) -> Any:
+        self.seen.add(key)
+        raise KeyError(key)
+
+
+def _raw_keys_read_by(readers: Iterable[Callable[[Dict[str, Any]], Any]]) -> FrozenSet[str]:
+    recorder = _KeyRecorder()
+    for read in readers:
+        try:
+            read(recorder)
+        except (KeyError, TypeError, ValueError):
+            pass  # e.g. int(None) for "id"; the key was still recorded
+    return frozenset(recorder.seen)
+
+
+# Raw keys the field readers look at; everything else can be dropped.
+# Derived from the readers so the two can't drift apart.
+_ASSIGNMENT_RAW_KEYS = _raw_keys_read_by(_ASSIGNMENT_FIELDS.values())
+
+
+# Submission types Canvas doesn't count as expecting a submission (its
+# "overdue" bucket skips assignments that take only these)
+_NO_SUBMISSION_TYPES = frozenset({"none", "not_graded", "on_paper", "wiki_page"})
+
+
+class _AssignmentBehaviour:
+    """Methods shared by Assignment and LazyAssignment."""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_planner_item(cls, item: Dict[str, Any], course_name: str) -> Optional[Any]:
+        """
+        Create an assignment from a /api/v1/planner/items entry, or None if
+        the item is not backed by an assignment (notes, ungraded pages...).
+        """
+        plannable = item.get("plannable") or {}
+        if item.get("plannable_type") == "assignment":
+            assignment_id = item.get("plannable_id", plannable.get("id"))
+        else:
+            # Graded quizzes and discussions point at their assignment
+            assignment_id = plannable.get("assignment_id")
+        if assignment_id is None:
+            return None
+
+        # 'submissions' is False when the item takes none
+        subs = item.get("submissions") or {}
+        if subs.get("graded"):
+            state = "graded"
+        elif subs.get("submitted"):
+            state = "submitted"
+        else:
+            state = "unsubmitted"
+
+        return cls.from_api_dict({
+            "id": assignment_id,
+            "name": plannable.get("title") or plannable.get("name") or "Untitled",
+            "course_id": item.get("course_id"),
+            "html_url": item.get("html_url"),
+            "points_possible": plannable.get("points_possible"),
+            "published": True,
+            "due_at": plannable.get("due_at") or item.get("plannable_date"),
+            "created_at": plannable.get("created_at"),
+            "updated_at": plannable.get("updated_at"),
+            "submission": {
+                "workflow_state": state,
+                "late": subs.get("late"),
+                "missing": subs.get("missing"),
+            },
+        }, course_name)
+
+    def get_present_vars(self) -> tuple:
+        return (
+            self.id,
+            self.title,
+            self.course_name,
+            self.url,
+            self.due_at,
+        )
+
+    def is_overdue(self, window_days: int) -> bool:
+        """
+        Checks if the assignment is overdue but still within display window.
+        """
+        now = datetime.now(timezone.utc)
+        windows_end = now - timedelta(days=window_days)
+
+        is_due_and_in_window = (
+            self.due_at is not None and
+            windows_end <= self.due_at < now
+        )
+        return is_due_and_in_window
+
+    def is_submitted(self) -> bool:
+        """
+        Checks the submission status from the raw API dictionary.
+        """
+        if self.submission_submitted_at:
+            return True
+        state = (self.submission_workflow_state or "").lower()
+        return state in {"submitted", "graded", "pending_review"}
+
+    def expects_submission(self) -> bool:
+        """True when students hand this in through Canvas (not on paper, etc.)."""
+        return any(t not in _NO_SUBMISSION_TYPES for t in self.submission_types if t)
+
+    def to_record(self) -> Dict[str, Any]:
+        """Flat, JSON-serialisable summary used by the machine-readable outputs."""
+        return {
+            "id": self.id,
+            "title": self.title,
+            "course_id": self.course_id,
+            "course_name": self.course_name,
+            "url": self.url,
+            "due_at": self.due_at.isoformat() if self.due_at else None,
+            "points": self.points,
+            "submission_state": self.submission_workflow_state,
+        }
+
+    def __str__(self) -> str:
+        pts = "-" if self.points is None else f"{self.points:g} pts"
+        pub = "published" if self.published else "unpublished"
+        due = self.due_at.strftime("%Y-%m-%d %H:%M") if self.due_at else "—"
+        return (
+            f"{self.id} · {self.title} ({self.course_name}) — "
+            f"due {due} · {pts} · {pub}"
+        )
+
+
+@dataclass(frozen=True)
+class Assignment(_AssignmentBehaviour):
     """A clean, immutable representation of a Canvas assignment."""
 
     # Core
@@ -174,42 +447,55 @@ class Assignment:
             ),
         )
 
-    def get_present_vars(self) -> tuple:
-        return (
-            self.id,
-            self.title,
-            self.course_name,
-            self.url,
-            self.due_at,
-        )
+    def with_submission(self, submission: Dict[str, Any]) -> "Assignment":
+        """Copy with the per-user submission snapshot replaced."""
+        raw = {"submission": submission}
+        return replace(self, **{name: _ASSIGNMENT_FIELDS[name](raw) for name in _SUBMISSION_FIELDS})
 
-    def is_overdue(self, window_days: int) -> bool:
-        """
-        Checks if the assignment is overdue but still within display window.
-        """
-        now = datetime.now(timezone.utc)
-        windows_end = now - timedelta(days=window_days)
 
-        is_due_and_in_window = (
-            self.due_at is not None and
-            windows_end <= self.due_at < now
-        )
-        return is_due_and_in_window
+class LazyAssignment(_AssignmentBehaviour):
+    """
+    Drop-in, read-only stand-in for Assignment that keeps a trimmed copy of
+    the raw Canvas dict and parses each attribute on first access.
 
-    def is_submitted(self) -> bool:
-        """
-        Checks the submission status from the raw API dictionary.
-        """
-        if self.submission_submitted_at:
-            return True
-        state = (self.submission_workflow_state or "").lower()
-        return state in {"submitted", "graded", "pending_review"}
+    Views that only touch a handful of fields (the table needs five) skip
+    parsing the other ~30, including every timestamp.
+    """
 
-    def __str__(self) -> str:
-        pts = "-" if self.points is None else f"{self.points:g} pts"
-        pub = "published" if self.published else "unpublished"
-        due = self.due_at.strftime("%Y-%m-%d %H:%M") if self.due_at else "—"
-        return (
-            f"{self.id} · {self.title} ({self.course_name}) — "
-            f"due {due} · {pts} · {pub}"
-        )
+    __slots__ = ("_raw", "course_name") + tuple(_ASSIGNMENT_FIELDS)
+
+    def __init__(self, raw: Dict[str, Any], course_name: str):
+        object.__setattr__(self, "_raw", raw)
+        object.__setattr__(self, "course_name", course_name)
+
+    @classmethod
+    def from_api_dict(cls, data: Dict[str, Any], course_name: str) -> "LazyAssignment":
+        """Wrap a raw Canvas API dict without parsing it."""
+        trimmed = {k: v for k, v in data.items() if k in _ASSIGNMENT_RAW_KEYS}
+        return cls(trimmed, course_name)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached while the slot is still empty
+        read = _ASSIGNMENT_FIELDS.get(name)
+        if read is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        value = read(self._raw)
+        object.__setattr__(self, name, value)
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def with_submission(self, submission: Dict[str, Any]) -> "LazyAssignment":
+        """Copy with the per-user submission snapshot replaced."""
+        return LazyAssignment(dict(self._raw, submission=submission), self.course_name)
+
+    def to_assignment(self) -> Assignment:
+        """Materialize an eager Assignment with identical values."""
+        return Assignment.from_api_dict(self._raw, self.course_name)
+
+    def __repr__(self) -> str:
+        return f"LazyAssignment(id={self.id!r}, title={self.title!r}, course_name={self.course_name!r})"
@@ -1,8 +1,15 @@
 
 
 from abc import ABC, abstractmethod
-from typing import Iterable, Any, Optional
-from .models import Assignment
+from typing import Iterable, Iterator, Any, List, Optional, Sequence, Tuple
+from .models import Assignment, Course, Term
+
+
+def collect(items: Iterable[Any]) -> List[Any]:
+    """Drain a (possibly lazy) item stream into a list."""
+    if isinstance(items, list):
+        return items
+    return list(items)
 
 
 class ICanvasClient(ABC):
@@ -15,10 +22,92 @@ class ICanvasClient(ABC):
         """Yield items from a paginated API endpoint."""
         pass
 
+    def iter_paginated(self,
+                       path: str,
+                       params: Optional[dict] = None) -> Iterator[Any]:
+        """
+        Lazily yield items, fetching the next page only once the current
+        one has been consumed. Clients that can stream should override this;
+        the default simply walks get_paginated().
+        """
+        yield from self.get_paginated(path, params)
+
+
+class ICourseMirror(ICanvasClient):
+    """
+    Local store that mirrors raw Canvas courses and assignments. Reads go
+    through the ICanvasClient interface, so services can run against it
+    exactly as they do against the live API.
+    """
+
+    @abstractmethod
+    def upsert_courses(self, courses: list[dict[str, Any]]) -> int:
+        """
+        Store the complete course listing; returns how many rows were
+        written. Courses missing from it are removed with their data.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def upsert_assignments(self,
+                           course_id: int,
+                           assignments: list[dict[str, Any]]) -> int:
+        """
+        Store a course's complete assignment listing: write assignments
+        whose updated_at moved, remove those missing from it. Returns how
+        many rows changed.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def upsert_submissions(self,
+                           course_id: int,
+                           submissions: list[dict[str, Any]]) -> int:
+        """Store the user's submission state; returns how many rows."""
+        raise NotImplementedError
+
+
+class ICourseIndex(ABC):
+    """
+    Small local record of the user's courses (id, name, term) and of their
+    terms (id, name, dates), so resolving the current term, listing terms
+    or looking up known courses needs no course listing while it is fresh.
+    """
+
+    @abstractmethod
+    def load(self) -> Optional[Tuple[List[Course], List[Term]]]:
+        """The stored courses and terms, or None when missing or expired."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def save(self, courses: List[Course], terms: List[Term],
+             current_term_id: Optional[int] = None) -> None:
+        """Replace the stored index with a fresh listing and the term it made current."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def current_term_id(self) -> Optional[int]:
+        """
+        The current term id of the last saved listing, kept even after the
+        index expires: a good first guess while the next listing loads.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def invalidate(self) -> None:
+        """Drop the stored index; the next listing rebuilds it."""
+        raise NotImplementedError
+
 
 class IPresenter(ABC):
     """Abstract interface for presenting output (like for console or JSON)."""
 
+    # Presenters that write one record at a time set this; commands then
+    # feed display_assignment_stream() as assignments arrive.
+    streams_assignments: bool = False
+    # ...and this to get courses in completion order rather than course order
+    stream_in_completion_order: bool = False
+
     @abstractmethod
     def display_courses(self, courses: list[dict[str, Any]]) -> None:
         raise NotImplementedError
@@ -29,6 +118,23 @@ class IPresenter(ABC):
 
     @abstractmethod
     def display_assignments(self,
-                            overdue: list[Assignment],
-                            upcoming: list[Assignment]) -> None:
+                            overdue: Sequence[Assignment],
+                            upcoming: Sequence[Assignment]) -> None:
         raise NotImplementedError
+
+    def display_assignment_stream(self,
+                                  rows: Iterable[Tuple[str, Assignment]]) -> None:
+        """
+        Present ("overdue" | "upcoming", assignment) pairs. The default
+        collects them, sorts each group by due date and defers to
+        display_assignments().
+        """
+        overdue: List[Assignment] = []
+        upcoming: List[Assignment] = []
+        for category, a in rows:
+            (overdue if category == "overdue" else upcoming).append(a)
+
+        def by_due(a: Assignment) -> Tuple[Any, int]:
+            return a.due_at, a.id
+        self.display_assignments(sorted(overdue, key=by_due),
+                                 sorted(upcoming, key=by_due))
@@ -1,72 +1,111 @@
 
 from __future__ import annotations
-from typing import Any, Dict, List, Optional, Iterable
-from .ports import ICanvasClient
-from .models import Course, Assignment
+import sys
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Dict, Iterator, List, Optional, Iterable, Sequence, Tuple, Type
+from .assignment_table import AssignmentTable, WindowClassification
+from .due_index import DueIndex
+from .errors import PartialResultError
+from .ports import ICanvasClient, ICourseIndex, ICourseMirror
+from .models import Course, Assignment, Term
 
 from datetime import datetime, timezone, timedelta
 
-from utils.iso_parser import _parse_iso
+from utils import tracing
+
+
+@dataclass
+class SyncReport:
+    """Row counts written by CourseService.sync()."""
+    courses: int = 0
+    assignments_changed: int = 0
+    submissions: int = 0
+    failed_courses: int = 0
 
 
 class CourseService:
     """
     Application/use-case layer for course-related operations.
     Depends only on the ICanvasClient port.
+
+    Per-course assignment fetches run on a bounded worker pool of at most
+    `max_workers` threads; results are still returned in course order.
+
+    `strategy` picks how assignments are fetched:
+      - "per-course": one assignments listing per current-term course.
+      - "planner":    one planner listing covering every course at once.
+      - "pipelined":  per course, but each fetch starts as soon as its
+                      course arrives instead of after the whole listing.
+
+    `assignment_model` is the class each raw dict or planner item becomes;
+    pass LazyAssignment to defer parsing until fields are read.
+
+    `term_hint` is the current term id from an earlier run, if known (see
+    ICourseIndex.current_term_id); the pipelined strategy then trusts it
+    from the first course page on.
+
+    With `server_filter`, windowed queries of unsubmitted work ask Canvas
+    for the overdue and future assignment buckets only, instead of every
+    assignment in the course (see _assignment_queries). Past-due items that
+    take no online submission are then left out of overdue. Turn it off for
+    clients that don't understand the bucket parameter, or to see those.
+
+    `course_ids` restricts assignment fetches to those courses, whatever
+    their term. They are looked up in `course_index` when one is given,
+    which every course listing keeps up to date, so the listing itself is
+    skipped unless an id is missing from it.
     """
 
-    def __init__(self, client: ICanvasClient):
+    STRATEGIES = ("per-course", "planner", "pipelined")
+
+    def __init__(self,
+                 client: ICanvasClient,
+                 max_workers: int = 4,
+                 strategy: str = "per-course",
+                 assignment_model: Type[Assignment] = Assignment,
+                 term_hint: Optional[int] = None,
+                 server_filter: bool = True,
+                 course_ids: Optional[Sequence[int]] = None,
+                 course_index: Optional[ICourseIndex] = None):
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Unknown strategy {strategy!r}; pick one of {self.STRATEGIES}")
         self._client = client
-
-    def _select_current_term_id(
-        self, courses_payload: Iterable[Dict[str, Any]]
-    ) -> Optional[int]:
+        self._max_workers = max(1, int(max_workers))
+        self._strategy = strategy
+        self._make_assignment = assignment_model.from_api_dict
+        self._make_planner_assignment = assignment_model.from_planner_item
+        self.term_hint = term_hint
+        self._server_filter = server_filter
+        self._course_ids = list(dict.fromkeys(course_ids)) if course_ids else None
+        self._course_index = course_index
+
+    @staticmethod
+    def _select_current_term_id(courses: Iterable[Course], terms: Iterable[Term]) -> Optional[int]:
         """
-        Determine the current enrollment term id by scanning the 'term' object
-        attached to each course (when requested via include[]=term).
+        Determine the current enrollment term id from the terms of the
+        user's courses (parsed once, see _terms_of).
 
-        If multiple match, chooses the one with the latest start_at.
-        Falls back to most-common term id if no active window matches.
+        If multiple terms are active now, chooses the one with the latest
+        start_at. Falls back to the most common term id across courses if
+        no active window matches.
         """
         now = datetime.now(tz=timezone.utc)
-        terms_by_id: Dict[int, Dict[str, Any]] = {}
-        counts: Dict[int, int] = {}
-
-        for c in courses_payload:
-            term = c.get("term")
-            if not isinstance(term, dict):
-                continue
-            tid = term.get("id")
-            if tid is None:
-                continue
-
-            # Keep a canonical copy and count usage
-            if tid not in terms_by_id:
-                terms_by_id[tid] = term
-            counts[tid] = counts.get(tid, 0) + 1
 
         # 1) Prefer terms where now is within [start_at, end_at]
-        active: List[Dict[str, Any]] = []
-        for term in terms_by_id.values():
-            start = _parse_iso(term.get("start_at"))
-            end = _parse_iso(term.get("end_at"))
-            if start and ((end and start <= now <= end)
-                          or (not end and start <= now)):
-                active.append(term)
-
+        active = [t for t in terms if t.is_active(now)]
         if active:
-            # Choose the one with the latest start_at
-            def start_key(t: Dict[str, Any]) -> datetime:
-                return _parse_iso(t.get("start_at")) or now
-
-            best = max(active, key=start_key)
-            best_id = best.get("id")
-            return int(best_id) if best_id is not None else None
+            return max(active, key=lambda t: t.start_at).id
 
         # 2) Fallback: pick the most common term id across courses
+        counts: Dict[int, int] = {}
+        for c in courses:
+            if c.enrollment_term_id is not None:
+                counts[c.enrollment_term_id] = counts.get(c.enrollment_term_id, 0) + 1
         if counts:
-            most_common_id = max(counts, key=counts.get)
-            return int(most_common_id)
+            return int(max(counts, key=counts.get))
 
         return None
 
@@ -75,74 +114,499 @@ class CourseService:
         Returns current-term courses by default.
         If include_archived=True, returns all courses.
         """
+        return self.list_courses_and_terms(include_archived)[0]
+
+    def list_terms(self) -> List[Term]:
+        """Terms of the user's courses, oldest first."""
+        return self.list_courses_and_terms(include_archived=True)[1]
+
+    def list_courses_and_terms(self, include_archived: bool) -> Tuple[List[Course], List[Term]]:
+        """
+        list_courses() and list_terms() from a single course listing, or
+        from the course index while it is fresh.
+        """
+        indexed = self._course_index.load() if self._course_index is not None else None
+        if indexed is not None:
+            courses, terms = indexed
+        else:
+            raw = self._fetch_raw_courses()
+            with tracing.span("parse.courses", count=len(raw)):
+                courses = [Course.from_api(c) for c in raw]
+                terms = self._terms_of(raw)
+            self._remember(courses, terms)
+
+        # Skip filtering courses by term if desired
+        if include_archived:
+            return courses, terms
+
+        return self._current_term_courses(courses, terms), terms
+
+    def _remember(self, courses: List[Course], terms: List[Term]) -> None:
+        if self._course_index is not None:
+            self._course_index.save(courses, terms, self._select_current_term_id(courses, terms))
+
+    def _requested_courses(self) -> List[Course]:
+        """
+        The courses named by `course_ids`, in that order. The course listing
+        is only fetched when the index is missing an id; ids that still
+        aren't among the user's courses are skipped with a warning.
+        """
+        wanted = self._course_ids or []
+        indexed = self._course_index.load() if self._course_index is not None else None
+        known = {c.id: c for c in indexed[0]} if indexed is not None else {}
+        if any(cid not in known for cid in wanted):
+            if self._course_index is not None:
+                # A stale index would only hand the same courses back
+                self._course_index.invalidate()
+            known = {c.id: c for c in self.list_courses(include_archived=True)}
+        for cid in wanted:
+            if cid not in known:
+                print(f"Warning: Course {cid} is not one of your courses; skipping it",
+                      file=sys.stderr)
+        return [known[cid] for cid in wanted if cid in known]
+
+    @staticmethod
+    def _terms_of(raw: List[Dict[str, Any]]) -> List[Term]:
+        by_id: Dict[int, Term] = {}
+        for c in raw:
+            term = c.get("term")
+            if isinstance(term, dict) and term.get("id") is not None and term["id"] not in by_id:
+                by_id[term["id"]] = Term.from_api(term)
+        # Undated terms (e.g. "Default Term") sort first
+        return sorted(by_id.values(),
+                      key=lambda t: (t.start_at is not None, t.start_at or datetime.min, t.id))
+
+    def _iter_raw_courses(self) -> Iterator[Dict[str, Any]]:
+        """Course payloads with their term attached, as pages arrive."""
         params: Dict[str, Any] = {
             "per_page": 100,
             "state[]": "available",
             "include[]": "term",
         }
+        for c in self._client.iter_paginated("/api/v1/courses", params=params):
+            if isinstance(c, dict):
+                yield c
 
+    def _fetch_raw_courses(self) -> List[Dict[str, Any]]:
         # Materialize once; reuse for term detection and model mapping.
-        raw = self._client.get_paginated("/api/v1/courses", params=params)
-        courses = [Course.from_api(c) for c in raw if isinstance(c, dict)]
+        return list(self._iter_raw_courses())
 
-        # Skip filtering courses by term if desired
-        if include_archived:
-            return courses
-
-        current_term_id = self._select_current_term_id(raw)
+    def _current_term_courses(self, courses: List[Course], terms: List[Term]) -> List[Course]:
+        current_term_id = self._select_current_term_id(courses, terms)
         if current_term_id is None:
             # Could not determine a current term, return everything rather
             return courses
 
-        return [c for c in courses if c.enrollment_term_id == current_term_id if isinstance(c, Course)]
+        # Lets the next pipelined listing start fetching right away
+        self.term_hint = current_term_id
+        return [c for c in courses if c.enrollment_term_id == current_term_id]
 
-    def get_assignments(self) -> List[Assignment]:
-        """Fetch all assignments for current-term courses, excluding submitted ones."""
-        assignments: List[Assignment] = []
+    @staticmethod
+    def _warn_course_failure(course: Course, e: Any) -> None:
+        # stderr, so machine-readable output on stdout stays parseable
+        print(
+            f"Warning: Failed to fetch assignments for course "
+            f"{course.id} ({course.name}): {e}",
+            file=sys.stderr,
+        )
 
-        curr_courses: List[Course] = self.list_courses(include_archived=False)
-        for course in curr_courses:
-            course_id = course.id
-            course_name = course.name  # we already have it
-
-            assignment_path = f"/api/v1/courses/{course_id}/assignments"
-            assignment_params = {"include[]": ["submission"], "per_page": 100}
-
-            try:
-                pages = self._client.get_paginated(
-                    assignment_path, params=assignment_params
-                )
-            except Exception as e:
-                print(
-                    f"Warning: Failed to fetch assignments for course "
-                    f"{course_id} ({course_name}): {e}"
-                )
-                continue
-
-            for data in pages:
-                assignment: Assignment = Assignment.from_api_dict(data, course_name)
-                assignments.append(assignment)
+    def _assignment_queries(self, unsubmitted: bool) -> List[Dict[str, Any]]:
+        """
+        Query plan for one course's assignments: the params of each listing
+        to request. Everything by default; for unsubmitted work only, the
+        "overdue" and "future" buckets sorted by due date, which leaves
+        past-due submitted and graded work on the server. The window's lower
+        bound has no server-side equivalent and is still applied by the
+        caller. Clients without buckets (the local mirror) are given
+        server_filter=False by whoever builds the service.
+
+        This narrows the result: Canvas's "overdue" bucket only holds
+        assignments expecting a submission, so past-due items handed in on
+        paper (or taking none) are not listed as overdue, unlike with the
+        full listing. "future" also includes undated items, which the
+        caller drops.
+        """
+        base: Dict[str, Any] = {"include[]": ["submission"], "per_page": 100}
+        if not unsubmitted or not self._server_filter:
+            return [base]
+        return [dict(base, bucket=bucket, order_by="due_at") for bucket in ("overdue", "future")]
+
+    def _iter_course_payloads(self, course: Course,
+                              queries: Optional[List[Dict[str, Any]]]) -> Iterator[Any]:
+        """Raw assignments of every query in turn, each id once."""
+        path = f"/api/v1/courses/{course.id}/assignments"
+        queries = queries or self._assignment_queries(unsubmitted=False)
+        if len(queries) == 1:
+            yield from self._client.iter_paginated(path, params=queries[0])
+            return
+        # Buckets can overlap when an item falls due between two requests
+        seen = set()
+        for params in queries:
+            for data in self._client.iter_paginated(path, params=params):
+                key = data.get("id") if isinstance(data, dict) else None
+                if key is not None:
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                yield data
+
+    def _fetch_course_assignments(self, course: Course,
+                                  queries: Optional[List[Dict[str, Any]]] = None) -> List[Assignment]:
+        """
+        Fetch and parse one course's assignments. On failure, warn and keep
+        whatever pages arrived before it (possibly none).
+        """
+        return self._try_fetch_course_assignments(course, queries)[0]
 
-        return assignments
+    def _try_fetch_course_assignments(self, course: Course,
+                                      queries: Optional[List[Dict[str, Any]]] = None
+                                      ) -> Tuple[List[Assignment], bool]:
+        """Like _fetch_course_assignments, plus whether the listing completed."""
+        course_id = course.id
+        course_name = course.name  # we already have it
 
-    def get_unsubmitted_assignments(self, window_days: int) -> List[Assignment]:
+        # Parse each item as its page streams in instead of after the last one
+        assignments: List[Assignment] = []
+        tracer = tracing.active()
+        parse_ns = 0
+        try:
+            for data in self._iter_course_payloads(course, queries):
+                if tracer is None:
+                    assignments.append(self._make_assignment(data, course_name))
+                    continue
+                # Parsing interleaves with page fetches; time it separately
+                t0 = time.perf_counter_ns()
+                assignments.append(self._make_assignment(data, course_name))
+                parse_ns += time.perf_counter_ns() - t0
+        except PartialResultError as e:
+            self._warn_course_failure(
+                course, f"{e} (kept {len(assignments)} assignment(s); resume at {e.resume_url})"
+            )
+            return assignments, False
+        except Exception as e:
+            self._warn_course_failure(course, e)
+            return [], False
+        finally:
+            if tracer is not None:
+                tracer.record("parse.assignments", time.perf_counter_ns() - parse_ns, parse_ns,
+                              course_id=course_id, count=len(assignments))
+
+        return assignments, True
+
+    def _fetch_raw_assignments(self, course: Course,
+                               queries: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
         """
-        Fetches all most recent unsubmitted assignments
+        The network half of _fetch_course_assignments: raw payloads only,
+        so parsing can run elsewhere. Same failure handling.
+        """
+        rows: List[Dict[str, Any]] = []
+        try:
+            for data in self._iter_course_payloads(course, queries):
+                rows.append(data)
+        except PartialResultError as e:
+            self._warn_course_failure(
+                course, f"{e} (kept {len(rows)} assignment(s); resume at {e.resume_url})"
+            )
+        except Exception as e:
+            self._warn_course_failure(course, e)
+            return []
+        return rows
+
+    def _parse_assignments(self, course: Course, rows: List[Dict[str, Any]]) -> List[Assignment]:
+        with tracing.span("parse.assignments", course_id=course.id, count=len(rows)):
+            return [self._make_assignment(data, course.name) for data in rows]
+
+    def get_assignments_by_course(self, courses: List[Course]) -> Dict[int, List[Assignment]]:
         """
-        all_assignments: List[Assignment] = self.get_assignments()
-        unsubmitted: List[Assignment] = []
+        Fetch the given courses' assignments concurrently, keyed by course id.
+        Courses whose listing did not complete are left out, so callers can
+        keep the data they already have for them.
+        """
+        if not courses:
+            return {}
+        out: Dict[int, List[Assignment]] = {}
+        workers = min(self._max_workers, len(courses))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for course, (rows, complete) in zip(
+                courses, pool.map(self._try_fetch_course_assignments, courses)
+            ):
+                if complete:
+                    out[course.id] = rows
+        return out
+
+    def _fetch_submissions(self, course: Course) -> Optional[List[Dict[str, Any]]]:
+        """The user's raw submissions in one course, or None after a warning."""
+        return self._fetch_raw(
+            course,
+            f"/api/v1/courses/{course.id}/students/submissions",
+            {"student_ids[]": "self", "per_page": 100},
+        )
+
+    def get_submission_states(self, courses: List[Course]) -> Dict[int, Dict[str, Any]]:
+        """
+        The user's current submission per assignment id across `courses`;
+        much lighter than refetching the assignments themselves.
+        """
+        if not courses:
+            return {}
+        states: Dict[int, Dict[str, Any]] = {}
+        workers = min(self._max_workers, len(courses))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for subs in pool.map(self._fetch_submissions, courses):
+                for sub in subs or []:
+                    if sub.get("assignment_id") is not None:
+                        states[int(sub["assignment_id"])] = sub
+        return states
+
+    def get_assignments(self, since: Optional[datetime] = None,
+                        unsubmitted: bool = False) -> List[Assignment]:
+        """
+        Fetch all assignments for current-term courses.
 
-        now = datetime.now(timezone.utc)
-        for assignment in all_assignments:
-            if not assignment.due_at:
-                continue
+        :param since: Lets the planner strategy skip items due before this;
+                      the per-course strategies always return everything.
+        :param unsubmitted: The caller only wants unsubmitted, dated work, so
+                            the per-course strategies may leave the rest out.
+        """
+        return list(self.iter_assignments(since, unsubmitted=unsubmitted))
 
-            window_end = assignment.due_at + timedelta(days=window_days)
+    def iter_assignments(self, since: Optional[datetime] = None,
+                         ordered: bool = True,
+                         unsubmitted: bool = False) -> Iterator[Assignment]:
+        """
+        Like get_assignments(), but yields each course's assignments as soon
+        as that course (and every course before it) has been fetched.
 
-            # If assignment has been submitted or passed window, then skip
-            if assignment.is_submitted() or now > window_end:
+        :param ordered: False yields courses in completion order instead, so
+                        one slow course no longer holds back the rest.
+        """
+        queries = self._assignment_queries(unsubmitted)
+        if self._course_ids is not None:
+            curr_courses: List[Course] = self._requested_courses()
+        elif self._strategy == "pipelined":
+            yield from self._iter_pipelined(ordered, queries)
+            return
+        else:
+            curr_courses = self.list_courses(include_archived=False)
+        if not curr_courses:
+            return
+
+        if self._strategy == "planner":
+            yield from self._get_planner_assignments(curr_courses, since)
+            return
+
+        # map() yields in input order, so output stays deterministic no
+        # matter which course finishes first.
+        fetch = partial(self._fetch_course_assignments, queries=queries)
+        workers = min(self._max_workers, len(curr_courses))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            if ordered:
+                chunks: Iterable[List[Assignment]] = pool.map(fetch, curr_courses)
+            else:
+                chunks = (f.result() for f in as_completed(
+                    [pool.submit(fetch, c) for c in curr_courses]))
+            for course_assignments in chunks:
+                yield from course_assignments
+
+    def _iter_pipelined(self, ordered: bool,
+                        queries: List[Dict[str, Any]]) -> Iterator[Assignment]:
+        """
+        iter_assignments() with the course listing and the assignment
+        fetches overlapped: a course's fetch is queued as soon as it arrives
+        if it belongs to the term believed current, i.e. `term_hint` or,
+        without one, the latest-starting active term seen so far. Once the
+        listing ends the real current term is picked as usual; courses the
+        guess missed are queued then, and fetches it got wrong are dropped.
+        Workers only fetch; payloads are parsed here, on the consumer side.
+        With a fresh course index there is no listing to overlap with.
+        """
+        now = datetime.now(tz=timezone.utc)
+        guess = self.term_hint
+        guess_start: Optional[datetime] = None
+        seen_terms: Dict[int, Term] = {}
+        raw: List[Dict[str, Any]] = []
+        courses: List[Course] = []
+        fetches: Dict[int, Future] = {}
+        indexed = self._course_index.load() if self._course_index is not None else None
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as pool:
+            def queue(course: Course) -> None:
+                if course.id not in fetches:
+                    fetches[course.id] = pool.submit(self._fetch_raw_assignments, course, queries)
+
+            if indexed is not None:
+                current = self._current_term_courses(*indexed)
+            else:
+                with tracing.span("fetch.courses") as span:
+                    for c in self._iter_raw_courses():
+                        raw.append(c)
+                        courses.append(Course.from_api(c))
+                        term = c.get("term")
+                        if (self.term_hint is None and isinstance(term, dict)
+                                and term.get("id") is not None and term["id"] not in seen_terms):
+                            t = seen_terms[term["id"]] = Term.from_api(term)
+                            if t.is_active(now) and (guess_start is None or t.start_at > guess_start):
+                                guess, guess_start = t.id, t.start_at
+                                # Courses already seen may belong to the new guess
+                                for seen in courses[:-1]:
+                                    if seen.enrollment_term_id == guess:
+                                        queue(seen)
+                        if guess is not None and courses[-1].enrollment_term_id == guess:
+                            queue(courses[-1])
+                    if span:
+                        span.set(count=len(raw), queued_early=len(fetches))
+                terms = self._terms_of(raw)
+                self._remember(courses, terms)
+                current = self._current_term_courses(courses, terms)
+
+            for course in current:
+                queue(course)
+            wanted = {c.id for c in current}
+            for cid, fetch in fetches.items():
+                if cid not in wanted:
+                    fetch.cancel()
+
+            if ordered:
+                for course in current:
+                    yield from self._parse_assignments(course, fetches[course.id].result())
+            else:
+                by_fetch = {fetches[c.id]: c for c in current}
+                for fetch in as_completed(by_fetch):
+                    yield from self._parse_assignments(by_fetch[fetch], fetch.result())
+
+    def _get_planner_assignments(
+        self, courses: List[Course], since: Optional[datetime]
+    ) -> List[Assignment]:
+        """
+        Fetch due work for every course in one planner stream instead of one
+        assignments listing per course. Results are grouped in course order
+        to match the per-course strategy. If the stream fails, warn and keep
+        the items that arrived before it.
+        """
+        params: Dict[str, Any] = {
+            "per_page": 100,
+            "context_codes[]": [f"course_{c.id}" for c in courses],
+        }
+        if since is not None:
+            params["start_date"] = since.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+        names = {c.id: c.name for c in courses}
+        by_course: Dict[int, List[Assignment]] = {c.id: [] for c in courses}
+
+        kept = 0
+        try:
+            for item in self._client.iter_paginated("/api/v1/planner/items", params=params):
+                course_id = item.get("course_id") if isinstance(item, dict) else None
+                if course_id not in by_course:
+                    continue
+                assignment = self._make_planner_assignment(item, names[course_id])
+                if assignment is not None:
+                    by_course[course_id].append(assignment)
+                    kept += 1
+        except PartialResultError as e:
+            print(f"Warning: Failed to fetch planner items: {e} "
+                  f"(kept {kept} assignment(s); resume at {e.resume_url})", file=sys.stderr)
+        except Exception as e:
+            print(f"Warning: Failed to fetch planner items: {e} (kept {kept} assignment(s))",
+                  file=sys.stderr)
+
+        return [a for c in courses for a in by_course[c.id]]
+
+    def classify_assignments(
+        self, window_days: int, now: Optional[datetime] = None
+    ) -> Tuple[AssignmentTable, WindowClassification]:
+        """
+        Fetch current-term assignments into a columnar table and split them
+        into overdue / upcoming / out-of-window against one reference time.
+        """
+        now = now or datetime.now(timezone.utc)
+        assignments = self.get_assignments(since=now - timedelta(days=window_days), unsubmitted=True)
+        with tracing.span("filter.classify", rows=len(assignments)):
+            table = AssignmentTable(assignments)
+            return table, table.classify(window_days, now)
+
+    def due_windows(self, window_days: int, now: Optional[datetime] = None
+                    ) -> Tuple[List[Any], List[Any]]:
+        """Unsubmitted (overdue, upcoming) assignments, each sorted by due date."""
+        table, classes = self.classify_assignments(window_days, now)
+        # Sorted by due date; the range queries are bisects on the index
+        with tracing.span("filter.index"):
+            index = DueIndex(table.view(classes.in_window))
+            return (index.overdue_within(window_days, classes.now),
+                    index.due_after(classes.now))
+
+    def iter_due_windows(self, window_days: int, now: Optional[datetime] = None,
+                         ordered: bool = True) -> Iterator[Tuple[str, Any]]:
+        """
+        Unsubmitted ("overdue" | "upcoming", assignment) pairs, streamed as
+        courses arrive: in course order (or completion order when not
+        `ordered`) rather than due order, but the first rows are out before
+        the last course has been fetched.
+        """
+        now = now or datetime.now(timezone.utc)
+        start = now - timedelta(days=window_days)
+        for a in self.iter_assignments(since=start, ordered=ordered, unsubmitted=True):
+            due = a.due_at
+            if due is None or due < start or a.is_submitted():
                 continue
+            yield ("overdue" if due < now else "upcoming"), a
 
-            unsubmitted.append(assignment)
-
-        return unsubmitted
+    def get_unsubmitted_assignments(self, window_days: int) -> List[Assignment]:
+        """
+        Fetches all most recent unsubmitted assignments
+        """
+        table, classes = self.classify_assignments(window_days)
+        return list(table.view(classes.in_window))
+
+    def _fetch_raw(self, course: Course, path: str, params: Dict[str, Any]
+                   ) -> Optional[List[Dict[str, Any]]]:
+        """Raw payloads of one course endpoint, or None after a warning."""
+        try:
+            return [d for d in self._client.iter_paginated(path, params=params)
+                    if isinstance(d, dict)]
+        except Exception as e:
+            self._warn_course_failure(course, e)
+            return None
+
+    def sync(self, mirror: ICourseMirror, submissions_only: bool = False) -> SyncReport:
+        """
+        Refresh a local mirror. A full sync stores every available course and
+        the current-term assignments, of which the mirror only rewrites those
+        whose updated_at moved. With submissions_only=True, only the user's
+        submission state is refreshed for the current-term courses the
+        mirror already knows about.
+        """
+        report = SyncReport()
+
+        if submissions_only:
+            courses = CourseService(mirror).list_courses(include_archived=False)
+        else:
+            raw = self._fetch_raw_courses()
+            report.courses = mirror.upsert_courses(raw)
+            every, terms = [Course.from_api(c) for c in raw], self._terms_of(raw)
+            self._remember(every, terms)
+            courses = self._current_term_courses(every, terms)
+
+        def fetch(course: Course) -> Optional[List[Dict[str, Any]]]:
+            if submissions_only:
+                return self._fetch_submissions(course)
+            return self._fetch_raw(
+                course,
+                f"/api/v1/courses/{course.id}/assignments",
+                {"include[]": ["submission"], "per_page": 100},
+            )
+
+        if not courses:
+            return report
+
+        workers = min(self._max_workers, len(courses))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for course, payload in zip(courses, pool.map(fetch, courses)):
+                if payload is None:
+                    report.failed_courses += 1
+                elif submissions_only:
+                    report.submissions += mirror.upsert_submissions(course.id, payload)
+                else:
+                    report.assignments_changed += mirror.upsert_assignments(course.id, payload)
+
+        return report
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from .due_index import DueIndex
+from .models import Course, Term
+from .services import CourseService
+
+# Seconds between refreshes of each resource: submissions change often,
+# assignments sometimes, the course list a few times a term.
+DEFAULT_INTERVALS: Dict[str, float] = {
+    "courses": 6 * 3600,
+    "assignments": 15 * 60,
+    "submissions": 60,
+}
+
+# Seconds before a resource whose refresh failed is tried again
+RETRY_DELAY = 60.0
+
+
+class AssignmentWatcher:
+    """
+    Keeps courses and assignments in memory between polls and refreshes
+    each resource on its own interval. poll() reports whether the visible
+    overdue/upcoming set changed, so callers only re-render when it did.
+    """
+
+    def __init__(self,
+                 service: CourseService,
+                 window_days: int,
+                 intervals: Optional[Dict[str, float]] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self._service = service
+        self.window_days = window_days
+        self.intervals = dict(DEFAULT_INTERVALS, **(intervals or {}))
+        self._clock = clock
+
+        self._next_due: Dict[str, float] = {name: 0.0 for name in self.intervals}
+        self._courses: List[Course] = []
+        self._ids_by_course: Dict[int, Set[int]] = {}
+        self._index = DueIndex()
+        self._fingerprint: Optional[Tuple[Any, ...]] = None
+
+        self.terms: List[Term] = []
+        self.overdue: List[Any] = []
+        self.upcoming: List[Any] = []
+
+    @property
+    def courses(self) -> List[Course]:
+        """Current-term courses as of the last courses refresh."""
+        return list(self._courses)
+
+    def _is_due(self, resource: str, now: float) -> bool:
+        return now >= self._next_due[resource]
+
+    def _done(self, resource: str, now: float) -> None:
+        self._next_due[resource] = now + self.intervals[resource]
+
+    def seconds_until_next(self) -> float:
+        """How long the caller can sleep before something needs polling."""
+        return max(0.0, min(self._next_due.values()) - self._clock())
+
+    def sleep_interval(self) -> float:
+        """
+        seconds_until_next() kept between one second and one minute: waking
+        at least once a minute lets items roll from upcoming to overdue.
+        """
+        return min(60.0, max(1.0, self.seconds_until_next()))
+
+    def _refresh_courses(self, now: float) -> None:
+        courses, self.terms = self._service.list_courses_and_terms(include_archived=False)
+        if [c.id for c in courses] != [c.id for c in self._courses]:
+            # New or dropped courses: refetch assignments right away
+            self._next_due["assignments"] = 0.0
+            for gone in set(self._ids_by_course) - {c.id for c in courses}:
+                for aid in self._ids_by_course.pop(gone):
+                    self._index.remove(aid)
+        self._courses = courses
+        self._done("courses", now)
+
+    def _refresh_assignments(self, now: float) -> None:
+        fetched = self._service.get_assignments_by_course(self._courses)
+        for course_id, rows in fetched.items():
+            fresh = {a.id for a in rows}
+            for aid in self._ids_by_course.get(course_id, set()) - fresh:
+                self._index.remove(aid)
+            for a in rows:
+                self._index.upsert(a)
+            self._ids_by_course[course_id] = fresh
+        # Assignment listings carry submissions, so those are fresh too
+        self._done("assignments", now)
+        self._done("submissions", now)
+
+    def _refresh_submissions(self, now: float) -> None:
+        states = self._service.get_submission_states(self._courses)
+        for a in list(self._index):
+            sub = states.get(a.id)
+            if sub is not None and sub.get("workflow_state") != a.submission_workflow_state:
+                self._index.upsert(a.with_submission(sub))
+        self._done("submissions", now)
+
+    def poll(self, now: Optional[datetime] = None) -> bool:
+        """
+        Refresh whatever is due; True when the visible result set changed.
+        A failed refresh raises and leaves overdue/upcoming as they were.
+        """
+        tick = self._clock()
+        try:
+            if self._is_due("courses", tick):
+                self._refresh_courses(tick)
+            if self._is_due("assignments", tick):
+                self._refresh_assignments(tick)
+            elif self._is_due("submissions", tick):
+                self._refresh_submissions(tick)
+        except Exception:
+            # Keep the last results; whatever is still due waits RETRY_DELAY
+            # rather than being retried the moment the caller wakes up
+            for resource, due in self._next_due.items():
+                if due <= tick:
+                    self._next_due[resource] = tick + min(RETRY_DELAY, self.intervals[resource])
+            raise
+
+        now = now or datetime.now(timezone.utc)
+        self.overdue = [a for a in self._index.overdue_within(self.window_days, now)
+                        if not a.is_submitted()]
+        self.upcoming = [a for a in self._index.due_after(now) if not a.is_submitted()]
+
+        fingerprint = tuple(
+            (a.id, a.title, a.due_at) for a in self.overdue
+        ) + (None,) + tuple((a.id, a.title, a.due_at) for a in self.upcoming)
+        changed = fingerprint != self._fingerprint
+        self._fingerprint = fingerprint
+        return changed
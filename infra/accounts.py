@@ -0,0 +1,54 @@
+import json
+import os
+from dataclasses import dataclass
+from typing import List, Optional
+
+
+@dataclass(frozen=True)
+class Account:
+    name: str
+    base_url: str
+    token: str
+    # Why this entry can't be used; set instead of base_url/token
+    error: Optional[str] = None
+
+
+def load_accounts(path: str) -> List[Account]:
+    """
+    Read a JSON list of accounts:
+
+        [{"name": "ru", "base_url": "https://reykjavik.instructure.com/",
+          "token_env": "RU_CANVAS_TOKEN"}, ...]
+
+    Each entry gives either "token" or "token_env" (the name of an
+    environment variable holding it), so the file itself can stay secret-free.
+
+    A malformed entry doesn't fail the whole file: it comes back with
+    `error` set, so the other accounts still run. Only an unreadable file or
+    one that isn't a list raises ValueError/OSError.
+    """
+    with open(path, encoding="utf-8") as fh:
+        entries = json.load(fh)
+    if not isinstance(entries, list):
+        raise ValueError(f"{path}: expected a JSON list of accounts")
+
+    accounts: List[Account] = []
+    for i, entry in enumerate(entries):
+        if not isinstance(entry, dict):
+            accounts.append(Account(name=f"account-{i + 1}", base_url="", token="",
+                                    error="expected an object with base_url and token/token_env"))
+            continue
+        name = entry.get("name") or f"account-{i + 1}"
+        token = entry.get("token")
+        if not token and entry.get("token_env"):
+            token = os.getenv(entry["token_env"])
+            if not token:
+                accounts.append(Account(name=name, base_url="", token="",
+                                        error=f"environment variable {entry['token_env']} is not set"))
+                continue
+        if not token or not entry.get("base_url"):
+            accounts.append(Account(name=name, base_url="", token="",
+                                    error="needs base_url and token/token_env"))
+            continue
+        accounts.append(Account(name=name, base_url=entry["base_url"], token=token))
+    return accounts
@@ -1,18 +1,144 @@
+import threading
+from requests import Request, Response, Session, RequestException
+from requests.adapters import HTTPAdapter
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlsplit, urlunsplit, parse_qsl, urlencode
+from typing import Iterator, Any, Dict, List, Optional, Tuple
+from core.errors import PartialResultError
+from core.ports import ICanvasClient  # import your interface
+from infra.http_cache import CachedResponse, DiskResponseCache
+from infra.rate_limit import AdaptiveRateLimiter, shared_limiter
+from infra.retry import RETRYABLE_STATUSES, RetryPolicy
+from utils import tracing
 
-from requests import Response, Session, RequestException
 
-from urllib.parse import urljoin
-from typing import Iterable, Any, Optional
-from core.ports import ICanvasClient  # import your interface
+def _page_number(url: Optional[str]) -> Optional[int]:
+    """Numeric `page` query value of a Link URL, or None (e.g. bookmarks)."""
+    if not url:
+        return None
+    for key, value in parse_qsl(urlsplit(url).query, keep_blank_values=True):
+        if key == "page":
+            try:
+                return int(value)
+            except ValueError:
+                return None
+    return None
+
+
+def _url_template(url: str) -> str:
+    """'/api/v1/courses/123/assignments?page=2' -> '/api/v1/courses/:id/assignments'."""
+    return "/".join(":id" if seg.isdigit() else seg for seg in urlsplit(url).path.split("/"))
+
+
+def _with_page(url: str, page: int) -> str:
+    """Return `url` with its `page` query value replaced by `page`."""
+    parts = urlsplit(url)
+    query = [(k, str(page) if k == "page" else v)
+             for k, v in parse_qsl(parts.query, keep_blank_values=True)]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def _remaining_page_urls(links: Dict[str, Dict[str, str]]) -> Optional[List[str]]:
+    """
+    Build the URLs of every page after the current one from the 'last'
+    relation. Returns None when the total is unknown (Canvas omits 'last' on
+    expensive endpoints, or uses opaque bookmarks instead of page numbers).
+    """
+    last_url = links.get("last", {}).get("url")
+    last_page = _page_number(last_url)
+    if last_url is None or last_page is None:
+        return None
+
+    current = _page_number(links.get("current", {}).get("url"))
+    if current is None:
+        current = _page_number(links.get("first", {}).get("url")) or 1
+
+    return [_with_page(last_url, n) for n in range(current + 1, last_page + 1)]
+
+
+def _full_url(url: str, params: Optional[dict]) -> str:
+    """`url` with `params` encoded into its query string."""
+    if not params:
+        return url
+    return Request("GET", url, params=params).prepare().url
+
+
+_adapters: Dict[str, Tuple[HTTPAdapter, int]] = {}
+_adapters_lock = threading.Lock()
+
+
+def pooled_session(base_url: str, pool_size: int = 32) -> Session:
+    """
+    A new unauthenticated Session mounted on the connection pool shared by
+    every client of this Canvas host. Each client gets its own Session, and
+    so its own cookie jar, while connections are reused across all of them.
+    Clients using it send their token per request instead of on the session.
+
+    `pool_size` is how many requests to the host may run at once; a later
+    caller asking for more gets a larger pool.
+    """
+    host = urlsplit(base_url).netloc
+    with _adapters_lock:
+        adapter, size = _adapters.get(host, (None, 0))
+        if adapter is None or size < pool_size:
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+            _adapters[host] = adapter, pool_size
+    session = Session()
+    session.headers.update({"Accept": "application/json"})
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _is_throttled(resp: Response) -> bool:
+    """Canvas answers 403 'Rate Limit Exceeded' when the bucket runs dry."""
+    if resp.status_code == 429:
+        return True
+    return resp.status_code == 403 and "rate limit exceeded" in (resp.text or "").lower()
 
 
 class CanvasHTTPClient(ICanvasClient):
-    """Concrete implementation that talks to the real Canvas API."""
+    """
+    Concrete implementation that talks to the real Canvas API.
+
+    With page_workers > 1, pages 2..N of a listing are fetched concurrently
+    once the first response reveals the 'last' page, and merged in page order.
+
+    With a `cache`, pages are served from disk while fresh and revalidated
+    with If-None-Match / If-Modified-Since once stale.
+
+    Every request goes through a rate `limiter` (the process-wide one by
+    default) that adapts concurrency to Canvas's throttling headers.
 
-    def __init__(self, base_url: str, token: str):
+    Pass a `session` from pooled_session() to share one connection pool
+    between clients of the same host; the token is then sent per request.
+
+    Connection errors, throttling and 5xx responses are retried per the
+    `retry` policy. Once retries run out, pagination raises
+    PartialResultError carrying the items so far and the failing page's URL.
+    """
+
+    def __init__(self,
+                 base_url: str,
+                 token: str,
+                 page_workers: int = 1,
+                 cache: Optional[DiskResponseCache] = None,
+                 limiter: Optional[AdaptiveRateLimiter] = None,
+                 retry: Optional[RetryPolicy] = None,
+                 session: Optional[Session] = None):
         self.base_url = base_url
-        self._session = self.__create_session(token)
+        self.page_workers = max(1, int(page_workers))
+        self.retry = retry if retry is not None else RetryPolicy()
+        self._cache = cache
+        self._limiter = limiter if limiter is not None else shared_limiter()
+        if session is None:
+            self._session = self.__create_session(token)
+            self._auth_headers: Dict[str, str] = {}
+        else:
+            self._session = session
+            self._auth_headers = {"Authorization": f"Bearer {token}"}
 
     def __create_session(self, token):
         """Initializes a requests session with authentication headers."""
@@ -21,32 +147,155 @@ class CanvasHTTPClient(ICanvasClient):
             "Accept": "application/json",
             "Authorization": f"Bearer {token}",
         })
+        # The limiter may let up to max_limit requests run at once; a smaller
+        # pool (requests defaults to 10) would keep discarding connections
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self._limiter.max_limit)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
         return session
 
-    def get_paginated(self,
-                      path: str,
-                      params: Optional[dict] = None) -> Iterable[Any]:
-        """Implements the abstract method — fetches pages from the API."""
-        ret_data = list()
+    def _fetch_page(self,
+                    url: str,
+                    params: Optional[dict] = None) -> Tuple[Any, Dict[str, Dict[str, str]]]:
+        """GET one page; returns the decoded body and its Link relations."""
+        cache = self._cache
+        entry = cache.get(url, params) if cache is not None else None
+        if entry is not None and cache.is_fresh(url, entry):
+            with tracing.span("http.cache_hit") as span:
+                if span:
+                    span.set(url=_url_template(url))
+            return entry.body, entry.links
+
+        headers: Dict[str, str] = dict(self._auth_headers)
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+
+        resp = self._send(url, params, headers)
+        if entry is not None and resp.status_code == 304:
+            cache.touch(url, params, entry)
+            return entry.body, entry.links
+
+        resp.raise_for_status()
+        with tracing.span("json.decode") as span:
+            data = resp.json()
+            if span:
+                span.set(bytes=len(resp.content))
+
+        if cache is not None:
+            cache.put(url, params, CachedResponse(
+                body=data,
+                links=resp.links,
+                etag=resp.headers.get("ETag"),
+                last_modified=resp.headers.get("Last-Modified"),
+                stored_at=time.time(),
+            ))
+        return data, resp.links
+
+    def _send(self, url: str, params: Optional[dict], headers: Dict[str, str]) -> Response:
+        """GET through the rate limiter, retrying transient failures."""
+        attempt = 0
+        while True:
+            try:
+                with self._limiter.slot(), tracing.span("http.request") as span:
+                    resp: Response = self._session.get(url, params=params, headers=headers)
+                    throttled = _is_throttled(resp)
+                    self._limiter.observe(resp.headers, throttled=throttled)
+                    if span:
+                        span.set(url=_url_template(url), page=_page_number(url) or 1,
+                                 attempt=attempt, status=resp.status_code, bytes=len(resp.content))
+            except RequestException:
+                if attempt >= self.retry.max_retries:
+                    raise
+                attempt += 1
+                time.sleep(self.retry.delay(attempt))
+                continue
+
+            retryable = throttled or resp.status_code in RETRYABLE_STATUSES
+            if not retryable or attempt >= self.retry.max_retries:
+                return resp
+            attempt += 1
+
+            retry_after = resp.headers.get("Retry-After")
+            # After a throttle the limiter already holds every caller back
+            if retry_after or not throttled:
+                time.sleep(self.retry.delay(attempt, retry_after))
+
+    @staticmethod
+    def _items(data: Any) -> List[Any]:
+        """A page body as a list of items (single-object pages become one)."""
+        return data if isinstance(data, list) else [data]
+
+    def iter_paginated(self,
+                       path: str,
+                       params: Optional[dict] = None) -> Iterator[Any]:
+        """
+        Streams items page by page. The next page is only requested once the
+        caller has consumed every item of the current one, unless parallel
+        page fetching kicks in (see class docstring).
+
+        `path` may also be a PartialResultError.resume_url to continue an
+        interrupted listing.
+        """
         url = urljoin(self.base_url, path)
+        first = True
 
         while url:
             try:
-                resp: Response = self._session.get(url, params=params)
-                resp.raise_for_status()
-                data = resp.json()
-
-                if isinstance(data, list):
-                    ret_data.extend(data)
-                else:
-                    ret_data.append(data)
-
-                # Get the URL for the next page from the 'Link' header
-                url = resp.links.get("next", {}).get("url")
-                # Following requests use the full URL, params is not needed
-                params = None
+                data, links = self._fetch_page(url, params)
             except RequestException as e:
-                print(f"API request failed: {e}")
-                break
+                raise PartialResultError(f"API request failed: {e}",
+                                         resume_url=_full_url(url, params)) from e
+
+            # Get the URL for the next page from the 'Link' header
+            url = links.get("next", {}).get("url")
+            # Following requests use the full URL, params is not needed
+            params = None
+
+            remaining = (_remaining_page_urls(links)
+                         if first and url and self.page_workers > 1 else None)
+            first = False
 
-        return ret_data
+            if remaining:
+                yield from self._iter_remaining(data, remaining)
+                return
+
+            yield from self._items(data)
+
+    def _iter_remaining(self, first_page: Any, urls: List[str]) -> Iterator[Any]:
+        """
+        Yield the first page's items while pages `urls` are fetched
+        concurrently, then yield those pages in page order.
+        """
+        pool = ThreadPoolExecutor(max_workers=min(self.page_workers, len(urls)))
+        try:
+            futures = [pool.submit(self._fetch_page, u) for u in urls]
+            yield from self._items(first_page)
+            for url, future in zip(urls, futures):
+                try:
+                    data, _ = future.result()
+                except RequestException as e:
+                    # Later pages are dropped; resuming re-walks them via 'next'
+                    raise PartialResultError(f"API request failed: {e}",
+                                             resume_url=url) from e
+                yield from self._items(data)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def get_paginated(self,
+                      path: str,
+                      params: Optional[dict] = None) -> List[Any]:
+        """
+        Implements the abstract method — fetches every page into a list.
+        Raises PartialResultError (with the items collected so far) when a
+        page fails after all retries.
+        """
+        items: List[Any] = []
+        try:
+            items.extend(self.iter_paginated(path, params))
+        except PartialResultError as e:
+            raise PartialResultError(str(e), items=items,
+                                     resume_url=e.resume_url) from e.__cause__
+        return items
@@ -0,0 +1,68 @@
+import json
+import os
+import time
+from typing import List, Optional, Tuple
+
+from core.models import Course, Term
+from core.ports import ICourseIndex
+
+
+class JSONCourseIndex(ICourseIndex):
+    """
+    The user's courses and terms as one small JSON file, rewritten after
+    every course listing. A missing, unreadable or expired file just means
+    "no index".
+    """
+
+    def __init__(self, path: str, max_age: float = 6 * 3600):
+        """
+        :param path:    File to keep the index in (its directory is created).
+        :param max_age: Seconds a saved index is trusted for; like the
+                        response cache's TTL for the course listing.
+        """
+        self.path = path
+        self.max_age = max_age
+
+    def load(self) -> Optional[Tuple[List[Course], List[Term]]]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if time.time() - data["saved_at"] >= self.max_age:
+                return None
+            return ([Course.from_api(c) for c in data["courses"]],
+                    [Term.from_api(t) for t in data["terms"]])
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+
+    def current_term_id(self) -> Optional[int]:
+        # Deliberately ignores max_age; it is only ever used as a guess
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                term_id = json.load(f).get("current_term_id")
+            return int(term_id) if term_id is not None else None
+        except (OSError, ValueError, TypeError, AttributeError):
+            return None
+
+    def save(self, courses: List[Course], terms: List[Term],
+             current_term_id: Optional[int] = None) -> None:
+        data = {
+            "saved_at": time.time(),
+            "courses": [c.to_record() for c in courses],
+            "terms": [t.to_record() for t in terms],
+            "current_term_id": current_term_id,
+        }
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp = f"{self.path}.{os.getpid()}.{time.monotonic_ns()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, self.path)
+        except OSError:
+            # Only a shortcut; the next listing tries again
+            pass
+
+    def invalidate(self) -> None:
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
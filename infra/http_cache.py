@@ -0,0 +1,146 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field, asdict
+from fnmatch import fnmatch
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+# Freshness per endpoint (seconds). First matching path pattern wins; entries
+# older than this are revalidated with If-None-Match / If-Modified-Since.
+DEFAULT_TTLS: Dict[str, float] = {
+    "/api/v1/courses": 6 * 3600,
+    "/api/v1/courses/*/assignments": 5 * 60,
+}
+
+
+@dataclass
+class CachedResponse:
+    """One stored page: decoded body, Link relations and validators."""
+    body: Any
+    links: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    stored_at: float = 0.0
+
+
+class DiskResponseCache:
+    """
+    Disk-backed response cache keyed on URL + query params.
+
+    Each entry is one JSON file; the file's mtime doubles as its last-access
+    time so eviction drops the least recently used entries once the total
+    size exceeds `max_bytes`. The total is tracked as entries are written,
+    so the directory is only scanned once up front and when evicting.
+    """
+
+    def __init__(self,
+                 directory: str,
+                 max_bytes: int = 50 * 1024 * 1024,
+                 ttls: Optional[Dict[str, float]] = None,
+                 refresh: bool = False):
+        """
+        :param directory: Where entries are stored (created if missing).
+        :param max_bytes: Size budget before LRU eviction kicks in.
+        :param ttls:      Path pattern -> seconds an entry counts as fresh.
+        :param refresh:   Ignore stored entries (but still write new ones).
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttls = DEFAULT_TTLS if ttls is None else ttls
+        self.refresh = refresh
+        os.makedirs(directory, exist_ok=True)
+        self._size: Optional[int] = None  # bytes on disk, scanned on first put
+        self._size_lock = threading.Lock()
+
+    @staticmethod
+    def _key(url: str, params: Optional[dict]) -> str:
+        raw = json.dumps([url, params or {}], sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, url: str, params: Optional[dict]) -> str:
+        return os.path.join(self.directory, self._key(url, params) + ".json")
+
+    def ttl_for(self, url: str) -> float:
+        """Freshness lifetime for `url`; 0 means always revalidate."""
+        path = urlsplit(url).path
+        for pattern, ttl in self.ttls.items():
+            if fnmatch(path, pattern):
+                return ttl
+        return 0.0
+
+    def is_fresh(self, url: str, entry: CachedResponse) -> bool:
+        return time.time() - entry.stored_at < self.ttl_for(url)
+
+    def get(self, url: str, params: Optional[dict] = None) -> Optional[CachedResponse]:
+        """Return the stored entry (and mark it recently used), or None."""
+        if self.refresh:
+            return None
+        path = self._path(url, params)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = CachedResponse(**json.load(f))
+            os.utime(path)
+        except (OSError, ValueError, TypeError):
+            return None
+        return entry
+
+    def put(self, url: str, params: Optional[dict], entry: CachedResponse) -> None:
+        """Store `entry` atomically, then evict down to the size budget."""
+        path = self._path(url, params)
+        tmp = f"{path}.{os.getpid()}.{time.monotonic_ns()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(asdict(entry), f)
+        written = os.path.getsize(tmp)
+        try:
+            replaced = os.path.getsize(path)
+        except FileNotFoundError:
+            replaced = 0
+        os.replace(tmp, path)
+
+        with self._size_lock:
+            if self._size is None:
+                self._size = self._scan()[1]
+            else:
+                self._size += written - replaced
+            if self._size > self.max_bytes:
+                self._size = self._evict()
+
+    def touch(self, url: str, params: Optional[dict], entry: CachedResponse) -> None:
+        """Restart an entry's freshness window after a 304 Not Modified."""
+        entry.stored_at = time.time()
+        self.put(url, params, entry)
+
+    def _scan(self) -> Tuple[List[Tuple[float, int, str]], int]:
+        """(mtime, size, path) of every entry, and their total size."""
+        files: List[Tuple[float, int, str]] = []
+        total = 0
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+            files.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+        return files, total
+
+    def _evict(self) -> int:
+        """Drop least recently used entries to 90% of the budget; returns the new total."""
+        files, total = self._scan()
+        # The headroom keeps a full cache from rescanning on every write
+        target = self.max_bytes * 0.9
+        # Oldest access first
+        for _, size, path in sorted(files):
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+        return total
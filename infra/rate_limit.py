@@ -0,0 +1,142 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Mapping, Optional
+
+
+def _header_float(headers: Mapping[str, str], name: str) -> Optional[float]:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class AdaptiveRateLimiter:
+    """
+    Caps in-flight Canvas requests and adapts the cap to Canvas's leaky-bucket
+    throttling (AIMD): every healthy response grows the cap by roughly one
+    request per round trip; a low X-Rate-Limit-Remaining or a throttled
+    response halves it. Throttling also pauses new requests for a backoff
+    period so the bucket can drain.
+    """
+
+    def __init__(self,
+                 initial: int = 4,
+                 min_limit: int = 1,
+                 max_limit: int = 16,
+                 low_water: float = 200.0,
+                 backoff: float = 1.0,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        :param initial:   Starting number of concurrent requests.
+        :param min_limit: Floor the cap never drops below.
+        :param max_limit: Ceiling the cap never grows beyond.
+        :param low_water: Remaining bucket units below which we back off.
+        :param backoff:   Base pause (seconds) after a throttled response.
+        """
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.low_water = low_water
+        self.backoff = backoff
+        self._clock = clock
+        self._sleep = sleep
+
+        self._limit = float(max(min_limit, min(initial, max_limit)))
+        self._in_flight = 0
+        self._cooldown_until = 0.0
+        self._last_decrease = float("-inf")
+        self._throttle_streak = 0
+        self._cond = threading.Condition()
+
+        self.throttled_count = 0
+        self.last_remaining: Optional[float] = None
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+
+    def acquire(self) -> None:
+        """Block until a request slot is free and no cooldown is active."""
+        while True:
+            with self._cond:
+                wait = self._cooldown_until - self._clock()
+                if wait <= 0:
+                    if self._in_flight < int(self._limit):
+                        self._in_flight += 1
+                        return
+                    # A throttle may arrive while we're queued; loop back
+                    # to honour its cooldown before taking the freed slot
+                    self._cond.wait()
+                    continue
+            self._sleep(wait)
+
+    def release(self) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def observe(self, headers: Mapping[str, str], throttled: bool = False) -> None:
+        """Feed one response's rate-limit headers back into the cap."""
+        remaining = _header_float(headers, "X-Rate-Limit-Remaining")
+        cost = _header_float(headers, "X-Request-Cost") or 0.0
+
+        with self._cond:
+            now = self._clock()
+            if remaining is not None:
+                self.last_remaining = remaining
+
+            if throttled:
+                self.throttled_count += 1
+                self._throttle_streak += 1
+                self._cooldown_until = max(
+                    self._cooldown_until,
+                    now + self.backoff * 2 ** (self._throttle_streak - 1),
+                )
+                self._decrease(now, force=True)
+                return
+
+            self._throttle_streak = 0
+            # Keep enough headroom for everything we could have in flight
+            if remaining is not None and remaining < max(self.low_water, cost * self._limit):
+                self._decrease(now)
+            else:
+                self._limit = min(self.max_limit, self._limit + 1.0 / self._limit)
+            self._cond.notify_all()
+
+    def _decrease(self, now: float, force: bool = False) -> None:
+        # In-flight responses all report the same drained bucket; only react
+        # once per backoff period unless Canvas actually throttled us.
+        if not force and now - self._last_decrease < self.backoff:
+            return
+        self._last_decrease = now
+        self._limit = max(float(self.min_limit), self._limit / 2)
+
+
+_shared: Dict[str, AdaptiveRateLimiter] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_limiter(key: str = "") -> AdaptiveRateLimiter:
+    """
+    The process-wide limiter for `key`. Canvas budgets each token
+    separately, so multi-account runs key this on the token; the default
+    key is what every CanvasHTTPClient uses unless told otherwise.
+    """
+    with _shared_lock:
+        limiter = _shared.get(key)
+        if limiter is None:
+            limiter = _shared[key] = AdaptiveRateLimiter()
+        return limiter
@@ -0,0 +1,119 @@
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
+
+from core.errors import PartialResultError
+from core.ports import ICanvasClient, collect
+
+
+def _call_key(path: str, params: Optional[dict]) -> Hashable:
+    items = []
+    for k, v in (params or {}).items():
+        items.append((k, tuple(v) if isinstance(v, (list, tuple)) else v))
+    return path, tuple(sorted(items, key=repr))
+
+
+class _Abandoned(Exception):
+    """The leading stream was closed early; followers fetch for themselves."""
+
+
+class SingleFlightClient(ICanvasClient):
+    """
+    Wraps a client so concurrent identical (path, params) calls share one
+    in-flight request: the first caller fetches, the rest wait for its
+    result (or its exception). Nothing is kept once the call finishes;
+    this removes duplicate traffic, it is not a cache.
+
+    The first caller of iter_paginated() still streams page by page;
+    callers that join it get the whole listing once it completes.
+    """
+
+    def __init__(self, inner: ICanvasClient):
+        self._inner = inner
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, Future] = {}
+
+        self.hits = 0    # calls that joined one already in flight
+        self.misses = 0  # calls that went to the wrapped client
+
+    def _join(self, key: Hashable) -> Tuple[Future, bool]:
+        """The in-flight call for `key`, and whether we are the one to make it."""
+        with self._lock:
+            call = self._in_flight.get(key)
+            if call is not None:
+                self.hits += 1
+                return call, False
+            call = self._in_flight[key] = Future()
+            self.misses += 1
+            return call, True
+
+    def _finish(self, key: Hashable) -> None:
+        with self._lock:
+            del self._in_flight[key]
+
+    def get_paginated(self, path: str, params: Optional[dict] = None) -> List[Any]:
+        key = _call_key(path, params)
+        call, leader = self._join(key)
+        if not leader:
+            try:
+                return list(call.result())
+            except _Abandoned:
+                return collect(self._inner.get_paginated(path, params))
+
+        try:
+            result = collect(self._inner.get_paginated(path, params))
+        except BaseException as e:
+            call.set_exception(e)
+            raise
+        else:
+            call.set_result(result)
+        finally:
+            self._finish(key)
+        # Each caller gets its own list; the items themselves are shared
+        return list(result)
+
+    def iter_paginated(self, path: str, params: Optional[dict] = None) -> Iterator[Any]:
+        key = _call_key(path, params)
+        call, leader = self._join(key)
+        if not leader:
+            try:
+                result = call.result()
+            except _Abandoned:
+                result = self._inner.iter_paginated(path, params)
+            except PartialResultError as e:
+                # Unlike the leader, we never saw the items before the failure.
+                # Once yielded they are ours, so the error goes on without them.
+                yield from e.items
+                raise PartialResultError(str(e), resume_url=e.resume_url) from e
+            yield from result
+            return
+
+        items: List[Any] = []
+        try:
+            for item in self._inner.iter_paginated(path, params):
+                items.append(item)
+                yield item
+        except GeneratorExit:
+            call.set_exception(_Abandoned())
+            raise
+        except PartialResultError as e:
+            # The leader already streamed `items`; followers need them handed over
+            call.set_exception(PartialResultError(str(e), items=list(items),
+                                                  resume_url=e.resume_url))
+            raise
+        except BaseException as e:
+            call.set_exception(e)
+            raise
+        else:
+            call.set_result(items)
+        finally:
+            self._finish(key)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
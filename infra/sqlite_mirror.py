@@ -0,0 +1,208 @@
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+from core.ports import ICourseMirror
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS courses (
+    id                 INTEGER PRIMARY KEY,
+    name               TEXT,
+    workflow_state     TEXT,
+    enrollment_term_id INTEGER,
+    raw                TEXT NOT NULL,
+    synced_at          REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS assignments (
+    id         INTEGER PRIMARY KEY,
+    course_id  INTEGER NOT NULL,
+    due_at     TEXT,
+    updated_at TEXT,
+    raw        TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS submissions (
+    assignment_id  INTEGER PRIMARY KEY,
+    course_id      INTEGER NOT NULL,
+    workflow_state TEXT,
+    submitted_at   TEXT,
+    raw            TEXT NOT NULL,
+    synced_at      REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_assignments_course_id ON assignments(course_id);
+CREATE INDEX IF NOT EXISTS ix_assignments_due_at ON assignments(due_at);
+CREATE INDEX IF NOT EXISTS ix_submissions_state ON submissions(workflow_state);
+"""
+
+_ASSIGNMENTS_PATH = re.compile(r"^/api/v1/courses/(\d+)/assignments$")
+
+
+class SQLiteMirror(ICourseMirror):
+    """
+    SQLite-backed copy of courses, assignments and submission state.
+
+    Raw payloads are stored as JSON so reads rebuild exactly what the API
+    returned; the indexed columns exist for filtering and change detection.
+    Submission state lives in its own table so it can be refreshed without
+    rewriting assignments.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        # Services fan out on threads; serialize access to one connection.
+        self._lock = threading.Lock()
+
+    def _db(self) -> sqlite3.Connection:
+        """Open the database (and create the schema) on first use."""
+        if self._conn is None:
+            if self.path != ":memory:":
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # --- Writes ---
+
+    def upsert_courses(self, courses: List[Dict[str, Any]]) -> int:
+        """
+        Stores the complete course listing; courses missing from it are
+        gone from Canvas and are deleted with their assignments.
+        """
+        now = time.time()
+        rows = [
+            (int(c["id"]), c.get("name", ""), c.get("workflow_state", ""),
+             c.get("enrollment_term_id"), json.dumps(c), now)
+            for c in courses
+        ]
+        with self._lock, self._db() as db:
+            db.executemany(
+                "INSERT INTO courses (id, name, workflow_state, enrollment_term_id, raw, synced_at) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET name=excluded.name, "
+                "workflow_state=excluded.workflow_state, "
+                "enrollment_term_id=excluded.enrollment_term_id, "
+                "raw=excluded.raw, synced_at=excluded.synced_at",
+                rows,
+            )
+            keep = [(r[0],) for r in rows]
+            db.execute("CREATE TEMP TABLE IF NOT EXISTS keep_ids (id INTEGER PRIMARY KEY)")
+            db.execute("DELETE FROM keep_ids")
+            db.executemany("INSERT OR IGNORE INTO keep_ids (id) VALUES (?)", keep)
+            for table, column in (("submissions", "course_id"), ("assignments", "course_id"), ("courses", "id")):
+                db.execute(f"DELETE FROM {table} WHERE {column} NOT IN (SELECT id FROM keep_ids)")
+        return len(rows)
+
+    def upsert_assignments(self, course_id: int, assignments: List[Dict[str, Any]]) -> int:
+        """
+        Rewrites only assignments that are new or whose updated_at differs
+        from the stored one. Embedded submissions are split off and always
+        refreshed, since submitting does not bump the assignment's updated_at.
+
+        `assignments` is the course's complete listing: stored assignments
+        missing from it were deleted in Canvas and are dropped, along with
+        their submissions. The count returned includes them.
+        """
+        submissions: List[Dict[str, Any]] = []
+        changed = []
+
+        with self._lock:
+            db = self._db()
+            stored = dict(db.execute(
+                "SELECT id, updated_at FROM assignments WHERE course_id = ?",
+                (course_id,),
+            ).fetchall())
+
+        for a in assignments:
+            a = dict(a)
+            sub = a.pop("submission", None)
+            if isinstance(sub, dict):
+                submissions.append(dict(sub, assignment_id=a["id"]))
+
+            aid = int(a["id"])
+            if aid in stored and stored[aid] == a.get("updated_at"):
+                continue
+            changed.append((aid, course_id, a.get("due_at"), a.get("updated_at"), json.dumps(a)))
+
+        gone = [(aid,) for aid in stored.keys() - {int(a["id"]) for a in assignments}]
+
+        with self._lock, self._db() as db:
+            db.executemany(
+                "INSERT INTO assignments (id, course_id, due_at, updated_at, raw) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET course_id=excluded.course_id, "
+                "due_at=excluded.due_at, updated_at=excluded.updated_at, raw=excluded.raw",
+                changed,
+            )
+            db.executemany("DELETE FROM submissions WHERE assignment_id = ?", gone)
+            db.executemany("DELETE FROM assignments WHERE id = ?", gone)
+
+        if submissions:
+            self.upsert_submissions(course_id, submissions)
+        return len(changed) + len(gone)
+
+    def upsert_submissions(self, course_id: int, submissions: List[Dict[str, Any]]) -> int:
+        now = time.time()
+        rows = [
+            (int(s["assignment_id"]), course_id, s.get("workflow_state"),
+             s.get("submitted_at"), json.dumps(s), now)
+            for s in submissions
+            if s.get("assignment_id") is not None
+        ]
+        with self._lock, self._db() as db:
+            db.executemany(
+                "INSERT INTO submissions (assignment_id, course_id, workflow_state, submitted_at, raw, synced_at) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(assignment_id) DO UPDATE SET course_id=excluded.course_id, "
+                "workflow_state=excluded.workflow_state, submitted_at=excluded.submitted_at, "
+                "raw=excluded.raw, synced_at=excluded.synced_at",
+                rows,
+            )
+        return len(rows)
+
+    # --- Reads (ICanvasClient) ---
+
+    def get_paginated(self,
+                      path: str,
+                      params: Optional[dict] = None) -> List[Any]:
+        """
+        Answers the two endpoints CourseService reads from the mirror:
+        the course listing and a course's assignments (with submissions).
+        """
+        return list(self.iter_paginated(path, params))
+
+    def iter_paginated(self,
+                       path: str,
+                       params: Optional[dict] = None) -> Iterator[Any]:
+        path = "/" + path.lstrip("/")
+        if path == "/api/v1/courses":
+            with self._lock:
+                rows = self._db().execute("SELECT raw FROM courses ORDER BY id").fetchall()
+            for (raw,) in rows:
+                yield json.loads(raw)
+            return
+
+        match = _ASSIGNMENTS_PATH.match(path)
+        if match is None:
+            raise ValueError(f"Mirror cannot answer {path}; run 'sync' against Canvas instead")
+
+        with self._lock:
+            rows = self._db().execute(
+                "SELECT a.raw, s.raw FROM assignments a "
+                "LEFT JOIN submissions s ON s.assignment_id = a.id "
+                "WHERE a.course_id = ? ORDER BY a.id",
+                (int(match.group(1)),),
+            ).fetchall()
+        for raw, sub in rows:
+            data = json.loads(raw)
+            if sub is not None:
+                data["submission"] = json.loads(sub)
+            yield data
@@ -1,19 +1,39 @@
+import os
+import threading
+import time
 
-from infra.canvas_http import CanvasHTTPClient
-from requests import RequestException
+import pytest
+
+from infra.canvas_http import CanvasHTTPClient, pooled_session
+from infra.http_cache import CachedResponse, DiskResponseCache
+from infra.rate_limit import AdaptiveRateLimiter, shared_limiter
+from requests import HTTPError, RequestException
+from core.errors import PartialResultError
+from infra.retry import RetryPolicy
+from utils import tracing
 
 
 class FakeResponse:
-    def __init__(self, payload, next_url=None):
+    def __init__(self, payload, next_url=None, links=None,
+                 status_code=200, headers=None, text=""):
         """
         payload: list[...]  or dict (single-object page)
         next_url: absolute URL to the next page, or None
+        links: extra Link relations, e.g. {"last": "https://..."}
+        status_code / headers / text: response status, headers and raw body
         """
         self._payload = payload
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.text = text
+        self.content = text.encode()
         self.links = {"next": {"url": next_url}} if next_url else {}
+        for rel, url in (links or {}).items():
+            self.links[rel] = {"url": url}
 
     def raise_for_status(self):
-        # Simulate successful responses
+        if self.status_code >= 400:
+            raise HTTPError(f"{self.status_code} Error")
         return None
 
     def json(self):
@@ -29,15 +49,33 @@ class FakeSession:
     def __init__(self, script):
         self.script = list(script)  # list of FakeResponse or Exception
         self.calls = []             # list of (url, params)
+        self.headers = []           # request headers, per call
 
-    def get(self, url, params=None):
+    def get(self, url, params=None, headers=None):
         self.calls.append((url, params))
+        self.headers.append(headers or {})
         nxt = self.script.pop(0)
         if isinstance(nxt, Exception):
             raise nxt
         return nxt
 
 
+class RoutedSession:
+    """Answers by URL rather than call order, for concurrent fetches."""
+    def __init__(self, routes):
+        self.routes = routes  # url -> FakeResponse or Exception
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def get(self, url, params=None, headers=None):
+        with self._lock:
+            self.calls.append((url, params))
+        nxt = self.routes[url]
+        if isinstance(nxt, Exception):
+            raise nxt
+        return nxt
+
+
 # ##=========== Tests ===========## #
 def test_get_paginated_collects_across_pages_and_returns_list():
     # Page 1 (two items) -> next -> Page 2 (one item) -> end
@@ -74,22 +112,50 @@ def test_get_paginated_supports_single_object_pages():
     assert items == [{"id": 42, "name": "Single"}]
 
 
-def test_get_paginated_stops_on_request_exception_and_returns_partial():
-    # First page fine, second raises network error
+def test_get_paginated_raises_partial_result_after_retries_run_out():
+    # First page fine, second keeps raising network errors
     page1 = FakeResponse([{"id": 1}], next_url="https://api/next")
     boom = RequestException("network down")
 
-    client = CanvasHTTPClient(base_url="https://api/", token="X")
-    client._session = FakeSession([page1, boom])
+    client = CanvasHTTPClient(base_url="https://api/", token="X",
+                              retry=RetryPolicy(max_retries=1, base_delay=0))
+    client._session = FakeSession([page1, boom, boom])
+
+    with pytest.raises(PartialResultError) as err:
+        client.get_paginated("/api/v1/courses")
 
-    items = client.get_paginated("/api/v1/courses")
-    # Your implementation prints and breaks -> returns what it collected so far
-    assert items == [{"id": 1}]
+    # Carries what was collected so far and where to pick up again
+    assert err.value.items == [{"id": 1}]
+    assert err.value.resume_url == "https://api/next"
 
     calls = client._session.calls
-    assert len(calls) == 2
+    assert len(calls) == 3
     assert calls[0][0].endswith("/api/v1/courses")
-    assert calls[1][0] == "https://api/next"
+    assert calls[1][0] == calls[2][0] == "https://api/next"
+
+    # Resuming from the cursor continues with the failing page
+    client._session = FakeSession([FakeResponse([{"id": 2}])])
+    assert client.get_paginated(err.value.resume_url) == [{"id": 2}]
+
+
+def test_transient_server_errors_are_retried():
+    unavailable = FakeResponse(None, status_code=503, headers={"Retry-After": "0"})
+    page = FakeResponse([{"id": 1}])
+
+    client = CanvasHTTPClient(base_url="https://api/", token="X",
+                              retry=RetryPolicy(base_delay=0))
+    client._session = FakeSession([unavailable, unavailable, page])
+
+    assert client.get_paginated("/api/v1/courses") == [{"id": 1}]
+    assert len(client._session.calls) == 3
+
+
+def test_retry_policy_prefers_retry_after_and_caps_backoff():
+    policy = RetryPolicy(base_delay=1, max_delay=5, jitter=False)
+    assert policy.delay(1) == 1
+    assert policy.delay(3) == 4
+    assert policy.delay(10) == 5
+    assert policy.delay(1, retry_after="2") == 2
 
 
 def test_get_paginated_handles_empty_pages():
@@ -101,3 +167,199 @@ def test_get_paginated_handles_empty_pages():
 
     items = client.get_paginated("/api/v1/empty")
     assert items == []
+
+
+def test_iter_paginated_fetches_next_page_only_when_consumed():
+    page1 = FakeResponse([{"id": 1}, {"id": 2}], next_url="https://api/p2")
+    page2 = FakeResponse([{"id": 3}], next_url=None)
+
+    client = CanvasHTTPClient(base_url="https://api/", token="X")
+    client._session = FakeSession([page1, page2])
+
+    stream = client.iter_paginated("/api/v1/courses")
+    assert client._session.calls == []  # nothing fetched until consumed
+
+    assert next(stream) == {"id": 1}
+    assert next(stream) == {"id": 2}
+    assert len(client._session.calls) == 1
+
+    assert list(stream) == [{"id": 3}]
+    assert len(client._session.calls) == 2
+
+
+def test_parallel_pages_use_last_link_and_keep_page_order():
+    base = "https://api/api/v1/courses?per_page=1&page="
+    first = FakeResponse([{"id": 1}], next_url=base + "2",
+                         links={"first": base + "1", "last": base + "3"})
+
+    client = CanvasHTTPClient(base_url="https://api/", token="X", page_workers=4)
+    client._session = RoutedSession({
+        "https://api/api/v1/courses": first,
+        base + "2": FakeResponse([{"id": 2}], next_url=base + "3"),
+        base + "3": FakeResponse([{"id": 3}]),
+    })
+
+    items = client.get_paginated("/api/v1/courses", params={"per_page": 1})
+
+    assert [i["id"] for i in items] == [1, 2, 3]
+    assert sorted(u for u, _ in client._session.calls[1:]) == [base + "2", base + "3"]
+
+
+def test_parallel_pages_fall_back_to_next_without_last_link():
+    page1 = FakeResponse([{"id": 1}], next_url="https://api/p2")
+    page2 = FakeResponse([{"id": 2}], next_url=None)
+
+    client = CanvasHTTPClient(base_url="https://api/", token="X", page_workers=4)
+    client._session = FakeSession([page1, page2])
+
+    assert client.get_paginated("/api/v1/courses") == [{"id": 1}, {"id": 2}]
+    assert client._session.calls[1] == ("https://api/p2", None)
+
+
+def test_cache_revalidates_with_etag_and_reuses_body_on_304(tmp_path):
+    cache = DiskResponseCache(str(tmp_path), ttls={})  # always revalidate
+    fresh = FakeResponse([{"id": 1}], headers={"ETag": '"v1"'})
+    not_modified = FakeResponse(None, status_code=304)
+
+    client = CanvasHTTPClient(base_url="https://api/", token="X", cache=cache)
+    client._session = FakeSession([fresh, not_modified])
+
+    assert client.get_paginated("/api/v1/courses") == [{"id": 1}]
+    assert client.get_paginated("/api/v1/courses") == [{"id": 1}]
+
+    assert client._session.headers[0] == {}
+    assert client._session.headers[1] == {"If-None-Match": '"v1"'}
+
+
+def test_cache_serves_fresh_entries_without_a_request(tmp_path):
+    cache = DiskResponseCache(str(tmp_path), ttls={"/api/v1/*": 60})
+
+    client = CanvasHTTPClient(base_url="https://api/", token="X", cache=cache)
+    client._session = FakeSession([FakeResponse([{"id": 1}])])
+
+    client.get_paginated("/api/v1/courses")
+    assert client.get_paginated("/api/v1/courses") == [{"id": 1}]
+    assert len(client._session.calls) == 1
+
+
+def test_cache_evicts_least_recently_used_entries(tmp_path):
+    cache = DiskResponseCache(str(tmp_path), max_bytes=250)
+    for i, url in enumerate(("https://a", "https://b", "https://c")):
+        cache.put(url, None, CachedResponse(body=["x" * 40], stored_at=i))
+        os.utime(cache._path(url, None), (i, i))
+
+    assert cache.get("https://a") is None
+    assert cache.get("https://c") is not None
+
+
+def test_cache_only_scans_the_directory_when_it_must_evict(tmp_path, monkeypatch):
+    cache = DiskResponseCache(str(tmp_path), max_bytes=1000)
+    scans = []
+    scan = cache._scan
+    monkeypatch.setattr(cache, "_scan", lambda: scans.append(1) or scan())
+
+    for i in range(5):
+        cache.put(f"https://p/{i}", None, CachedResponse(body=["x"], stored_at=i))
+    cache.put("https://p/0", None, CachedResponse(body=["y"], stored_at=9))  # rewrite
+    assert len(scans) == 1  # the initial size
+
+    for i in range(5, 20):
+        cache.put(f"https://p/{i}", None, CachedResponse(body=["x"], stored_at=i))
+    assert 1 < len(scans) < 10
+    assert sum(os.path.getsize(p) for p in tmp_path.iterdir()) <= 1000
+
+
+def test_throttled_request_backs_off_and_retries():
+    now, sleeps = [0.0], []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    limiter = AdaptiveRateLimiter(initial=8, backoff=0.5,
+                                  clock=lambda: now[0], sleep=sleep)
+    throttled = FakeResponse(None, status_code=403, text="403 Forbidden (Rate Limit Exceeded)",
+                             headers={"X-Rate-Limit-Remaining": "0"})
+    ok = FakeResponse([{"id": 1}], headers={"X-Rate-Limit-Remaining": "650"})
+
+    client = CanvasHTTPClient(base_url="https://api/", token="X", limiter=limiter)
+    client._session = FakeSession([throttled, ok])
+
+    assert client.get_paginated("/api/v1/courses") == [{"id": 1}]
+    assert len(client._session.calls) == 2
+    assert limiter.throttled_count == 1
+    assert limiter.limit == 4  # halved by the throttle
+    assert sleeps == [0.5]  # waited out the cooldown first
+
+
+def test_limiter_grows_when_healthy_and_shrinks_near_empty_bucket():
+    limiter = AdaptiveRateLimiter(initial=2, max_limit=4, low_water=100)
+    for _ in range(10):
+        limiter.observe({"X-Rate-Limit-Remaining": "600"})
+    assert limiter.limit == 4
+
+    limiter.observe({"X-Rate-Limit-Remaining": "50", "X-Request-Cost": "5"})
+    assert limiter.limit == 2
+
+
+def test_waiter_queued_during_a_throttle_waits_out_the_cooldown():
+    limiter = AdaptiveRateLimiter(initial=1, backoff=0.3)
+    limiter.acquire()  # the only slot is taken
+    started = []
+    waiter = threading.Thread(target=lambda: (limiter.acquire(), started.append(time.monotonic())))
+    waiter.start()
+    time.sleep(0.05)  # let it queue for the slot
+
+    throttled_at = time.monotonic()
+    limiter.observe({"X-Rate-Limit-Remaining": "0"}, throttled=True)
+    limiter.release()
+    waiter.join(timeout=2)
+
+    assert started and started[0] - throttled_at >= 0.25
+
+
+def test_clients_on_one_host_share_a_pool_but_not_cookies_tokens_or_limiters():
+    session = pooled_session("https://canvas.example/", pool_size=8)
+    same_host = pooled_session("https://canvas.example/api/v1", pool_size=8)
+    assert same_host is not session and same_host.cookies is not session.cookies
+    adapter = session.get_adapter("https://canvas.example/")
+    assert same_host.get_adapter("https://canvas.example/") is adapter
+    assert pooled_session("https://other.example/").get_adapter("https://other.example/") is not adapter
+    assert "Authorization" not in session.headers
+
+    # A caller needing more concurrency gets a pool that fits it
+    bigger = pooled_session("https://canvas.example/", pool_size=64)
+    assert bigger.get_adapter("https://canvas.example/")._pool_maxsize == 64
+
+    fake = FakeSession([FakeResponse(payload=[{"id": 1}]), FakeResponse(payload=[{"id": 2}])])
+    a = CanvasHTTPClient("https://canvas.example/", "A", session=fake, limiter=shared_limiter("a"))
+    b = CanvasHTTPClient("https://canvas.example/", "B", session=fake, limiter=shared_limiter("b"))
+    a.get_paginated("/api/v1/courses")
+    b.get_paginated("/api/v1/courses")
+
+    assert [h["Authorization"] for h in fake.headers] == ["Bearer A", "Bearer B"]
+    assert shared_limiter("a") is not shared_limiter("b")
+    assert shared_limiter("a") is shared_limiter("a")
+
+
+def test_own_session_pool_fits_the_limiter_ceiling():
+    client = CanvasHTTPClient("https://canvas.example/", "T",
+                              limiter=AdaptiveRateLimiter(max_limit=24))
+    for prefix in ("https://", "http://"):
+        assert client._session.get_adapter(prefix + "canvas.example/")._pool_maxsize == 24
+
+
+def test_profiling_records_request_spans_with_url_templates():
+    tracer = tracing.enable()
+    try:
+        client = CanvasHTTPClient(base_url="https://api/", token="X")
+        client._session = FakeSession([FakeResponse([{"id": 1}], next_url="https://api/courses/7/x?page=2"),
+                                       FakeResponse([{"id": 2}])])
+        client.get_paginated("/api/v1/courses/7/assignments")
+    finally:
+        tracing.disable()
+
+    requests_ = [s for s in tracer.spans if s.name == "http.request"]
+    assert [(s.attrs["url"], s.attrs["page"], s.attrs["status"]) for s in requests_] == [
+        ("/api/v1/courses/:id/assignments", 1, 200), ("/courses/:id/x", 2, 200)]
+    assert sum(1 for s in tracer.spans if s.name == "json.decode") == 2
@@ -0,0 +1,44 @@
+import json
+import time
+
+from core.models import Course, Term
+from infra.course_index import JSONCourseIndex
+
+COURSES = [Course(id=1, name="Algebra", workflow_state="available", enrollment_term_id=7)]
+TERMS = [Term.from_api({"id": 7, "name": "Fall", "start_at": "2026-08-20T00:00:00Z",
+                        "end_at": "2026-12-20T00:00:00Z"})]
+
+
+def test_round_trips_courses_and_terms(tmp_path):
+    index = JSONCourseIndex(str(tmp_path / "data" / "courses.json"))
+    assert index.load() is None
+
+    index.save(COURSES, TERMS)
+
+    assert JSONCourseIndex(index.path).load() == (COURSES, TERMS)
+
+
+def test_expired_or_invalidated_index_counts_as_missing(tmp_path):
+    path = tmp_path / "courses.json"
+    index = JSONCourseIndex(str(path), max_age=60)
+    index.save(COURSES, TERMS, current_term_id=7)
+
+    data = json.loads(path.read_text())
+    data["saved_at"] = time.time() - 61
+    path.write_text(json.dumps(data))
+    assert index.load() is None
+    # Still good enough as a first guess at the current term
+    assert index.current_term_id() == 7
+
+    index.save(COURSES, TERMS)
+    index.invalidate()
+    assert index.load() is None
+    assert index.current_term_id() is None
+    index.invalidate()  # already gone
+
+
+def test_unreadable_index_counts_as_missing(tmp_path):
+    path = tmp_path / "courses.json"
+    path.write_text("{not json")
+
+    assert JSONCourseIndex(str(path)).load() is None
@@ -0,0 +1,26 @@
+from datetime import timedelta
+
+from cli.presenter_console import ProgressiveConsolePresenter
+from core.models import Assignment
+from tests.unit.test_services import NOW, _assignment
+
+
+def test_progressive_rows_print_as_they_arrive_with_fixed_widths(capsys, monkeypatch):
+    monkeypatch.setenv("COLUMNS", "100")
+    presenter = ProgressiveConsolePresenter()
+    widths = presenter.column_widths(100)
+    assert sum(widths) + 2 * (len(widths) - 1) == 100
+
+    long_title = dict(_assignment(1, 1, NOW - timedelta(days=1)), name="T" * 80)
+
+    def rows():
+        yield "overdue", Assignment.from_api_dict(long_title, "Algebra")
+        # Header and first row are already on screen before the next course
+        out = capsys.readouterr().out
+        assert out.splitlines()[0].startswith("Status")
+        assert "T" * 10 + "…" in out
+        assert all(len(line) <= 100 for line in out.splitlines())
+        yield "upcoming", Assignment.from_api_dict(_assignment(2, 1, NOW + timedelta(days=1)), "Algebra")
+
+    presenter.display_assignment_stream(rows())
+    assert "1 overdue, 1 upcoming" in capsys.readouterr().out
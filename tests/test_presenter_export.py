@@ -0,0 +1,66 @@
+import csv
+import io
+import json
+from datetime import timedelta
+
+from cli.presenter_export import CSVPresenter, JSONPresenter, NDJSONPresenter
+from core.models import Assignment, Course
+from tests.unit.test_services import NOW, _assignment
+
+
+def _a(aid, days):
+    return Assignment.from_api_dict(_assignment(aid, 1, NOW + timedelta(days=days)), "Algebra")
+
+
+def test_ndjson_writes_each_row_before_the_next_is_produced():
+    out = io.StringIO()
+    presenter = NDJSONPresenter(out)
+
+    def rows():
+        yield "overdue", _a(1, -1)
+        # The first record is already out while we are still "fetching"
+        assert json.loads(out.getvalue())["id"] == 1
+        yield "upcoming", _a(2, 1)
+
+    presenter.display_assignment_stream(rows())
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [(r["category"], r["id"], r["course_name"]) for r in records] == [
+        ("overdue", 1, "Algebra"), ("upcoming", 2, "Algebra")]
+
+
+def test_json_and_csv_outputs_parse_back():
+    out = io.StringIO()
+    JSONPresenter(out).display_assignments([_a(1, -1)], [_a(2, 1), _a(3, 2)])
+    assert [r["id"] for r in json.loads(out.getvalue())] == [1, 2, 3]
+
+    out = io.StringIO()
+    JSONPresenter(out).display_courses([])
+    assert json.loads(out.getvalue()) == []
+
+    out = io.StringIO()
+    CSVPresenter(out).display_courses([Course(1, "Algebra", "available", 7)])
+    assert list(csv.DictReader(io.StringIO(out.getvalue()))) == [
+        {"id": "1", "name": "Algebra", "workflow_state": "available", "enrollment_term_id": "7"}]
+
+
+def test_main_exits_quietly_when_the_reader_closes_the_pipe(monkeypatch, capsys):
+    import sys
+
+    import app
+    from tests.unit.test_services import FakeClient, _course
+
+    class _ClosedPipe(io.StringIO):
+        def write(self, s):
+            raise BrokenPipeError(32, "Broken pipe")
+
+    client = FakeClient(routes={"/api/v1/courses": [_course(1, "Algebra"), _course(2, "Physics")]})
+    monkeypatch.setattr(app.Deps, "build", staticmethod(
+        lambda **kw: app.Deps(canvas_client=client, course_index=None, **kw)))
+    for fmt in ("ndjson", "json", "csv"):
+        monkeypatch.setattr(sys, "argv", ["app.py", "list-courses", "--format", fmt])
+        monkeypatch.setattr(sys, "stdout", _ClosedPipe())
+
+        assert app.main() == 0
+        # Later writes (and the exit-time flush) go nowhere instead of raising
+        print("more", flush=True)
+    assert capsys.readouterr().err == ""
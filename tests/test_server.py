@@ -0,0 +1,59 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+import pytest
+import requests
+
+from cli.server import SnapshotStore, make_server
+from core.services import CourseService
+from core.watch import AssignmentWatcher
+from tests.unit.test_services import NOW, TERM, FakeClient, _assignment, _course
+
+
+@pytest.fixture
+def served():
+    client = FakeClient(routes={
+        "/api/v1/courses": [_course(1, "Algebra")],
+        "/api/v1/courses/1/assignments": [_assignment(10, 1, NOW + timedelta(days=1)),
+                                          _assignment(11, 1, NOW - timedelta(days=1))],
+    })
+    store = SnapshotStore(AssignmentWatcher(CourseService(client), window_days=7))
+    store.refresh()
+
+    server = make_server(store, "127.0.0.1", 0)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", client
+    server.shutdown()
+    server.server_close()
+
+
+def test_serves_warm_snapshots_with_validators(served):
+    base, client = served
+    calls = len(client.calls)
+
+    resp = requests.get(f"{base}/assignments")
+    assert resp.status_code == 200
+    assert [a["id"] for a in resp.json()["overdue"]] == [11]
+    assert [a["id"] for a in resp.json()["upcoming"]] == [10]
+    assert "max-age=" in resp.headers["Cache-Control"]
+
+    again = requests.get(f"{base}/assignments", headers={"If-None-Match": resp.headers["ETag"]})
+    assert again.status_code == 304
+
+    assert requests.get(f"{base}/terms").json() == [{
+        "id": TERM["id"], "name": "",
+        "start_at": TERM["start_at"].replace("Z", "+00:00"),
+        "end_at": TERM["end_at"].replace("Z", "+00:00"),
+    }]
+    assert requests.get(f"{base}/nope").status_code == 404
+    # Requests are answered from memory, never by calling Canvas
+    assert len(client.calls) == calls
+
+
+def test_concurrent_requests_all_see_the_same_snapshot(served):
+    base, _ = served
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        bodies = list(pool.map(lambda _: requests.get(f"{base}/courses").content, range(64)))
+    assert len(set(bodies)) == 1
@@ -0,0 +1,94 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from core.errors import PartialResultError
+from infra.single_flight import SingleFlightClient
+from tests.unit.test_services import FakeClient
+
+COURSES = "/api/v1/courses"
+
+
+def test_concurrent_identical_calls_share_one_request():
+    inner = FakeClient(routes={COURSES: [{"id": 1}], "/other": [{"id": 2}]},
+                       delays={COURSES: 0.1})
+    client = SingleFlightClient(inner)
+    params = {"include[]": ["term"], "per_page": 100}
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: client.get_paginated(COURSES, dict(params)), range(8)))
+        other = pool.submit(lambda: list(client.iter_paginated("/other"))).result()
+
+    assert results == [[{"id": 1}]] * 8
+    assert other == [{"id": 2}]
+    assert [path for path, _ in inner.calls] == [COURSES, "/other"]
+    assert client.stats() == {"hits": 7, "misses": 2, "hit_rate": 7 / 9}
+
+    # Finished calls are not cached
+    client.get_paginated(COURSES, params)
+    assert len(inner.calls) == 3
+
+
+def test_followers_see_the_leaders_error():
+    inner = FakeClient(routes={COURSES: RuntimeError("boom")}, delays={COURSES: 0.1})
+    client = SingleFlightClient(inner)
+
+    def call(_):
+        with pytest.raises(RuntimeError, match="boom"):
+            client.get_paginated(COURSES)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(call, range(4)))
+    assert len(inner.calls) == 1
+
+
+def test_followers_refetch_when_the_leading_stream_is_abandoned():
+    inner = FakeClient(routes={COURSES: [{"id": 1}, {"id": 2}]})
+    client = SingleFlightClient(inner)
+
+    leader = client.iter_paginated(COURSES)
+    assert next(leader) == {"id": 1}
+    follower = client.iter_paginated(COURSES)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending = pool.submit(list, follower)
+        leader.close()
+        assert pending.result(timeout=5) == [{"id": 1}, {"id": 2}]
+    assert len(inner.calls) == 2
+
+
+def test_followers_get_the_items_a_failing_stream_already_yielded():
+    release = threading.Event()
+
+    class _FailingStream(FakeClient):
+        def iter_paginated(self, path, params=None):
+            with self._lock:
+                self.calls.append((path, params))
+            yield {"id": 1}
+            yield {"id": 2}
+            release.wait(timeout=5)
+            raise PartialResultError("page 3 kept failing", resume_url="https://x/page3")
+
+    inner = _FailingStream(routes={})
+    client = SingleFlightClient(inner)
+
+    def drain(stream):
+        got = []
+        with pytest.raises(PartialResultError) as err:
+            for item in stream:
+                got.append(item)
+        assert err.value.items == []  # streamed callers already have them
+        return got, err.value.resume_url
+
+    leader = client.iter_paginated(COURSES)
+    assert next(leader) == {"id": 1}
+    follower = client.iter_paginated(COURSES)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending = pool.submit(drain, follower)
+        while client.stats()["hits"] == 0:
+            time.sleep(0.01)
+        release.set()
+        assert drain(leader) == ([{"id": 2}], "https://x/page3")
+        assert pending.result(timeout=5) == ([{"id": 1}, {"id": 2}], "https://x/page3")
+    assert len(inner.calls) == 1
@@ -0,0 +1,73 @@
+from datetime import datetime, timedelta, timezone
+
+from core.services import CourseService
+from infra.sqlite_mirror import SQLiteMirror
+from tests.unit.test_services import FakeClient, _assignment, _course
+
+
+def _routes(assignments):
+    return {
+        "/api/v1/courses": [_course(1, "Algebra")],
+        "/api/v1/courses/1/assignments": assignments,
+    }
+
+
+# ##=========== Tests ===========## #
+def test_sync_only_rewrites_assignments_whose_updated_at_moved(tmp_path):
+    due = datetime.now(timezone.utc) + timedelta(days=1)
+    a1 = dict(_assignment(10, 1, due), updated_at="2025-01-01T00:00:00Z")
+    a2 = dict(_assignment(11, 1, due), updated_at="2025-01-01T00:00:00Z")
+    mirror = SQLiteMirror(str(tmp_path / "mirror.sqlite3"))
+
+    first = CourseService(FakeClient(_routes([a1, a2]))).sync(mirror)
+    assert (first.courses, first.assignments_changed) == (1, 2)
+
+    a2_edited = dict(a2, name="Renamed", updated_at="2025-02-01T00:00:00Z")
+    second = CourseService(FakeClient(_routes([a1, a2_edited]))).sync(mirror)
+    assert second.assignments_changed == 1
+
+
+def test_mirror_answers_course_service_reads_with_submissions(tmp_path):
+    due = datetime.now(timezone.utc) + timedelta(days=1)
+    submitted = dict(_assignment(10, 1, due),
+                     submission={"workflow_state": "submitted"})
+    open_one = _assignment(11, 1, due)
+    mirror = SQLiteMirror(str(tmp_path / "mirror.sqlite3"))
+    CourseService(FakeClient(_routes([submitted, open_one]))).sync(mirror)
+
+    offline = CourseService(mirror, server_filter=False)
+
+    assert [c.name for c in offline.list_courses(include_archived=False)] == ["Algebra"]
+    assert [a.id for a in offline.get_unsubmitted_assignments(window_days=7)] == [11]
+
+
+def test_sync_drops_assignments_and_courses_deleted_in_canvas(tmp_path):
+    due = datetime.now(timezone.utc) + timedelta(days=1)
+    a10 = _assignment(10, 1, due)
+    a11 = dict(_assignment(11, 1, due), submission={"workflow_state": "unsubmitted"})
+    mirror = SQLiteMirror(str(tmp_path / "mirror.sqlite3"))
+    CourseService(FakeClient(_routes([a10, a11]))).sync(mirror)
+
+    report = CourseService(FakeClient(_routes([a10]))).sync(mirror)
+
+    assert report.assignments_changed == 1
+    assert [a.id for a in CourseService(mirror, server_filter=False).get_unsubmitted_assignments(window_days=7)] == [10]
+    assert mirror._db().execute("SELECT COUNT(*) FROM submissions").fetchone() == (0,)
+
+    # A course gone from the listing takes its assignments with it
+    CourseService(FakeClient({"/api/v1/courses": [_course(2, "Biology")],
+                              "/api/v1/courses/2/assignments": []})).sync(mirror)
+    assert [c["id"] for c in mirror.get_paginated("/api/v1/courses")] == [2]
+    assert mirror.get_paginated("/api/v1/courses/1/assignments") == []
+
+
+def test_full_sync_refreshes_the_course_index(tmp_path):
+    from infra.course_index import JSONCourseIndex
+
+    index = JSONCourseIndex(str(tmp_path / "courses.json"))
+    mirror = SQLiteMirror(str(tmp_path / "mirror.sqlite3"))
+    CourseService(FakeClient(_routes([])), course_index=index).sync(mirror)
+
+    courses, terms = index.load()
+    assert [c.name for c in courses] == ["Algebra"]
+    assert len(terms) == 1
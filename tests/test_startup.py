@@ -0,0 +1,52 @@
+import os
+import subprocess
+import sys
+
+from benchmarks.bench_startup import ROOT, loaded_after_help
+
+
+def test_help_does_not_import_heavy_modules():
+    assert loaded_after_help() == []
+
+
+def test_selected_command_still_gets_its_flags():
+    out = subprocess.run([sys.executable, os.path.join(ROOT, "app.py"), "show-assignments", "--help"],
+                         cwd=ROOT, check=True, capture_output=True, text=True).stdout
+    assert "--window-days" in out
+    assert "--format" in out
+
+
+def test_profile_flag_does_not_swallow_the_command():
+    from app import build_parser
+
+    argv = ["--profile", "show-assignments"]
+    args = build_parser(argv).parse_args(argv)
+    assert (args.profile, args.trace, args.command) == (True, None, "show-assignments")
+
+    argv = ["--trace", "trace.json", "list-terms"]
+    args = build_parser(argv).parse_args(argv)
+    assert (args.trace, args.command) == ("trace.json", "list-terms")
+
+
+def test_option_values_named_like_commands_are_not_the_command():
+    from app import build_parser
+
+    argv = ["--trace", "sync", "list-courses", "--include-archived"]
+    args = build_parser(argv).parse_args(argv)
+    assert (args.trace, args.command, args.include_archived) == ("sync", "list-courses", True)
+
+
+def test_main_reports_canvas_failures_without_a_traceback(monkeypatch, capsys):
+    import app
+    from core.errors import PartialResultError
+    from tests.unit.test_services import FakeClient
+
+    client = FakeClient(routes={"/api/v1/courses": PartialResultError(
+        "API request failed: 401 Unauthorized", resume_url="https://x/api/v1/courses?page=1")})
+    monkeypatch.setattr(app.Deps, "build", staticmethod(
+        lambda **kw: app.Deps(canvas_client=client, course_index=None, **kw)))
+    monkeypatch.setattr(sys, "argv", ["app.py", "list-courses"])
+
+    assert app.main() == 1
+    assert capsys.readouterr().err == (
+        "Err: API request failed: 401 Unauthorized (resume at https://x/api/v1/courses?page=1)\n")
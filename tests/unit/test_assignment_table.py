@@ -0,0 +1,53 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from core import assignment_table
+from core.assignment_table import AssignmentTable
+from core.models import Assignment
+
+NOW = datetime(2025, 3, 10, 12, 0, tzinfo=timezone.utc)
+
+
+def _a(aid, due, state=None):
+    return Assignment(id=aid, title=f"A{aid}", course_name="C", url=None,
+                      points=None, published=True, due_at=due, course_id=1,
+                      submission_workflow_state=state)
+
+
+ROWS = [
+    _a(1, NOW + timedelta(days=1)),                   # upcoming
+    _a(2, NOW - timedelta(days=2)),                   # overdue, in window
+    _a(3, NOW - timedelta(days=30)),                  # overdue too long ago
+    _a(4, NOW + timedelta(days=2), state="graded"),   # submitted
+    _a(5, None),                                      # undated
+    _a(6, NOW - timedelta(hours=1)),                  # overdue, in window
+]
+
+
+@pytest.fixture(params=["numpy", "array"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(assignment_table, "np", None)
+    return request.param
+
+
+def test_classify_splits_rows_against_one_reference_time(backend):
+    table = AssignmentTable(ROWS)
+    classes = table.classify(window_days=7, now=NOW)
+
+    assert [a.id for a in table.view(classes.overdue)] == [2, 6]
+    assert [a.id for a in table.view(classes.upcoming)] == [1]
+    assert [a.id for a in table.view(classes.out_of_window)] == [3, 4, 5]
+    assert [a.id for a in table.view(classes.in_window)] == [1, 2, 6]
+
+
+def test_views_index_into_the_original_rows(backend):
+    table = AssignmentTable(ROWS)
+    view = table.view(table.classify(window_days=7, now=NOW).overdue)
+
+    assert len(view) == 2
+    assert view[0] is ROWS[1]
+    assert [a.id for a in view[1:]] == [6]
@@ -0,0 +1,43 @@
+from datetime import datetime, timedelta, timezone
+
+from core.due_index import DueIndex
+from core.models import Assignment
+
+# A Wednesday
+NOW = datetime(2025, 3, 12, 12, 0, tzinfo=timezone.utc)
+
+
+def _a(aid, hours_from_now):
+    due = None if hours_from_now is None else NOW + timedelta(hours=hours_from_now)
+    return Assignment(id=aid, title=f"A{aid}", course_name="C", url=None,
+                      points=None, published=True, due_at=due)
+
+
+def _ids(rows):
+    return [a.id for a in rows]
+
+
+def test_range_queries_return_sorted_windows():
+    index = DueIndex([_a(1, 120), _a(2, -30), _a(3, 24), _a(4, None),
+                      _a(5, -200), _a(6, 1)])
+
+    assert _ids(index) == [5, 2, 6, 3, 1, 4]
+    assert _ids(index.due_within(48, NOW)) == [6, 3]
+    assert _ids(index.overdue_within(7, NOW)) == [2]
+    assert _ids(index.due_after(NOW)) == [6, 3, 1]
+    # Until Monday 00:00, 108h ahead
+    assert _ids(index.due_this_week(NOW)) == [6, 3]
+
+
+def test_upsert_moves_existing_rows_and_remove_drops_them():
+    index = DueIndex([_a(1, 10), _a(2, 20)])
+
+    index.upsert(_a(1, 30))   # due date pushed back
+    index.upsert(_a(3, 5))    # new arrival
+    index.upsert(_a(2, None))  # due date cleared
+    assert _ids(index.due_after(NOW)) == [3, 1]
+    assert _ids(index.undated) == [2]
+
+    assert index.remove(3).id == 3
+    assert index.remove(3) is None
+    assert len(index) == 2
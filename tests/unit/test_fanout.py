@@ -0,0 +1,55 @@
+import json
+from datetime import timedelta
+
+from core.fanout import fan_out
+from tests.unit.test_services import FakeClient, NOW, _assignment, _course
+
+
+def _account(cid, due):
+    return FakeClient(routes={
+        "/api/v1/courses": [_course(cid, f"Course {cid}")],
+        f"/api/v1/courses/{cid}/assignments": [_assignment(cid * 10, cid, due)],
+    })
+
+
+def test_fan_out_reports_every_account_and_isolates_failures():
+    accounts = [
+        ("ok", _account(1, NOW + timedelta(days=1))),
+        ("late", _account(2, NOW - timedelta(days=1))),
+        ("broken", FakeClient(routes={"/api/v1/courses": RuntimeError("401 Unauthorized")})),
+    ]
+
+    reports = {r.name: r for r in fan_out(accounts, window_days=7, max_accounts=2)}
+
+    assert set(reports) == {"ok", "late", "broken"}
+    assert [a.id for a in reports["ok"].upcoming] == [10]
+    assert [a.id for a in reports["late"].overdue] == [20]
+    assert reports["broken"].error == "401 Unauthorized"
+    assert reports["broken"].overdue == reports["broken"].upcoming == []
+
+
+def test_unusable_accounts_are_reported_without_sinking_the_rest(tmp_path, monkeypatch):
+    from infra.accounts import load_accounts
+
+    monkeypatch.delenv("MISSING_TOKEN", raising=False)
+    path = tmp_path / "accounts.json"
+    path.write_text(json.dumps([
+        {"name": "ok", "base_url": "https://x/", "token": "t"},
+        {"name": "unset", "base_url": "https://x/", "token_env": "MISSING_TOKEN"},
+        "not-an-object",
+    ]))
+
+    loaded = load_accounts(str(path))
+    assert [(a.name, a.error) for a in loaded] == [
+        ("ok", None),
+        ("unset", "environment variable MISSING_TOKEN is not set"),
+        ("account-3", "expected an object with base_url and token/token_env"),
+    ]
+
+    accounts = [("ok", _account(1, NOW + timedelta(days=1)))]
+    accounts += [(a.name, ValueError(a.error)) for a in loaded if a.error]
+    reports = {r.name: r for r in fan_out(accounts, window_days=7)}
+
+    assert [a.id for a in reports["ok"].upcoming] == [10]
+    assert reports["unset"].error == "environment variable MISSING_TOKEN is not set"
+    assert reports["account-3"].error.startswith("expected an object")
@@ -0,0 +1,23 @@
+from datetime import datetime, timedelta, timezone
+
+from utils.iso_parser import _parse_iso
+
+
+def test_canvas_shape_parses_to_aware_utc():
+    assert _parse_iso("2025-03-04T23:59:00Z") == datetime(2025, 3, 4, 23, 59, tzinfo=timezone.utc)
+
+
+def test_other_iso_shapes_still_parse():
+    parsed = _parse_iso("2025-03-04T23:59:00.123+02:00")
+    assert parsed.utcoffset() == timedelta(hours=2)
+    assert _parse_iso("2025-03-04T23:59:00.5Z").microsecond == 500000
+
+
+def test_invalid_and_empty_values_return_none():
+    assert _parse_iso(None) is None
+    assert _parse_iso("") is None
+    assert _parse_iso("2025-13-40T99:00:00Z") is None
+
+
+def test_repeated_timestamps_share_one_parsed_instance():
+    assert _parse_iso("2025-05-01T12:00:00Z") is _parse_iso("2025-05-01T12:00:00Z")
@@ -0,0 +1,46 @@
+from dataclasses import FrozenInstanceError, fields
+
+import pytest
+
+from core.models import Assignment, LazyAssignment
+
+RAW = {
+    "id": 5, "name": "Essay", "course_id": 3, "html_url": "https://x/5",
+    "points_possible": 10, "published": True, "due_at": "2025-03-04T23:59:00Z",
+    "updated_at": "2025-02-01T10:00:00Z", "submission_types": ["online_upload"],
+    "all_dates": [{"due_at": "2025-03-04T23:59:00Z"}, "junk"],
+    "submission": {"workflow_state": "graded", "score": 9, "late": False},
+    "rubric": [{"id": "r1"}],  # ignored by the models
+}
+
+
+def test_lazy_assignment_exposes_the_same_values_as_assignment():
+    eager = Assignment.from_api_dict(RAW, "Writing")
+    lazy = LazyAssignment.from_api_dict(RAW, "Writing")
+
+    for f in fields(Assignment):
+        assert getattr(lazy, f.name) == getattr(eager, f.name), f.name
+    assert lazy.get_present_vars() == eager.get_present_vars()
+    assert lazy.is_submitted() is eager.is_submitted() is True
+    assert str(lazy) == str(eager)
+    assert lazy.to_assignment() == eager
+
+
+def test_lazy_assignment_parses_on_first_access_and_is_read_only():
+    lazy = LazyAssignment.from_api_dict(RAW, "Writing")
+
+    assert "rubric" not in lazy._raw  # trimmed copy
+    assert lazy.due_at is lazy.due_at  # parsed once, then kept
+    with pytest.raises(FrozenInstanceError):
+        lazy.title = "Changed"
+    with pytest.raises(AttributeError):
+        lazy.not_a_field
+
+
+def test_every_assignment_field_has_a_lazy_reader():
+    from core.models import _ASSIGNMENT_FIELDS, _ASSIGNMENT_RAW_KEYS
+
+    assert set(_ASSIGNMENT_FIELDS) == {f.name for f in fields(Assignment)} - {"course_name"}
+    # Derived from the readers, so trimming never drops a key one of them needs
+    assert set(RAW) - {"rubric"} <= _ASSIGNMENT_RAW_KEYS
+    assert "rubric" not in _ASSIGNMENT_RAW_KEYS
@@ -0,0 +1,362 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from core.models import Course, LazyAssignment, Term
+from core.ports import ICanvasClient, ICourseIndex
+from core.errors import PartialResultError
+from core.services import CourseService
+
+
+def _iso(dt):
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+NOW = datetime.now(timezone.utc)
+TERM = {"id": 7,
+        "start_at": _iso(NOW - timedelta(days=30)),
+        "end_at": _iso(NOW + timedelta(days=60))}
+
+
+class FakeClient(ICanvasClient):
+    """
+    Serves canned payloads keyed by path:
+      - routes: dict of path -> list of items, or an Exception to raise
+      - delays: dict of path -> seconds to sleep before answering
+    """
+    def __init__(self, routes, delays=None):
+        self.routes = routes
+        self.delays = delays or {}
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def get_paginated(self, path, params=None):
+        with self._lock:
+            self.calls.append((path, params))
+        time.sleep(self.delays.get(path, 0))
+        payload = self.routes[path]
+        if isinstance(payload, Exception):
+            raise payload
+        return list(payload)
+
+
+def _course(cid, name, term=TERM):
+    return {"id": cid, "name": name, "workflow_state": "available",
+            "enrollment_term_id": term["id"], "term": term}
+
+
+def _assignment(aid, cid, due):
+    return {"id": aid, "name": f"A{aid}", "course_id": cid,
+            "due_at": _iso(due), "html_url": f"https://x/{aid}"}
+
+
+# ##=========== Tests ===========## #
+def test_get_assignments_keeps_course_order_when_fetched_concurrently():
+    due = NOW + timedelta(days=1)
+    client = FakeClient(
+        routes={
+            "/api/v1/courses": [_course(1, "Slow"), _course(2, "Fast")],
+            "/api/v1/courses/1/assignments": [_assignment(10, 1, due)],
+            "/api/v1/courses/2/assignments": [_assignment(20, 2, due)],
+        },
+        # Course 1 finishes last but must still come first
+        delays={"/api/v1/courses/1/assignments": 0.05},
+    )
+
+    service = CourseService(client, max_workers=4)
+    assignments = service.get_assignments()
+
+    assert [a.id for a in assignments] == [10, 20]
+    assert [a.course_name for a in assignments] == ["Slow", "Fast"]
+
+
+def test_get_assignments_warns_and_skips_failing_course(capsys):
+    due = NOW + timedelta(days=1)
+    client = FakeClient(routes={
+        "/api/v1/courses": [_course(1, "Broken"), _course(2, "Fine")],
+        "/api/v1/courses/1/assignments": RuntimeError("boom"),
+        "/api/v1/courses/2/assignments": [_assignment(20, 2, due)],
+    })
+
+    assignments = CourseService(client, max_workers=2).get_assignments()
+
+    assert [a.id for a in assignments] == [20]
+    err = capsys.readouterr().err
+    assert "Failed to fetch assignments for course 1 (Broken): boom" in err
+
+
+def _planner_item(assignment, submitted=False):
+    """The planner's view of the same assignment a course listing returns."""
+    return {
+        "plannable_type": "assignment",
+        "plannable_id": assignment["id"],
+        "course_id": assignment["course_id"],
+        "html_url": assignment["html_url"],
+        "plannable": {"id": assignment["id"], "title": assignment["name"],
+                      "due_at": assignment["due_at"]},
+        "submissions": {"submitted": submitted},
+    }
+
+
+def test_planner_strategy_matches_per_course_strategy():
+    soon = NOW + timedelta(days=1)
+    late = NOW - timedelta(days=2)
+    a10, a11 = _assignment(10, 1, soon), _assignment(11, 1, late)
+    a20 = dict(_assignment(20, 2, soon), submission={"workflow_state": "submitted"})
+    courses = [_course(1, "Algebra"), _course(2, "Biology")]
+
+    per_course = FakeClient(routes={
+        "/api/v1/courses": courses,
+        "/api/v1/courses/1/assignments": [a10, a11],
+        "/api/v1/courses/2/assignments": [a20],
+    })
+    planner = FakeClient(routes={
+        "/api/v1/courses": courses,
+        # Planner streams in date order across courses, plus non-assignments
+        "/api/v1/planner/items": [
+            _planner_item(a11),
+            {"plannable_type": "planner_note", "plannable": {"title": "Note"}},
+            _planner_item(a20, submitted=True),
+            _planner_item(a10),
+        ],
+    })
+
+    def view(service):
+        # Within a course the planner orders by date, listings by position
+        return sorted((a.id, a.title, a.course_name, a.due_at, a.is_submitted())
+                      for a in service.get_unsubmitted_assignments(window_days=7))
+
+    expected = view(CourseService(per_course))
+    assert [row[0] for row in expected] == [10, 11]
+    assert view(CourseService(planner, strategy="planner")) == expected
+    assert [path for path, _ in planner.calls] == ["/api/v1/courses", "/api/v1/planner/items"]
+
+
+def test_iter_due_windows_streams_unsubmitted_rows_per_course():
+    submitted = dict(_assignment(12, 1, NOW + timedelta(days=1)),
+                     submission={"workflow_state": "submitted"})
+    client = FakeClient(routes={
+        "/api/v1/courses": [_course(1, "Algebra"), _course(2, "Physics")],
+        "/api/v1/courses/1/assignments": [_assignment(10, 1, NOW + timedelta(days=3)),
+                                          _assignment(11, 1, NOW - timedelta(days=30)),
+                                          submitted],
+        "/api/v1/courses/2/assignments": [_assignment(20, 2, NOW - timedelta(days=1))],
+    })
+
+    rows = CourseService(client).iter_due_windows(window_days=7, now=NOW)
+
+    assert [(category, a.id) for category, a in rows] == [("upcoming", 10), ("overdue", 20)]
+
+
+def test_unordered_iteration_yields_courses_as_they_complete():
+    due = NOW + timedelta(days=1)
+    client = FakeClient(
+        routes={
+            "/api/v1/courses": [_course(1, "Slow"), _course(2, "Fast")],
+            "/api/v1/courses/1/assignments": [_assignment(10, 1, due)],
+            "/api/v1/courses/2/assignments": [_assignment(20, 2, due)],
+        },
+        delays={"/api/v1/courses/1/assignments": 0.05},
+    )
+
+    service = CourseService(client, max_workers=2)
+
+    assert [a.id for a in service.iter_assignments(ordered=False)] == [20, 10]
+
+
+class _SlowCourseListing(FakeClient):
+    """Holds the second course back until some assignments fetch has started."""
+
+    def __init__(self, routes):
+        super().__init__(routes)
+        self.fetch_started = threading.Event()
+        self.overlapped = False
+
+    def get_paginated(self, path, params=None):
+        if path != "/api/v1/courses":
+            self.fetch_started.set()
+        return super().get_paginated(path, params)
+
+    def iter_paginated(self, path, params=None):
+        if path != "/api/v1/courses":
+            yield from super().iter_paginated(path, params)
+            return
+        first, *rest = self.routes[path]
+        yield first
+        self.overlapped = self.fetch_started.wait(timeout=2)
+        yield from rest
+
+
+def test_pipelined_strategy_fetches_while_courses_are_still_listing():
+    due = NOW + timedelta(days=1)
+    old_term = {"id": 3, "start_at": _iso(NOW - timedelta(days=400)),
+                "end_at": _iso(NOW - timedelta(days=300))}
+    routes = {
+        "/api/v1/courses": [_course(1, "Algebra"), _course(5, "Archived", old_term),
+                            _course(2, "Biology")],
+        "/api/v1/courses/1/assignments": [_assignment(10, 1, due)],
+        "/api/v1/courses/2/assignments": [_assignment(20, 2, due)],
+    }
+    client = _SlowCourseListing(routes)
+    service = CourseService(client, strategy="pipelined")
+
+    assert [a.id for a in service.get_assignments()] == [10, 20]
+    assert client.overlapped
+    assert "/api/v1/courses/5/assignments" not in [path for path, _ in client.calls]
+    assert service.term_hint == TERM["id"]
+
+
+def test_pipelined_strategy_recovers_from_a_stale_term_hint():
+    due = NOW + timedelta(days=1)
+    client = FakeClient(routes={
+        "/api/v1/courses": [_course(1, "Algebra")],
+        "/api/v1/courses/1/assignments": [_assignment(10, 1, due)],
+    })
+
+    service = CourseService(client, strategy="pipelined", term_hint=99)
+
+    assert [a.id for a in service.get_assignments()] == [10]
+    assert service.term_hint == TERM["id"]
+
+
+def test_due_windows_ask_canvas_for_buckets_and_dedupe_them():
+    # FakeClient ignores params, so both buckets return the same rows
+    client = FakeClient(routes={
+        "/api/v1/courses": [_course(1, "Algebra")],
+        "/api/v1/courses/1/assignments": [_assignment(10, 1, NOW - timedelta(days=1)),
+                                          _assignment(11, 1, NOW + timedelta(days=1))],
+    })
+
+    overdue, upcoming = CourseService(client).due_windows(window_days=7, now=NOW)
+
+    assert ([a.id for a in overdue], [a.id for a in upcoming]) == ([10], [11])
+    buckets = [params.get("bucket") for path, params in client.calls if path.endswith("/assignments")]
+    assert buckets == ["overdue", "future"]
+
+    # Without the window there is nothing to filter on the server
+    client.calls.clear()
+    CourseService(client).get_assignments()
+    assert [params.get("bucket") for _, params in client.calls[1:]] == [None]
+
+
+def test_bucketed_due_windows_leave_out_past_due_work_without_online_submission():
+    from benchmarks.fake_canvas import _bucketed
+
+    class _BucketClient(FakeClient):
+        def get_paginated(self, path, params=None):
+            rows = super().get_paginated(path, params)
+            query = {k: [v] for k, v in (params or {}).items() if k in ("bucket", "order_by")}
+            return _bucketed(rows, query)
+
+    on_paper = dict(_assignment(12, 1, NOW - timedelta(days=1)), submission_types=["on_paper"])
+    undated = dict(_assignment(13, 1, NOW), due_at=None)
+    client = _BucketClient(routes={
+        "/api/v1/courses": [_course(1, "Algebra")],
+        "/api/v1/courses/1/assignments": [
+            dict(_assignment(10, 1, NOW - timedelta(days=1)), submission_types=["online_upload"]),
+            on_paper, undated, _assignment(11, 1, NOW + timedelta(days=1))],
+    })
+
+    def windows(server_filter):
+        overdue, upcoming = CourseService(client, server_filter=server_filter).due_windows(7, now=NOW)
+        return [a.id for a in overdue], [a.id for a in upcoming]
+
+    # Canvas's overdue bucket skips on-paper work; the full listing keeps it
+    assert windows(server_filter=False) == ([10, 12], [11])
+    assert windows(server_filter=True) == ([10], [11])
+
+
+class _MemoryIndex(ICourseIndex):
+    def __init__(self, courses=None, terms=()):
+        self.courses = courses
+        self.terms = list(terms)
+        self.term_id = None
+
+    def load(self):
+        return None if self.courses is None else (self.courses, self.terms)
+
+    def save(self, courses, terms, current_term_id=None):
+        self.courses, self.terms = list(courses), list(terms)
+        self.term_id = current_term_id
+
+    def current_term_id(self):
+        return self.term_id
+
+    def invalidate(self):
+        self.courses = None
+
+
+def test_course_ids_skip_the_course_listing_when_indexed():
+    due = NOW + timedelta(days=1)
+    client = FakeClient(routes={
+        "/api/v1/courses/2/assignments": [_assignment(20, 2, due)],
+    })
+    index = _MemoryIndex([Course.from_api(_course(1, "Algebra")), Course.from_api(_course(2, "Biology"))])
+
+    service = CourseService(client, course_ids=[2], course_index=index)
+
+    assert [(a.id, a.course_name) for a in service.get_assignments()] == [(20, "Biology")]
+    assert [path for path, _ in client.calls] == ["/api/v1/courses/2/assignments"]
+
+
+def test_unknown_course_ids_refresh_the_index_then_warn(capsys):
+    due = NOW + timedelta(days=1)
+    client = FakeClient(routes={
+        "/api/v1/courses": [_course(1, "Algebra")],
+        "/api/v1/courses/1/assignments": [_assignment(10, 1, due)],
+    })
+    index = _MemoryIndex()
+
+    service = CourseService(client, course_ids=[1, 9], course_index=index)
+
+    assert [a.id for a in service.get_assignments()] == [10]
+    assert [c.id for c in index.courses] == [1]
+    assert [t.id for t in index.terms] == [TERM["id"]]
+    assert index.current_term_id() == TERM["id"]
+    assert "Course 9 is not one of your courses" in capsys.readouterr().err
+
+
+def test_fresh_index_resolves_courses_and_terms_without_a_listing():
+    old_term = {"id": 3, "name": "Spring", "start_at": _iso(NOW - timedelta(days=400)),
+                "end_at": _iso(NOW - timedelta(days=300))}
+    courses = [_course(1, "Algebra"), _course(5, "Archived", old_term)]
+    index = _MemoryIndex([Course.from_api(c) for c in courses],
+                         [Term.from_api(old_term), Term.from_api(TERM)])
+    client = FakeClient(routes={})
+
+    service = CourseService(client, course_index=index)
+
+    assert [c.id for c in service.list_courses(include_archived=False)] == [1]
+    assert [t.id for t in service.list_terms()] == [3, TERM["id"]]
+    assert service.term_hint == TERM["id"]
+    assert client.calls == []
+
+
+def test_planner_failure_warns_and_keeps_received_items(capsys):
+    class _FailingPlanner(FakeClient):
+        def iter_paginated(self, path, params=None):
+            if path != "/api/v1/planner/items":
+                yield from super().iter_paginated(path, params)
+                return
+            yield _planner_item(_assignment(10, 1, NOW + timedelta(days=1)))
+            raise PartialResultError("page 2 kept failing", resume_url="https://x/page2")
+
+    client = _FailingPlanner(routes={"/api/v1/courses": [_course(1, "Algebra")]})
+
+    assignments = CourseService(client, strategy="planner").get_assignments()
+
+    assert [a.id for a in assignments] == [10]
+    err = capsys.readouterr().err
+    assert "Failed to fetch planner items: page 2 kept failing" in err
+    assert "resume at https://x/page2" in err
+
+
+def test_planner_strategy_builds_the_given_model_class():
+    item = _planner_item(_assignment(10, 1, NOW + timedelta(days=1)))
+    client = FakeClient(routes={"/api/v1/courses": [_course(1, "Algebra")],
+                                "/api/v1/planner/items": [item]})
+
+    service = CourseService(client, strategy="planner",
+                            assignment_model=LazyAssignment)
+
+    assert [type(a) for a in service.get_assignments()] == [LazyAssignment]
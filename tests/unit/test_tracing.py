@@ -0,0 +1,32 @@
+import json
+
+from utils import tracing
+
+
+def test_disabled_tracing_is_a_shared_noop():
+    assert tracing.active() is None
+    span = tracing.span("anything", x=1)
+    assert not span
+    assert span is tracing.span("other")
+    items = [1, 2]
+    assert tracing.timed_stream("render", items) is items
+
+
+def test_spans_summary_and_chrome_trace(tmp_path):
+    tracer = tracing.enable()
+    try:
+        for _ in range(3):
+            with tracing.span("http.request", url="/api/v1/courses") as span:
+                span.set(status=200)
+        assert list(tracing.timed_stream("render.records", iter("ab"))) == ["a", "b"]
+    finally:
+        tracing.disable()
+
+    summary = {row[0]: row[1] for row in tracer.summary()}
+    assert summary == {"http.request": 3, "render.records": 1}
+
+    path = tmp_path / "trace.json"
+    tracer.write_chrome_trace(str(path))
+    events = json.loads(path.read_text())["traceEvents"]
+    assert {e["ph"] for e in events} == {"X"}
+    assert events[0]["args"] == {"url": "/api/v1/courses", "status": 200}
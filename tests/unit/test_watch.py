@@ -0,0 +1,74 @@
+from datetime import timedelta
+
+import pytest
+
+from core.services import CourseService
+from core.watch import RETRY_DELAY, AssignmentWatcher
+from tests.unit.test_services import NOW, FakeClient, _assignment, _course
+
+SUBMISSIONS = "/api/v1/courses/1/students/submissions"
+ASSIGNMENTS = "/api/v1/courses/1/assignments"
+
+
+def test_watcher_polls_resources_on_their_own_intervals_and_reports_changes():
+    clock = [0.0]
+    client = FakeClient(routes={
+        "/api/v1/courses": [_course(1, "Algebra")],
+        ASSIGNMENTS: [_assignment(10, 1, NOW + timedelta(days=1)),
+                      _assignment(11, 1, NOW + timedelta(days=2))],
+        SUBMISSIONS: [],
+    })
+    watcher = AssignmentWatcher(
+        CourseService(client), window_days=7, clock=lambda: clock[0],
+        intervals={"courses": 1000, "assignments": 100, "submissions": 10},
+    )
+
+    assert watcher.poll(NOW) is True
+    assert [a.id for a in watcher.upcoming] == [10, 11]
+
+    # Nothing is due yet: no requests and nothing to re-render
+    calls = len(client.calls)
+    assert watcher.poll(NOW) is False
+    assert len(client.calls) == calls
+
+    # Only submissions are due; one was turned in
+    clock[0] = 15
+    client.routes[SUBMISSIONS] = [{"assignment_id": 10, "workflow_state": "submitted"}]
+    assert watcher.poll(NOW) is True
+    assert [a.id for a in watcher.upcoming] == [11]
+    assert [path for path, _ in client.calls[calls:]] == [SUBMISSIONS]
+
+    # Same data again: polled, but unchanged
+    clock[0] = 30
+    assert watcher.poll(NOW) is False
+
+    # Sleeps are kept between a second and a minute
+    assert watcher.sleep_interval() == 10
+    clock[0] = 39.5
+    assert watcher.sleep_interval() == 1.0
+
+
+def test_failed_refresh_keeps_results_and_waits_before_retrying():
+    clock = [0.0]
+    client = FakeClient(routes={
+        "/api/v1/courses": [_course(1, "Algebra")],
+        ASSIGNMENTS: [_assignment(10, 1, NOW + timedelta(days=1))],
+        SUBMISSIONS: [],
+    })
+    watcher = AssignmentWatcher(
+        CourseService(client), window_days=7, clock=lambda: clock[0],
+        intervals={"courses": 100, "assignments": 1000, "submissions": 1000},
+    )
+    assert watcher.poll(NOW) is True
+
+    clock[0] = 100
+    client.routes["/api/v1/courses"] = RuntimeError("502 Bad Gateway")
+    with pytest.raises(RuntimeError):
+        watcher.poll(NOW)
+    assert [a.id for a in watcher.upcoming] == [10]
+    assert watcher.seconds_until_next() == RETRY_DELAY
+
+    clock[0] += RETRY_DELAY
+    client.routes["/api/v1/courses"] = [_course(1, "Algebra")]
+    assert watcher.poll(NOW) is False
+    assert [a.id for a in watcher.upcoming] == [10]
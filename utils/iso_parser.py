@@ -1,15 +1,33 @@
-
+import sys
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
+# Python 3.11+ parses a trailing 'Z' natively (and fastest)
+_FROMISO_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+
+def _parse_iso_uncached(dt: str) -> Optional[datetime]:
+    """Parse one ISO string, favouring Canvas's 'YYYY-MM-DDTHH:MM:SSZ'."""
+    # Fast path: the exact shape Canvas emits
+    if len(dt) == 20 and dt[19] == "Z" and dt[10] == "T":
+        candidate = dt if _FROMISO_ACCEPTS_Z else dt[:19] + "+00:00"
+    else:
+        # Canvas returns '...Z' -> make it RFC3339-friendly for fromisoformat
+        candidate = dt.replace("Z", "+00:00")
+    try:
+        return datetime.fromisoformat(candidate)
+    except ValueError:
+        return None
+
+
+# Canvas timestamps repeat heavily (shared due dates, term bounds), and
+# datetimes are immutable, so results are safe to share between callers.
+_parse_iso_cached = lru_cache(maxsize=8192)(_parse_iso_uncached)
+
 
 def _parse_iso(dt: Optional[str]) -> Optional[datetime]:
     """Parse Canvas ISO string into aware datetime, or None."""
     if not dt:
         return None
-    # Canvas returns '...Z' -> make it RFC3339-friendly for fromisoformat
-    dt = dt.replace("Z", "+00:00")
-    try:
-        return datetime.fromisoformat(dt)
-    except ValueError:
-        return None
+    return _parse_iso_cached(dt)
@@ -0,0 +1,161 @@
+"""
+Lightweight timing spans for --profile.
+
+Tracing is off unless enable() was called; span() then hands back one
+shared no-op object, so instrumented code pays a global lookup and a call.
+"""
+import json
+import math
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+
+class Span:
+    __slots__ = ("name", "start_ns", "dur_ns", "tid", "attrs", "_tracer")
+
+    def __init__(self, tracer: "Tracer", name: str, attrs: Dict[str, Any]):
+        self._tracer = tracer
+        self.name = name
+        self.attrs = attrs
+        self.tid = threading.get_ident()
+        self.start_ns = 0
+        self.dur_ns = 0
+
+    def __bool__(self) -> bool:
+        return True
+
+    def set(self, **attrs: Any) -> None:
+        """Attach attributes known only once the work is done (status, bytes...)."""
+        self.attrs.update(attrs)
+
+    def __enter__(self) -> "Span":
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.dur_ns = time.perf_counter_ns() - self.start_ns
+        if exc_type is not None:
+            self.attrs["error"] = exc_type.__name__
+        self._tracer.spans.append(self)  # list.append is atomic
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __bool__(self) -> bool:
+        # `if span:` guards attributes that are costly to compute
+        return False
+
+    def set(self, **attrs: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+_NOOP = _NoopSpan()
+
+
+class Tracer:
+    """Collects finished spans from every thread."""
+
+    def __init__(self):
+        self.spans: List[Span] = []
+        self.origin_ns = time.perf_counter_ns()
+
+    def record(self, name: str, start_ns: int, dur_ns: int, **attrs: Any) -> None:
+        """Add a span measured by the caller, e.g. time summed over a loop."""
+        span = Span(self, name, attrs)
+        span.start_ns, span.dur_ns = start_ns, dur_ns
+        self.spans.append(span)
+
+    def summary(self) -> List[Tuple[str, int, float, float, float, float]]:
+        """(name, count, total ms, mean ms, p95 ms, max ms) per span name, slowest total first."""
+        by_name: Dict[str, List[int]] = {}
+        for s in self.spans:
+            by_name.setdefault(s.name, []).append(s.dur_ns)
+        rows = []
+        for name, durs in by_name.items():
+            durs.sort()
+            p95 = durs[max(0, math.ceil(len(durs) * 0.95) - 1)]
+            rows.append((name, len(durs), sum(durs) / 1e6, sum(durs) / len(durs) / 1e6,
+                         p95 / 1e6, durs[-1] / 1e6))
+        return sorted(rows, key=lambda r: r[2], reverse=True)
+
+    def print_summary(self, out: TextIO) -> None:
+        out.write(f"{'span':<28}{'count':>7}{'total ms':>11}{'mean ms':>10}{'p95 ms':>10}{'max ms':>10}\n")
+        for name, count, total, mean, p95, peak in self.summary():
+            out.write(f"{name:<28}{count:>7}{total:>11.1f}{mean:>10.2f}{p95:>10.2f}{peak:>10.2f}\n")
+        out.write("Span totals overlap when work runs concurrently.\n")
+
+    def write_chrome_trace(self, path: str) -> None:
+        """Chrome trace event JSON, for chrome://tracing or ui.perfetto.dev."""
+        tids: Dict[int, int] = {}
+        events = []
+        for s in self.spans:
+            events.append({
+                "name": s.name,
+                "cat": s.name.split(".", 1)[0],
+                "ph": "X",
+                "ts": (s.start_ns - self.origin_ns) / 1000,
+                "dur": s.dur_ns / 1000,
+                "pid": os.getpid(),
+                "tid": tids.setdefault(s.tid, len(tids) + 1),
+                "args": s.attrs,
+            })
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, fh, default=str)
+
+
+_tracer: Optional[Tracer] = None
+
+
+def enable() -> Tracer:
+    global _tracer
+    _tracer = Tracer()
+    return _tracer
+
+
+def disable() -> None:
+    global _tracer
+    _tracer = None
+
+
+def active() -> Optional[Tracer]:
+    """The running tracer, or None; lets hot loops skip timing entirely."""
+    return _tracer
+
+
+def span(name: str, **attrs: Any) -> Any:
+    """`with span("http.request", url=...) as s:` — a no-op unless enabled."""
+    tracer = _tracer
+    if tracer is None:
+        return _NOOP
+    return Span(tracer, name, attrs)
+
+
+def timed_stream(name: str, items: Iterable[Any], **attrs: Any) -> Iterable[Any]:
+    """
+    Pass `items` through, recording as `name` only the time the consumer
+    spends on each item, not the time taken to produce it. For streaming
+    presenters whose input is still being fetched while they render.
+    """
+    tracer = _tracer
+    if tracer is None:
+        return items
+
+    def consume() -> Iterator[Any]:
+        start = time.perf_counter_ns()
+        own = count = 0
+        for item in items:
+            t0 = time.perf_counter_ns()
+            yield item
+            own += time.perf_counter_ns() - t0
+            count += 1
+        tracer.record(name, start, own, count=count, **attrs)
+    return consume()